@@ -1,25 +1,60 @@
-import threading
+import heapq
+import itertools
+import os
+import queue
+import random
 import time
+from contextlib import redirect_stdout
+from math import ceil
+from typing import Callable, Iterable, Mapping
 
-from cookeyTyperData import parameters, upgrades
+from cookeyTyperData import parameters
+from cookeyTyperExecutor import CommandExecutor, Mutation
 from cookeyTyperHandler import Handler
-from cookeyTyperModels import Facility, Upgrade, get_facilities
+from cookeyTyperJournal import Journal
+from cookeyTyperModels import Facility, FacilityTable, Modifier, Upgrade
+from cookeyTyperNumber import BigNumber, Number
+from cookeyTyperSave import DEFAULT_SAVE_PATH, Autosaver, load_file
+from cookeyTyperScheduler import SimulationReport, TickScheduler
+from cookeyTyperSnapshot import EngineSnapshot, SnapshotPublisher
 from cookeyTyperStats import CookeyTyperStats
 from cookeyTyperSystems import (
     UnlockManager,
     UpgradeManager,
-    create_upgrade_from_config,
+    shared_upgrades,
 )
 from cookeyTyperTypes import CookieSource, FacilityTypes, UpgradeTypes
+from result import is_err, is_ok
 
 
 class CookeyTyper:
-    def __init__(self) -> None:
-        self.lock: threading.Lock = threading.Lock()
-        self.cookies: float = 0.0
-        self.cps: float = 0.0
+    def __init__(
+        self,
+        seed: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        # Every source of nondeterminism goes through these two, so a seeded
+        # engine on a virtual clock replays bit for bit.
+        self.rng: random.Random = random.Random(seed)
+        self.clock: Callable[[], float] = clock
+        # Only the tick thread mutates the engine. Other threads hand it work
+        # through self.mutations; readers see cookies and cps as immutable
+        # BigNumbers that are swapped in whole, so they never need a lock.
+        self.mutations: queue.SimpleQueue[Mutation] = queue.SimpleQueue()
+        self.cookies: BigNumber = BigNumber()
+        self.cps: BigNumber = BigNumber()
         self.cpt: float = 1.0
-        self.facilities: dict[FacilityTypes, Facility] = get_facilities()
+        self.time: float = 0.0
+        self.ticks: int = 0
+        # Last journal entry applied; saves record it so replay can resume.
+        self.journal_seq: int = 0
+        self.journal: Journal | None = None
+        self.facility_table: FacilityTable = FacilityTable()
+        self.facilities: dict[FacilityTypes, Facility] = self.facility_table.facilities
+        self._cps_dirty: bool = True
+        self._buffs: list[tuple[float, int, FacilityTypes, Modifier]] = []
+        self._buff_sequence: itertools.count[int] = itertools.count()
+        self.facility_table.on_change = self._on_facility_change
         self.stats: CookeyTyperStats = CookeyTyperStats(self)
         self.global_multipliers: dict[str, float] = {
             "global": 1.0,
@@ -28,48 +63,272 @@ class CookeyTyper:
         }
         self.global_discount: float = 0.0
 
-        self.upgrades: dict[UpgradeTypes, Upgrade] = self._init_upgrades()
+        # Upgrade records are shared by every engine; this one only keeps
+        # which it owns, as bit Upgrade.index of purchased.
+        self.upgrades: Mapping[UpgradeTypes, Upgrade] = shared_upgrades()
+        self.purchased: int = 0
         self.available_upgrades: list[Upgrade] = []
+        # Bumped whenever available_upgrades changes.
+        self.upgrade_version: int = 0
 
         self.unlock_manager: UnlockManager = UnlockManager(self)
         self.upgrade_manager: UpgradeManager = UpgradeManager(self)
+        self.executor: CommandExecutor = CommandExecutor(
+            parameters().command_workers, self.submit_mutation
+        )
         self.handler: Handler = Handler(self)
+        # Built on first publish; a server holds many engines that are never
+        # read between ticks.
+        self._snapshots: SnapshotPublisher | None = None
+        self.snapshot: EngineSnapshot | None = None
+
+    def is_purchased(self, upgrade_type: UpgradeTypes) -> bool:
+        return bool(self.purchased >> (upgrade_type.value - 1) & 1)
+
+    def mark_purchased(self, upgrade_type: UpgradeTypes) -> None:
+        self.purchased |= 1 << (upgrade_type.value - 1)
+
+    def submit_mutation(self, mutation: Mutation) -> None:
+        """Queue mutation for the tick thread; safe to call from any thread.
+
+        The handler is woken too, so a mutation posted while the tick thread
+        sleeps in Handler.wait is applied at once, not on the next tick.
+        """
+        self.mutations.put(mutation)
+        self.handler.wake()
+
+    def settle(self) -> None:
+        """Finish in-flight command work and apply it. Tick thread only.
+
+        journal_seq moves on when a line is dispatched, but a typed line's
+        cookies arrive later as a mutation; a save must not record one
+        without the other.
+        """
+        self.executor.drain()
+        self.apply_mutations()
+
+    def apply_mutations(self) -> int:
+        applied = 0
+        while True:
+            try:
+                mutation = self.mutations.get_nowait()
+            except queue.Empty:
+                return applied
+            mutation()
+            applied += 1
+
+    def delta_cookie(self, amount: Number, source: CookieSource) -> bool:
+        """Apply amount if the balance stays non-negative. Tick thread only.
+
+        The check and the update are one step, so a debit that returns True
+        was always affordable.
+        """
+        new_cookies = self.cookies + amount
+        if new_cookies >= 0:
+            self.cookies = new_cookies
+            self.stats.on_cookie_amount_change(amount, source)
+            return True
+        else:
+            return False
+
+    def buy_facility_max(self, facility_type: FacilityTypes) -> tuple[int, BigNumber]:
+        facility = self.facilities[facility_type]
+        amount = facility.max_affordable(self.cookies)
+        if amount == 0:
+            return (0, BigNumber())
+        cost = facility.get_cookie_delta(amount)
+        if is_err(cost) or not self.delta_cookie(
+            cost.value, CookieSource.FACILITY_PURCHASE
+        ):
+            return (0, BigNumber())
+        facility.delta_amount(amount)
+        return (amount, abs(cost.value))
+
+    def add_timed_modifier(
+        self, facility_type: FacilityTypes, modifier: Modifier, duration: float
+    ) -> bool:
+        if not self.facilities[facility_type].add_modifier(modifier):
+            return False
+        heapq.heappush(
+            self._buffs,
+            (self.time + duration, next(self._buff_sequence), facility_type, modifier),
+        )
+        return True
+
+    def next_modifier_expiry(self) -> float | None:
+        """Engine time of the next timed modifier expiry, if any is pending."""
+        return self._buffs[0][0] if self._buffs else None
+
+    def _expire_modifiers(self) -> None:
+        while self._buffs and self._buffs[0][0] <= self.time:
+            _, _, facility_type, modifier = heapq.heappop(self._buffs)
+            self.facilities[facility_type].remove_modifier(modifier)
+
+    def _on_facility_change(self, facility: Facility) -> None:
+        self._cps_dirty = True
+        self.unlock_manager.on_facility_change(facility.type)
+
+    def invalidate_cps(self) -> None:
+        self._cps_dirty = True
+
+    def update_cps(self) -> BigNumber:
+        if not self._cps_dirty:
+            return self.cps
+        self._cps_dirty = False
 
-    def _init_upgrades(self) -> dict[UpgradeTypes, Upgrade]:
-        upgrade_dict: dict[UpgradeTypes, Upgrade] = {}
-        for upgrade_type in upgrades():
-            upgrade_dict[upgrade_type] = create_upgrade_from_config(upgrade_type, self)
-        return upgrade_dict
-
-    def delta_cookie(self, amount: float, source: CookieSource) -> bool:
-        with self.lock:
-            if self.cookies + amount >= 0:
-                self.cookies += amount
-                self.stats.on_cookie_amount_change(amount, source)
-                return True
-            else:
-                return False
-
-    def update_cps(self) -> float:
-        total: float = 0.0
-        for facility in self.facilities.values():
-            total += facility.cps
-        calibrated_cps: float = (
+        total = self.facility_table.total_cps()
+        calibrated_cps: BigNumber = (
             total * self.global_multipliers["global"] * self.global_multipliers["cps"]
         )
         self.cps = calibrated_cps
         return self.cps
 
-    def run(self) -> None:
-        self.handler.start()
+    def publish_snapshot(self) -> EngineSnapshot:
+        """Publish an immutable view of the engine for lock-free readers.
+
+        Called once per tick by the tick thread, and by listing commands so
+        they show the state after any earlier command in the same tick.
+        """
+        self.update_cps()
+        if self._snapshots is None:
+            self._snapshots = SnapshotPublisher(self)
+        self.snapshot = self._snapshots.publish()
+        return self.snapshot
+
+    def tick(self, dt: float) -> None:
+        self.ticks += 1
+        self.apply_mutations()
+        self.handler.update()
+        self.advance(dt)
+
+    def advance(
+        self, seconds: float, commands: Iterable[tuple[float, str]] = ()
+    ) -> int:
+        return self.advance_to(self.time + seconds, commands)
+
+    def advance_to(
+        self, target_time: float, commands: Iterable[tuple[float, str]] = ()
+    ) -> int:
+        """Jump to target_time, stopping only at events that can change the CPS.
+
+        Between two events CPS is constant, so each step credits its cookies in
+        one delta_cookie call. Events are visual-state thresholds, timed
+        modifier expiry and the (time, raw_input) commands, which are handled
+        once self.time reaches them. Returns the number of production steps
+        taken.
+        """
+        pending = sorted(commands, key=lambda command: command[0])
+        index = 0
+        steps = 0
         while True:
-            self.handler.update()
+            while index < len(pending) and pending[index][0] <= self.time:
+                self.handler.handle_input(pending[index][1])
+                index += 1
+
+            self._expire_modifiers()
             self.stats.update()
             self.unlock_manager.check_unlocks()
             self.update_cps()
+            if self.time >= target_time:
+                self.publish_snapshot()
+                return steps
+
+            end = target_time
+            if index < len(pending):
+                end = min(end, pending[index][0])
+            if self._buffs:
+                end = min(end, self._buffs[0][0])
+            self._produce_until(end)
+            steps += 1
 
-            self.delta_cookie(
-                self.cps / parameters()["tick_rate"], CookieSource.FACILITY
+    def _next_cookie_threshold(self) -> Number | None:
+        thresholds = [
+            threshold
+            for threshold in (
+                self.stats.next_cookie_threshold(),
+                self.unlock_manager.next_cookie_threshold(),
             )
-            sleep = 1 / parameters()["tick_rate"]
-            time.sleep(sleep)
+            if threshold is not None
+        ]
+        return min(thresholds, default=None)
+
+    def _produce_until(self, end: float) -> None:
+        amount = self.cps * (end - self.time)
+        threshold = self._next_cookie_threshold()
+        if threshold is not None and self.cps > 0:
+            total = self.stats.total_cookies_ascension
+            needed = threshold - total
+            if amount >= needed:
+                end = min(end, self.time + float(needed / self.cps))
+                amount = needed
+                while total + amount < threshold:
+                    amount = amount.next_up()
+
+        self.delta_cookie(amount, CookieSource.FACILITY)
+        self.time = end
+
+    def run(self, save_path: str | None = DEFAULT_SAVE_PATH) -> None:
+        autosaver: Autosaver | None = None
+        if save_path is not None:
+            loaded = load_file(self, save_path)
+            if is_ok(loaded):
+                print(f"Loaded save from {save_path}")
+            elif loaded.error != "No save file":
+                print(f"{loaded.error}; starting a new game")
+            self.journal = Journal(
+                f"{save_path}.journal", parameters().journal_compact_bytes
+            )
+            replayed = self.journal.replay(self)
+            if replayed:
+                print(f"Recovered {replayed} command(s) from the journal")
+            autosaver = Autosaver(save_path, parameters().autosave_interval)
+
+        scheduler = TickScheduler(
+            tick_rate=parameters().tick_rate,
+            max_catch_up_ticks=parameters().max_catch_up_ticks,
+            clock=self.clock,
+            sleep=self.handler.wait,
+        )
+        self.executor.start()
+        self.handler.start()
+        try:
+            while True:
+                for dt in scheduler.wait():
+                    self.tick(dt)
+                    if self.journal is not None:
+                        self.journal.commit()
+                if autosaver is not None:
+                    autosaver.maybe_save(self)
+                    if self.journal is not None and self.journal.needs_compaction():
+                        # Fold the journal into a save, then drop it.
+                        autosaver.save_now(self)
+                        self.journal.truncate()
+        finally:
+            self.executor.shutdown()
+            self.apply_mutations()
+            if autosaver is not None:
+                autosaver.close(self)
+            if self.journal is not None:
+                self.journal.close()
+
+    def simulate(
+        self, seconds: float, commands: Iterable[tuple[float, str]] = ()
+    ) -> SimulationReport:
+        dt = 1 / parameters().tick_rate
+        ticks = ceil(seconds / dt)
+        pending = sorted(commands, key=lambda command: command[0])
+        index = 0
+
+        start = time.perf_counter()
+        with open(os.devnull, "w") as sink, redirect_stdout(sink):
+            for i in range(ticks):
+                now = i * dt
+                while index < len(pending) and pending[index][0] <= now:
+                    self.handler.submit(pending[index][1])
+                    index += 1
+                self.tick(dt)
+        wall = time.perf_counter() - start
+
+        return SimulationReport(
+            simulated_seconds=ticks * dt, ticks=ticks, wall_seconds=wall
+        )
@@ -1,4 +1,6 @@
-from random import choice
+from random import Random, choice
+from types import MappingProxyType
+from typing import Mapping
 
 from cookeyTyperTypes import (EffectType, FacilityConfig, FacilityTypes,
                               Parameters, UpgradeConfig, UpgradeTypes,
@@ -6,2711 +8,2729 @@ from cookeyTyperTypes import (EffectType, FacilityConfig, FacilityTypes,
 
 
 def parameters() -> Parameters:
-    return {"facility_cost_multiplier_by_amount": 1.15, "tick_rate": 20}
+    return _PARAMETERS
 
 
-def upgrades() -> dict[UpgradeTypes, UpgradeConfig]:
+def upgrades() -> Mapping[UpgradeTypes, UpgradeConfig]:
+    return _UPGRADES
+
+
+def facilities() -> Mapping[FacilityTypes, FacilityConfig]:
+    return _FACILITIES
+
+
+def sentences() -> tuple[str, ...]:
+    return _SENTENCES
+
+
+def random_sentence(rng: Random | None = None) -> str:
+    if rng is None:
+        return choice(_SENTENCES)
+    return rng.choice(_SENTENCES)
+
+
+def _upgrade_table() -> dict[UpgradeTypes, UpgradeConfig]:
     return {
-        UpgradeTypes.REINFORCED_INDEX_FINGER: {
-            "name": "Reinforced index finger",
-            "description": "The keyboard is twice as efficient.",
-            "price": 100,
-            "target": FacilityTypes.KEYBOARD,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.KEYBOARD,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.CARPAL_TUNNEL_PREVENTION: {
-            "name": "Carpal tunnel prevention cream",
-            "description": "The keyboard is twice as efficient.",
-            "price": 500,
-            "target": FacilityTypes.KEYBOARD,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.KEYBOARD,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.AMBIDEXTROUS: {
-            "name": "Ambidextrous",
-            "description": "The keyboard is twice as efficient.",
-            "price": 10000,
-            "target": FacilityTypes.KEYBOARD,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.KEYBOARD,
-            "unlock_count": 10,
-        },
-        UpgradeTypes.FORWARD_FROM_GRANDMA: {
-            "name": "Forwards from grandma",
-            "description": "Grandmas are twice as efficient.",
-            "price": 1000,
-            "target": FacilityTypes.GRANDMA,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.GRANDMA,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.STEEL_PLATED_ROLLING_PINS: {
-            "name": "Steel-plated rolling pins",
-            "description": "Grandmas are twice as efficient.",
-            "price": 5000,
-            "target": FacilityTypes.GRANDMA,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.GRANDMA,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.CHEAP_HOES: {
-            "name": "Cheap hoes",
-            "description": "Farms are twice as efficient.",
-            "price": 11000,
-            "target": FacilityTypes.FARM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FARM,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.FERTILIZER: {
-            "name": "Fertilizer",
-            "description": "Farms are twice as efficient.",
-            "price": 55000,
-            "target": FacilityTypes.FARM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FARM,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.SUGAR_GAS: {
-            "name": "Sugar gas",
-            "description": "Mines are twice as efficient.",
-            "price": 120000,
-            "target": FacilityTypes.MINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.MINE,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.MEGADRILL: {
-            "name": "Megadrill",
-            "description": "Mines are twice as efficient.",
-            "price": 600000,
-            "target": FacilityTypes.MINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.MINE,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.THOUSAND_FINGERS: {
-            "name": "Thousand fingers",
-            "description": "Keyboards are twice as efficient.",
-            "price": 100000,
-            "target": FacilityTypes.KEYBOARD,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.KEYBOARD,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.MILLION_FINGERS: {
-            "name": "Million fingers",
-            "description": "Keyboards are twice as efficient.",
-            "price": 10000000,
-            "target": FacilityTypes.KEYBOARD,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.KEYBOARD,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.BILLION_FINGERS: {
-            "name": "Billion fingers",
-            "description": "Keyboards are twice as efficient.",
-            "price": 100000000,
-            "target": FacilityTypes.KEYBOARD,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.KEYBOARD,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.TRILLION_FINGERS: {
-            "name": "Trillion fingers",
-            "description": "Keyboards are twice as efficient.",
-            "price": 1000000000,
-            "target": FacilityTypes.KEYBOARD,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.KEYBOARD,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.QUADRILLION_FINGERS: {
-            "name": "Quadrillion fingers",
-            "description": "Keyboards are twice as efficient.",
-            "price": 10000000000,
-            "target": FacilityTypes.KEYBOARD,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.KEYBOARD,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.QUINTILLION_FINGERS: {
-            "name": "Quintillion fingers",
-            "description": "Keyboards are twice as efficient.",
-            "price": 10000000000000,
-            "target": FacilityTypes.KEYBOARD,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.KEYBOARD,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.SEXTILLION_FINGERS: {
-            "name": "Sextillion fingers",
-            "description": "Keyboards are twice as efficient.",
-            "price": 10000000000000000,
-            "target": FacilityTypes.KEYBOARD,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.KEYBOARD,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.SEPTILLION_FINGERS: {
-            "name": "Septillion fingers",
-            "description": "Keyboards are twice as efficient.",
-            "price": 10000000000000000000,
-            "target": FacilityTypes.KEYBOARD,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.KEYBOARD,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.OCTILLION_FINGERS: {
-            "name": "Octillion fingers",
-            "description": "Keyboards are twice as efficient.",
-            "price": 10000000000000000000000,
-            "target": FacilityTypes.KEYBOARD,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.KEYBOARD,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.NONILLION_FINGERS: {
-            "name": "Nonillion fingers",
-            "description": "Keyboards are twice as efficient.",
-            "price": 10000000000000000000000000,
-            "target": FacilityTypes.KEYBOARD,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.KEYBOARD,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.DECILLION_FINGERS: {
-            "name": "Decillion fingers",
-            "description": "Keyboards are twice as efficient.",
-            "price": 10000000000000000000000000000,
-            "target": FacilityTypes.KEYBOARD,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.KEYBOARD,
-            "unlock_count": 500,
-        },
-        UpgradeTypes.UNDECILLION_FINGERS: {
-            "name": "Undecillion fingers",
-            "description": "Keyboards are twice as efficient.",
-            "price": 10000000000000000000000000000000,
-            "target": FacilityTypes.KEYBOARD,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.KEYBOARD,
-            "unlock_count": 550,
-        },
-        UpgradeTypes.LUBRICATED_DENTURES: {
-            "name": "Lubricated dentures",
-            "description": "Grandmas are twice as efficient.",
-            "price": 50000,
-            "target": FacilityTypes.GRANDMA,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.GRANDMA,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.PRUNE_JUICE: {
-            "name": "Prune juice",
-            "description": "Grandmas are twice as efficient.",
-            "price": 5000000,
-            "target": FacilityTypes.GRANDMA,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.GRANDMA,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.DOUBLE_THICK_GLASSES: {
-            "name": "Double-thick glasses",
-            "description": "Grandmas are twice as efficient.",
-            "price": 500000000,
-            "target": FacilityTypes.GRANDMA,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.GRANDMA,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.AGING_AGENTS: {
-            "name": "Aging agents",
-            "description": "Grandmas are twice as efficient.",
-            "price": 50000000000,
-            "target": FacilityTypes.GRANDMA,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.GRANDMA,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.XTREME_WALKERS: {
-            "name": "Xtreme walkers",
-            "description": "Grandmas are twice as efficient.",
-            "price": 50000000000000,
-            "target": FacilityTypes.GRANDMA,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.GRANDMA,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.THE_UNBRIDLING: {
-            "name": "The Unbridling",
-            "description": "Grandmas are twice as efficient.",
-            "price": 50000000000000000,
-            "target": FacilityTypes.GRANDMA,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.GRANDMA,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.REVERSE_DEMENTIA: {
-            "name": "Reverse dementia",
-            "description": "Grandmas are twice as efficient.",
-            "price": 50000000000000000000,
-            "target": FacilityTypes.GRANDMA,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.GRANDMA,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.TIMEPROOF_HAIR_DYES: {
-            "name": "Timeproof hair dyes",
-            "description": "Grandmas are twice as efficient.",
-            "price": 50000000000000000000000,
-            "target": FacilityTypes.GRANDMA,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.GRANDMA,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.GOOD_MANNERS: {
-            "name": "Good manners",
-            "description": "Grandmas are twice as efficient.",
-            "price": 500000000000000000000000,
-            "target": FacilityTypes.GRANDMA,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.GRANDMA,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.GENERATION_DEGENERATION: {
-            "name": "Generation degeneration",
-            "description": "Grandmas are twice as efficient.",
-            "price": 5000000000000000000000000000,
-            "target": FacilityTypes.GRANDMA,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.GRANDMA,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.VISITS: {
-            "name": "Visits",
-            "description": "Grandmas are twice as efficient.",
-            "price": 50000000000000000000000000000000,
-            "target": FacilityTypes.GRANDMA,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.GRANDMA,
-            "unlock_count": 500,
-        },
-        UpgradeTypes.KITCHEN_CABINETS: {
-            "name": "Kitchen cabinets",
-            "description": "Grandmas are twice as efficient.",
-            "price": 500000000000000000000000000000000,
-            "target": FacilityTypes.GRANDMA,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.GRANDMA,
-            "unlock_count": 550,
-        },
-        UpgradeTypes.FOAM_TIPPED_CANES: {
-            "name": "Foam-tipped canes",
-            "description": "Grandmas are twice as efficient.",
-            "price": 5000000000000000000000000000000000000,
-            "target": FacilityTypes.GRANDMA,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.GRANDMA,
-            "unlock_count": 600,
-        },
-        UpgradeTypes.COOKIE_TREES: {
-            "name": "Cookie trees",
-            "description": "Farms are twice as efficient.",
-            "price": 550000,
-            "target": FacilityTypes.FARM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FARM,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.GENETICALLY_MODIFIED_COOKIES: {
-            "name": "Genetically-modified cookies",
-            "description": "Farms are twice as efficient.",
-            "price": 55000000,
-            "target": FacilityTypes.FARM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FARM,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.GINGERBREAD_SCARECROWS: {
-            "name": "Gingerbread scarecrows",
-            "description": "Farms are twice as efficient.",
-            "price": 5500000000,
-            "target": FacilityTypes.FARM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FARM,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.PULSAR_SPRINKLERS: {
-            "name": "Pulsar sprinklers",
-            "description": "Farms are twice as efficient.",
-            "price": 550000000000,
-            "target": FacilityTypes.FARM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FARM,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.FUDGE_FUNGUS: {
-            "name": "Fudge fungus",
-            "description": "Farms are twice as efficient.",
-            "price": 550000000000000,
-            "target": FacilityTypes.FARM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FARM,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.WHEAT_TRIFFIDS: {
-            "name": "Wheat triffids",
-            "description": "Farms are twice as efficient.",
-            "price": 550000000000000000,
-            "target": FacilityTypes.FARM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FARM,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.HUMANE_PESTICIDES: {
-            "name": "Humane pesticides",
-            "description": "Farms are twice as efficient.",
-            "price": 550000000000000000000,
-            "target": FacilityTypes.FARM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FARM,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.BARNSTARS: {
-            "name": "Barnstars",
-            "description": "Farms are twice as efficient.",
-            "price": 550000000000000000000000,
-            "target": FacilityTypes.FARM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FARM,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.LINDWORMS: {
-            "name": "Lindworms",
-            "description": "Farms are twice as efficient.",
-            "price": 5500000000000000000000000000,
-            "target": FacilityTypes.FARM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FARM,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.GLOBAL_SEED_VAULT: {
-            "name": "Global seed vault",
-            "description": "Farms are twice as efficient.",
-            "price": 55000000000000000000000000000000,
-            "target": FacilityTypes.FARM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FARM,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.REVERSE_SEASONS: {
-            "name": "Reverse seasons",
-            "description": "Farms are twice as efficient.",
-            "price": 550000000000000000000000000000000,
-            "target": FacilityTypes.FARM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FARM,
-            "unlock_count": 500,
-        },
-        UpgradeTypes.FARM_AUTOMATION: {
-            "name": "Farm automation",
-            "description": "Farms are twice as efficient.",
-            "price": 5500000000000000000000000000000000000,
-            "target": FacilityTypes.FARM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FARM,
-            "unlock_count": 550,
-        },
-        UpgradeTypes.ULTRADRILL: {
-            "name": "Ultradrill",
-            "description": "Mines are twice as efficient.",
-            "price": 6000000,
-            "target": FacilityTypes.MINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.MINE,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.ULTIMADRILL: {
-            "name": "Ultimadrill",
-            "description": "Mines are twice as efficient.",
-            "price": 600000000,
-            "target": FacilityTypes.MINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.MINE,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.H_BOMB_MINING: {
-            "name": "H-bomb mining",
-            "description": "Mines are twice as efficient.",
-            "price": 60000000000,
-            "target": FacilityTypes.MINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.MINE,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.COREFORGE: {
-            "name": "Coreforge",
-            "description": "Mines are twice as efficient.",
-            "price": 6000000000000,
-            "target": FacilityTypes.MINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.MINE,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.PLANETSPLITTERS: {
-            "name": "Planetsplitters",
-            "description": "Mines are twice as efficient.",
-            "price": 6000000000000000,
-            "target": FacilityTypes.MINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.MINE,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.CANOLA_OIL_WELLS: {
-            "name": "Canola oil wells",
-            "description": "Mines are twice as efficient.",
-            "price": 6000000000000000000,
-            "target": FacilityTypes.MINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.MINE,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.MOLE_PEOPLE: {
-            "name": "Mole people",
-            "description": "Mines are twice as efficient.",
-            "price": 6000000000000000000000,
-            "target": FacilityTypes.MINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.MINE,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.MINE_CANARIES: {
-            "name": "Mine canaries",
-            "description": "Mines are twice as efficient.",
-            "price": 60000000000000000000000000,
-            "target": FacilityTypes.MINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.MINE,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.BORE_AGAIN: {
-            "name": "Bore again",
-            "description": "Mines are twice as efficient.",
-            "price": 600000000000000000000000000000,
-            "target": FacilityTypes.MINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.MINE,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.MOUNTAIN_MACAROONS: {
-            "name": "Mountain macaroons",
-            "description": "Mines are twice as efficient.",
-            "price": 6000000000000000000000000000000000,
-            "target": FacilityTypes.MINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.MINE,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.MINE_MILK: {
-            "name": "Mine milk",
-            "description": "Mines are twice as efficient.",
-            "price": 60000000000000000000000000000000000,
-            "target": FacilityTypes.MINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.MINE,
-            "unlock_count": 500,
-        },
-        UpgradeTypes.MINE_AUTOMATION: {
-            "name": "Mine automation",
-            "description": "Mines are twice as efficient.",
-            "price": 600000000000000000000000000000000000000,
-            "target": FacilityTypes.MINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.MINE,
-            "unlock_count": 550,
-        },
-        UpgradeTypes.STURDIER_CONVEYOR_BELTS: {
-            "name": "Sturdier conveyor belts",
-            "description": "Factories are twice as efficient.",
-            "price": 1300000,
-            "target": FacilityTypes.FACTORY,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FACTORY,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.CHILD_LABOR: {
-            "name": "Child labor",
-            "description": "Factories are twice as efficient.",
-            "price": 6500000,
-            "target": FacilityTypes.FACTORY,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FACTORY,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.SWEATSHOP: {
-            "name": "Sweatshop",
-            "description": "Factories are twice as efficient.",
-            "price": 65000000,
-            "target": FacilityTypes.FACTORY,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FACTORY,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.RADIUM_REACTORS: {
-            "name": "Radium reactors",
-            "description": "Factories are twice as efficient.",
-            "price": 6500000000,
-            "target": FacilityTypes.FACTORY,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FACTORY,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.RECOMBOBULATORS: {
-            "name": "Recombobulators",
-            "description": "Factories are twice as efficient.",
-            "price": 650000000000,
-            "target": FacilityTypes.FACTORY,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FACTORY,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.DEEP_BOP: {
-            "name": "Deep-bop",
-            "description": "Factories are twice as efficient.",
-            "price": 65000000000000,
-            "target": FacilityTypes.FACTORY,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FACTORY,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.CYBORG_WORKFORCE: {
-            "name": "Cyborg workforce",
-            "description": "Factories are twice as efficient.",
-            "price": 65000000000000000,
-            "target": FacilityTypes.FACTORY,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FACTORY,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.DRONE_HIVE: {
-            "name": "Drone hive",
-            "description": "Factories are twice as efficient.",
-            "price": 65000000000000000000,
-            "target": FacilityTypes.FACTORY,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FACTORY,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.FACTORY_CANARIES: {
-            "name": "Factory canaries",
-            "description": "Factories are twice as efficient.",
-            "price": 65000000000000000000000,
-            "target": FacilityTypes.FACTORY,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FACTORY,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.FACTORY_AUTOMATION: {
-            "name": "Factory automation",
-            "description": "Factories are twice as efficient.",
-            "price": 650000000000000000000000000,
-            "target": FacilityTypes.FACTORY,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FACTORY,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.FULLFILLING_COOKIES: {
-            "name": "Fullfilling cookies",
-            "description": "Factories are twice as efficient.",
-            "price": 6500000000000000000000000000000,
-            "target": FacilityTypes.FACTORY,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FACTORY,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.COOKIE_CRUMBS_RECYCLING: {
-            "name": "Cookie crumbs recycling",
-            "description": "Factories are twice as efficient.",
-            "price": 65000000000000000000000000000000000,
-            "target": FacilityTypes.FACTORY,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FACTORY,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.FACTORY_AUTOMATION_2: {
-            "name": "Factory automation II",
-            "description": "Factories are twice as efficient.",
-            "price": 650000000000000000000000000000000000000,
-            "target": FacilityTypes.FACTORY,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FACTORY,
-            "unlock_count": 500,
-        },
-        UpgradeTypes.TALLER_TELLERS: {
-            "name": "Taller tellers",
-            "description": "Banks are twice as efficient.",
-            "price": 14000000,
-            "target": FacilityTypes.BANK,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.BANK,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.SCISSOR_RESISTANT_CREDIT_CARDS: {
-            "name": "Scissor-resistant credit cards",
-            "description": "Banks are twice as efficient.",
-            "price": 70000000,
-            "target": FacilityTypes.BANK,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.BANK,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.ACID_PROOF_VAULTS: {
-            "name": "Acid-proof vaults",
-            "description": "Banks are twice as efficient.",
-            "price": 700000000,
-            "target": FacilityTypes.BANK,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.BANK,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.CHOCOLATE_COINS: {
-            "name": "Chocolate coins",
-            "description": "Banks are twice as efficient.",
-            "price": 70000000000,
-            "target": FacilityTypes.BANK,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.BANK,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.EXPONENTIAL_INTEREST_RATES: {
-            "name": "Exponential interest rates",
-            "description": "Banks are twice as efficient.",
-            "price": 7000000000000,
-            "target": FacilityTypes.BANK,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.BANK,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.FINANCIAL_ZEN: {
-            "name": "Financial zen",
-            "description": "Banks are twice as efficient.",
-            "price": 700000000000000,
-            "target": FacilityTypes.BANK,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.BANK,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.WAY_OF_THE_WALLET: {
-            "name": "Way of the wallet",
-            "description": "Banks are twice as efficient.",
-            "price": 700000000000000000,
-            "target": FacilityTypes.BANK,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.BANK,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.THE_STIMULUS_PACKAGE: {
-            "name": "The stimulus package",
-            "description": "Banks are twice as efficient.",
-            "price": 700000000000000000000,
-            "target": FacilityTypes.BANK,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.BANK,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.BUDGET_CAPS: {
-            "name": "Budget caps",
-            "description": "Banks are twice as efficient.",
-            "price": 700000000000000000000000,
-            "target": FacilityTypes.BANK,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.BANK,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.COOKIE_BANKS: {
-            "name": "Cookie banks",
-            "description": "Banks are twice as efficient.",
-            "price": 7000000000000000000000000000,
-            "target": FacilityTypes.BANK,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.BANK,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.MEGABANKS: {
-            "name": "Megabanks",
-            "description": "Banks are twice as efficient.",
-            "price": 70000000000000000000000000000000,
-            "target": FacilityTypes.BANK,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.BANK,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.BANK_AUTOMATION: {
-            "name": "Bank automation",
-            "description": "Banks are twice as efficient.",
-            "price": 700000000000000000000000000000000000,
-            "target": FacilityTypes.BANK,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.BANK,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.INSURANCE_FRAUD: {
-            "name": "Insurance fraud",
-            "description": "Banks are twice as efficient.",
-            "price": 7000000000000000000000000000000000000000,
-            "target": FacilityTypes.BANK,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.BANK,
-            "unlock_count": 500,
-        },
-        UpgradeTypes.BANK_OF_BANKS: {
-            "name": "Bank of banks",
-            "description": "Banks are twice as efficient.",
-            "price": 70000000000000000000000000000000000000000000,
-            "target": FacilityTypes.BANK,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.BANK,
-            "unlock_count": 550,
-        },
-        UpgradeTypes.GOLDEN_IDOLS: {
-            "name": "Golden idols",
-            "description": "Temples are twice as efficient.",
-            "price": 200000000,
-            "target": FacilityTypes.TEMPLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TEMPLE,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.SACRIFICES: {
-            "name": "Sacrifices",
-            "description": "Temples are twice as efficient.",
-            "price": 1000000000,
-            "target": FacilityTypes.TEMPLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TEMPLE,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.DELICIOUS_BLESSING: {
-            "name": "Delicious blessing",
-            "description": "Temples are twice as efficient.",
-            "price": 10000000000,
-            "target": FacilityTypes.TEMPLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TEMPLE,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.SUN_FESTIVAL: {
-            "name": "Sun festival",
-            "description": "Temples are twice as efficient.",
-            "price": 1000000000000,
-            "target": FacilityTypes.TEMPLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TEMPLE,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.ENLARGED_PANTHEON: {
-            "name": "Enlarged pantheon",
-            "description": "Temples are twice as efficient.",
-            "price": 100000000000000,
-            "target": FacilityTypes.TEMPLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TEMPLE,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.GREAT_BAKER_IN_THE_SKY: {
-            "name": "Great Baker in the sky",
-            "description": "Temples are twice as efficient.",
-            "price": 10000000000000000,
-            "target": FacilityTypes.TEMPLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TEMPLE,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.CREATION_MYTH: {
-            "name": "Creation myth",
-            "description": "Temples are twice as efficient.",
-            "price": 10000000000000000000,
-            "target": FacilityTypes.TEMPLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TEMPLE,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.THEOCRACY: {
-            "name": "Theocracy",
-            "description": "Temples are twice as efficient.",
-            "price": 10000000000000000000000,
-            "target": FacilityTypes.TEMPLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TEMPLE,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.SICK_BEATS: {
-            "name": "Sick beats",
-            "description": "Temples are twice as efficient.",
-            "price": 10000000000000000000000000,
-            "target": FacilityTypes.TEMPLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TEMPLE,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.TEMPLE_CANARIES: {
-            "name": "Temple canaries",
-            "description": "Temples are twice as efficient.",
-            "price": 100000000000000000000000000000,
-            "target": FacilityTypes.TEMPLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TEMPLE,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.TEMPLE_AUTOMATION: {
-            "name": "Temple automation",
-            "description": "Temples are twice as efficient.",
-            "price": 1000000000000000000000000000000000,
-            "target": FacilityTypes.TEMPLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TEMPLE,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.DEVOTED_FOLLOWERS: {
-            "name": "Devoted followers",
-            "description": "Temples are twice as efficient.",
-            "price": 10000000000000000000000000000000000000,
-            "target": FacilityTypes.TEMPLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TEMPLE,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.THE_FINAL_SACRIFICE: {
-            "name": "The final sacrifice",
-            "description": "Temples are twice as efficient.",
-            "price": 100000000000000000000000000000000000000000,
-            "target": FacilityTypes.TEMPLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TEMPLE,
-            "unlock_count": 500,
-        },
-        UpgradeTypes.POINTIER_HATS: {
-            "name": "Pointier hats",
-            "description": "Wizard towers are twice as efficient.",
-            "price": 3300000000,
-            "target": FacilityTypes.WIZARD_TOWER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.WIZARD_TOWER,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.BEARDIER_BEARDS: {
-            "name": "Beardier beards",
-            "description": "Wizard towers are twice as efficient.",
-            "price": 16500000000,
-            "target": FacilityTypes.WIZARD_TOWER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.WIZARD_TOWER,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.ANCIENT_GRIMOIRES: {
-            "name": "Ancient grimoires",
-            "description": "Wizard towers are twice as efficient.",
-            "price": 165000000000,
-            "target": FacilityTypes.WIZARD_TOWER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.WIZARD_TOWER,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.KITCHEN_CURSORS: {
-            "name": "Kitchen cursors",
-            "description": "Wizard towers are twice as efficient.",
-            "price": 16500000000000,
-            "target": FacilityTypes.WIZARD_TOWER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.WIZARD_TOWER,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.SCHOOL_OF_SORCERY: {
-            "name": "School of sorcery",
-            "description": "Wizard towers are twice as efficient.",
-            "price": 1650000000000000,
-            "target": FacilityTypes.WIZARD_TOWER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.WIZARD_TOWER,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.DARK_FORMULAS: {
-            "name": "Dark formulas",
-            "description": "Wizard towers are twice as efficient.",
-            "price": 165000000000000000,
-            "target": FacilityTypes.WIZARD_TOWER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.WIZARD_TOWER,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.COOKIEMANCY: {
-            "name": "Cookiemancy",
-            "description": "Wizard towers are twice as efficient.",
-            "price": 165000000000000000000,
-            "target": FacilityTypes.WIZARD_TOWER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.WIZARD_TOWER,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.RABBIT_TRICK: {
-            "name": "Rabbit trick",
-            "description": "Wizard towers are twice as efficient.",
-            "price": 165000000000000000000000,
-            "target": FacilityTypes.WIZARD_TOWER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.WIZARD_TOWER,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.DELUXE_TAILORED_WANDS: {
-            "name": "Deluxe tailored wands",
-            "description": "Wizard towers are twice as efficient.",
-            "price": 165000000000000000000000000,
-            "target": FacilityTypes.WIZARD_TOWER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.WIZARD_TOWER,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.WHOOPEE_CUSHION: {
-            "name": "Whoopee cushion",
-            "description": "Wizard towers are twice as efficient.",
-            "price": 1650000000000000000000000000000,
-            "target": FacilityTypes.WIZARD_TOWER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.WIZARD_TOWER,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.WIZARD_AUTOMATION: {
-            "name": "Wizard automation",
-            "description": "Wizard towers are twice as efficient.",
-            "price": 16500000000000000000000000000000000,
-            "target": FacilityTypes.WIZARD_TOWER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.WIZARD_TOWER,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.MAGIC_SHROOMS: {
-            "name": "Magic shrooms",
-            "description": "Wizard towers are twice as efficient.",
-            "price": 165000000000000000000000000000000000000,
-            "target": FacilityTypes.WIZARD_TOWER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.WIZARD_TOWER,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.THE_ULTIMATE_CLICKSPORT: {
-            "name": "The ultimate clicksport",
-            "description": "Wizard towers are twice as efficient.",
-            "price": 1650000000000000000000000000000000000000000,
-            "target": FacilityTypes.WIZARD_TOWER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.WIZARD_TOWER,
-            "unlock_count": 500,
-        },
-        UpgradeTypes.VANILLA_NEBULAE: {
-            "name": "Vanilla nebulae",
-            "description": "Shipments are twice as efficient.",
-            "price": 51000000000,
-            "target": FacilityTypes.SHIPMENT,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.SHIPMENT,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.WORMHOLES: {
-            "name": "Wormholes",
-            "description": "Shipments are twice as efficient.",
-            "price": 255000000000,
-            "target": FacilityTypes.SHIPMENT,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.SHIPMENT,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.FREQUENT_FLYER: {
-            "name": "Frequent flyer",
-            "description": "Shipments are twice as efficient.",
-            "price": 2550000000000,
-            "target": FacilityTypes.SHIPMENT,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.SHIPMENT,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.WARP_DRIVE: {
-            "name": "Warp drive",
-            "description": "Shipments are twice as efficient.",
-            "price": 255000000000000,
-            "target": FacilityTypes.SHIPMENT,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.SHIPMENT,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.CHOCOLATE_MONOLITHS: {
-            "name": "Chocolate monoliths",
-            "description": "Shipments are twice as efficient.",
-            "price": 25500000000000000,
-            "target": FacilityTypes.SHIPMENT,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.SHIPMENT,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.GENERATION_SHIP: {
-            "name": "Generation ship",
-            "description": "Shipments are twice as efficient.",
-            "price": 2550000000000000000,
-            "target": FacilityTypes.SHIPMENT,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.SHIPMENT,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.DYSON_SPHERE: {
-            "name": "Dyson sphere",
-            "description": "Shipments are twice as efficient.",
-            "price": 2550000000000000000000,
-            "target": FacilityTypes.SHIPMENT,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.SHIPMENT,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.THE_FINAL_FRONTIER: {
-            "name": "The final frontier",
-            "description": "Shipments are twice as efficient.",
-            "price": 2550000000000000000000000,
-            "target": FacilityTypes.SHIPMENT,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.SHIPMENT,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.AUTOPILOT: {
-            "name": "Autopilot",
-            "description": "Shipments are twice as efficient.",
-            "price": 2550000000000000000000000000,
-            "target": FacilityTypes.SHIPMENT,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.SHIPMENT,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.SHIPMENT_AUTOMATION: {
-            "name": "Shipment automation",
-            "description": "Shipments are twice as efficient.",
-            "price": 25500000000000000000000000000000,
-            "target": FacilityTypes.SHIPMENT,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.SHIPMENT,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.SHIPMENT_REUSABILITY: {
-            "name": "Shipment reusability",
-            "description": "Shipments are twice as efficient.",
-            "price": 255000000000000000000000000000000000,
-            "target": FacilityTypes.SHIPMENT,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.SHIPMENT,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.THE_COSMIC_BAKER: {
-            "name": "The Cosmic Baker",
-            "description": "Shipments are twice as efficient.",
-            "price": 2550000000000000000000000000000000000000,
-            "target": FacilityTypes.SHIPMENT,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.SHIPMENT,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.ANTIMONY: {
-            "name": "Antimony",
-            "description": "Alchemy labs are twice as efficient.",
-            "price": 750000000000,
-            "target": FacilityTypes.ALCHEMY_LAB,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ALCHEMY_LAB,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.ESSENCE_OF_DOUGH: {
-            "name": "Essence of dough",
-            "description": "Alchemy labs are twice as efficient.",
-            "price": 3750000000000,
-            "target": FacilityTypes.ALCHEMY_LAB,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ALCHEMY_LAB,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.TRUE_CHOCOLATE: {
-            "name": "True chocolate",
-            "description": "Alchemy labs are twice as efficient.",
-            "price": 37500000000000,
-            "target": FacilityTypes.ALCHEMY_LAB,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ALCHEMY_LAB,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.AMBROSIA: {
-            "name": "Ambrosia",
-            "description": "Alchemy labs are twice as efficient.",
-            "price": 3750000000000000,
-            "target": FacilityTypes.ALCHEMY_LAB,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ALCHEMY_LAB,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.AQUA_CRUSTULAE: {
-            "name": "Aqua crustulae",
-            "description": "Alchemy labs are twice as efficient.",
-            "price": 375000000000000000,
-            "target": FacilityTypes.ALCHEMY_LAB,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ALCHEMY_LAB,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.ORIGIN_CRUCIBLE: {
-            "name": "Origin crucible",
-            "description": "Alchemy labs are twice as efficient.",
-            "price": 37500000000000000000,
-            "target": FacilityTypes.ALCHEMY_LAB,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ALCHEMY_LAB,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.THEORY_OF_ATOMIC_FLUIDITY: {
-            "name": "Theory of atomic fluidity",
-            "description": "Alchemy labs are twice as efficient.",
-            "price": 37500000000000000000000,
-            "target": FacilityTypes.ALCHEMY_LAB,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ALCHEMY_LAB,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.BEIGE_GOO: {
-            "name": "Beige goo",
-            "description": "Alchemy labs are twice as efficient.",
-            "price": 37500000000000000000000000,
-            "target": FacilityTypes.ALCHEMY_LAB,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ALCHEMY_LAB,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.THE_PHILOSOPHERS_COOKIE: {
-            "name": "The philosopher's cookie",
-            "description": "Alchemy labs are twice as efficient.",
-            "price": 37500000000000000000000000000,
-            "target": FacilityTypes.ALCHEMY_LAB,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ALCHEMY_LAB,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.ALCHEMY_AUTOMATION: {
-            "name": "Alchemy automation",
-            "description": "Alchemy labs are twice as efficient.",
-            "price": 375000000000000000000000000000000,
-            "target": FacilityTypes.ALCHEMY_LAB,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ALCHEMY_LAB,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.THE_MIDAS_TOUCH: {
-            "name": "The Midas touch",
-            "description": "Alchemy labs are twice as efficient.",
-            "price": 3750000000000000000000000000000000000,
-            "target": FacilityTypes.ALCHEMY_LAB,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ALCHEMY_LAB,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.BEYOND_GOLD: {
-            "name": "Beyond gold",
-            "description": "Alchemy labs are twice as efficient.",
-            "price": 37500000000000000000000000000000000000000,
-            "target": FacilityTypes.ALCHEMY_LAB,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ALCHEMY_LAB,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.ANCIENT_TABLET: {
-            "name": "Ancient tablet",
-            "description": "Portals are twice as efficient.",
-            "price": 10000000000000,
-            "target": FacilityTypes.PORTAL,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PORTAL,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.INSANE_OATLING_WORKERS: {
-            "name": "Insane oatling workers",
-            "description": "Portals are twice as efficient.",
-            "price": 50000000000000,
-            "target": FacilityTypes.PORTAL,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PORTAL,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.SOUL_BOND: {
-            "name": "Soul bond",
-            "description": "Portals are twice as efficient.",
-            "price": 500000000000000,
-            "target": FacilityTypes.PORTAL,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PORTAL,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.SANITY_DANCE: {
-            "name": "Sanity dance",
-            "description": "Portals are twice as efficient.",
-            "price": 50000000000000000,
-            "target": FacilityTypes.PORTAL,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PORTAL,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.BRANE_TRANSPLANT: {
-            "name": "Brane transplant",
-            "description": "Portals are twice as efficient.",
-            "price": 5000000000000000000,
-            "target": FacilityTypes.PORTAL,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PORTAL,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.DEITY_SIZED_PORTALS: {
-            "name": "Deity-sized portals",
-            "description": "Portals are twice as efficient.",
-            "price": 500000000000000000000,
-            "target": FacilityTypes.PORTAL,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PORTAL,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.END_OF_TIMES_BACK_UP_PLAN: {
-            "name": "End of times back-up plan",
-            "description": "Portals are twice as efficient.",
-            "price": 500000000000000000000000,
-            "target": FacilityTypes.PORTAL,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PORTAL,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.MADDENING_CHANTS: {
-            "name": "Maddening chants",
-            "description": "Portals are twice as efficient.",
-            "price": 500000000000000000000000000,
-            "target": FacilityTypes.PORTAL,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PORTAL,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.THE_REAL_WORLD: {
-            "name": "The real world",
-            "description": "Portals are twice as efficient.",
-            "price": 500000000000000000000000000000,
-            "target": FacilityTypes.PORTAL,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PORTAL,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.PORTAL_AUTOMATION: {
-            "name": "Portal automation",
-            "description": "Portals are twice as efficient.",
-            "price": 5000000000000000000000000000000000,
-            "target": FacilityTypes.PORTAL,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PORTAL,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.PORTAL_MAINTENANCE: {
-            "name": "Portal maintenance",
-            "description": "Portals are twice as efficient.",
-            "price": 50000000000000000000000000000000000000,
-            "target": FacilityTypes.PORTAL,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PORTAL,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.COOKIE_DIMENSION: {
-            "name": "Cookie dimension",
-            "description": "Portals are twice as efficient.",
-            "price": 500000000000000000000000000000000000000000,
-            "target": FacilityTypes.PORTAL,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PORTAL,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.FLUX_CAPACITORS: {
-            "name": "Flux capacitors",
-            "description": "Time machines are twice as efficient.",
-            "price": 140000000000000,
-            "target": FacilityTypes.TIME_MACHINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TIME_MACHINE,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.TIME_PARADOX_RESOLVER: {
-            "name": "Time paradox resolver",
-            "description": "Time machines are twice as efficient.",
-            "price": 700000000000000,
-            "target": FacilityTypes.TIME_MACHINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TIME_MACHINE,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.QUANTUM_CONUNDRUM: {
-            "name": "Quantum conundrum",
-            "description": "Time machines are twice as efficient.",
-            "price": 7000000000000000,
-            "target": FacilityTypes.TIME_MACHINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TIME_MACHINE,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.CAUSALITY_ENFORCER: {
-            "name": "Causality enforcer",
-            "description": "Time machines are twice as efficient.",
-            "price": 700000000000000000,
-            "target": FacilityTypes.TIME_MACHINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TIME_MACHINE,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.YESTERMORROW_COMPARATORS: {
-            "name": "Yestermorrow comparators",
-            "description": "Time machines are twice as efficient.",
-            "price": 70000000000000000000,
-            "target": FacilityTypes.TIME_MACHINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TIME_MACHINE,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.FAR_FUTURE_ENACTMENT: {
-            "name": "Far future enactment",
-            "description": "Time machines are twice as efficient.",
-            "price": 7000000000000000000000,
-            "target": FacilityTypes.TIME_MACHINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TIME_MACHINE,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.GREAT_LOOP_HYPOTHESIS: {
-            "name": "Great loop hypothesis",
-            "description": "Time machines are twice as efficient.",
-            "price": 7000000000000000000000000,
-            "target": FacilityTypes.TIME_MACHINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TIME_MACHINE,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.COOKIETOPIAN_MOMENTS_OF_MAYBE: {
-            "name": "Cookietopian moments of maybe",
-            "description": "Time machines are twice as efficient.",
-            "price": 7000000000000000000000000000,
-            "target": FacilityTypes.TIME_MACHINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TIME_MACHINE,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.SECOND_SECONDS: {
-            "name": "Second seconds",
-            "description": "Time machines are twice as efficient.",
-            "price": 7000000000000000000000000000000,
-            "target": FacilityTypes.TIME_MACHINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TIME_MACHINE,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.TIME_MACHINE_AUTOMATION: {
-            "name": "Time machine automation",
-            "description": "Time machines are twice as efficient.",
-            "price": 70000000000000000000000000000000000,
-            "target": FacilityTypes.TIME_MACHINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TIME_MACHINE,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.NOSTALGIA_TRIP: {
-            "name": "Nostalgia trip",
-            "description": "Time machines are twice as efficient.",
-            "price": 700000000000000000000000000000000000000,
-            "target": FacilityTypes.TIME_MACHINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TIME_MACHINE,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.EPOCH_MANIPULATION: {
-            "name": "Epoch manipulation",
-            "description": "Time machines are twice as efficient.",
-            "price": 7000000000000000000000000000000000000000000,
-            "target": FacilityTypes.TIME_MACHINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.TIME_MACHINE,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.SUGAR_BOSONS: {
-            "name": "Sugar bosons",
-            "description": "Antimatter condensers are twice as efficient.",
-            "price": 1700000000000000,
-            "target": FacilityTypes.ANTIMATTER_CONDENSER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ANTIMATTER_CONDENSER,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.STRING_THEORY: {
-            "name": "String theory",
-            "description": "Antimatter condensers are twice as efficient.",
-            "price": 8500000000000000,
-            "target": FacilityTypes.ANTIMATTER_CONDENSER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ANTIMATTER_CONDENSER,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.LARGE_MACARON_COLLIDER: {
-            "name": "Large macaron collider",
-            "description": "Antimatter condensers are twice as efficient.",
-            "price": 85000000000000000,
-            "target": FacilityTypes.ANTIMATTER_CONDENSER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ANTIMATTER_CONDENSER,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.BIG_BANG_BAKE: {
-            "name": "Big bang bake",
-            "description": "Antimatter condensers are twice as efficient.",
-            "price": 8500000000000000000,
-            "target": FacilityTypes.ANTIMATTER_CONDENSER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ANTIMATTER_CONDENSER,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.REVERSE_CYCLOTRONS: {
-            "name": "Reverse cyclotrons",
-            "description": "Antimatter condensers are twice as efficient.",
-            "price": 850000000000000000000,
-            "target": FacilityTypes.ANTIMATTER_CONDENSER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ANTIMATTER_CONDENSER,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.NANOCOSMICS: {
-            "name": "Nanocosmics",
-            "description": "Antimatter condensers are twice as efficient.",
-            "price": 85000000000000000000000,
-            "target": FacilityTypes.ANTIMATTER_CONDENSER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ANTIMATTER_CONDENSER,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.THE_PULSE: {
-            "name": "The Pulse",
-            "description": "Antimatter condensers are twice as efficient.",
-            "price": 85000000000000000000000000,
-            "target": FacilityTypes.ANTIMATTER_CONDENSER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ANTIMATTER_CONDENSER,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.SOME_OTHER_SUPER_PARTICLE: {
-            "name": "Some other super particle",
-            "description": "Antimatter condensers are twice as efficient.",
-            "price": 85000000000000000000000000000,
-            "target": FacilityTypes.ANTIMATTER_CONDENSER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ANTIMATTER_CONDENSER,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.QUANTUM_OVENPROOFING: {
-            "name": "Quantum ovenproofing",
-            "description": "Antimatter condensers are twice as efficient.",
-            "price": 85000000000000000000000000000000,
-            "target": FacilityTypes.ANTIMATTER_CONDENSER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ANTIMATTER_CONDENSER,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.ANTIMATTER_AUTOMATION: {
-            "name": "Antimatter automation",
-            "description": "Antimatter condensers are twice as efficient.",
-            "price": 850000000000000000000000000000000000,
-            "target": FacilityTypes.ANTIMATTER_CONDENSER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ANTIMATTER_CONDENSER,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.PRIMORDIAL_PARTICLE: {
-            "name": "Primordial particle",
-            "description": "Antimatter condensers are twice as efficient.",
-            "price": 8500000000000000000000000000000000000000,
-            "target": FacilityTypes.ANTIMATTER_CONDENSER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ANTIMATTER_CONDENSER,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.ANTI_UNIVERSE: {
-            "name": "Anti-universe",
-            "description": "Antimatter condensers are twice as efficient.",
-            "price": 85000000000000000000000000000000000000000000,
-            "target": FacilityTypes.ANTIMATTER_CONDENSER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.ANTIMATTER_CONDENSER,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.GEM_POLISH: {
-            "name": "Gem polish",
-            "description": "Prisms are twice as efficient.",
-            "price": 21000000000000000,
-            "target": FacilityTypes.PRISM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PRISM,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.NINTH_COLOR: {
-            "name": "9th color",
-            "description": "Prisms are twice as efficient.",
-            "price": 105000000000000000,
-            "target": FacilityTypes.PRISM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PRISM,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.CHOCOLATE_LIGHT: {
-            "name": "Chocolate light",
-            "description": "Prisms are twice as efficient.",
-            "price": 1050000000000000000,
-            "target": FacilityTypes.PRISM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PRISM,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.GRAINBOW: {
-            "name": "Grainbow",
-            "description": "Prisms are twice as efficient.",
-            "price": 105000000000000000000,
-            "target": FacilityTypes.PRISM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PRISM,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.PURE_COSMIC_LIGHT: {
-            "name": "Pure cosmic light",
-            "description": "Prisms are twice as efficient.",
-            "price": 10500000000000000000000,
-            "target": FacilityTypes.PRISM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PRISM,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.GLOW_IN_THE_DARK: {
-            "name": "Glow-in-the-dark",
-            "description": "Prisms are twice as efficient.",
-            "price": 1050000000000000000000000,
-            "target": FacilityTypes.PRISM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PRISM,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.LENSES_OF_TRUTH: {
-            "name": "Lenses of truth",
-            "description": "Prisms are twice as efficient.",
-            "price": 1050000000000000000000000000,
-            "target": FacilityTypes.PRISM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PRISM,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.RECURSIVE_MIRRORS: {
-            "name": "Recursive mirrors",
-            "description": "Prisms are twice as efficient.",
-            "price": 1050000000000000000000000000000,
-            "target": FacilityTypes.PRISM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PRISM,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.CRYSTAL_MEMORIES: {
-            "name": "Crystal memories",
-            "description": "Prisms are twice as efficient.",
-            "price": 1050000000000000000000000000000000,
-            "target": FacilityTypes.PRISM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PRISM,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.PRISM_AUTOMATION: {
-            "name": "Prism automation",
-            "description": "Prisms are twice as efficient.",
-            "price": 10500000000000000000000000000000000000,
-            "target": FacilityTypes.PRISM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PRISM,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.COLORBLIND_GLASSES: {
-            "name": "Colorblind glasses",
-            "description": "Prisms are twice as efficient.",
-            "price": 105000000000000000000000000000000000000000,
-            "target": FacilityTypes.PRISM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PRISM,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.SHIMMERING_HORIZON: {
-            "name": "Shimmering horizon",
-            "description": "Prisms are twice as efficient.",
-            "price": 1050000000000000000000000000000000000000000000,
-            "target": FacilityTypes.PRISM,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PRISM,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.YOUR_LUCKY_COOKIE: {
-            "name": "Your lucky cookie",
-            "description": "Chancemakers are twice as efficient.",
-            "price": 260000000000000000,
-            "target": FacilityTypes.CHANCE_MAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CHANCE_MAKER,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.ALL_OR_NOTHING: {
-            "name": "All or nothing",
-            "description": "Chancemakers are twice as efficient.",
-            "price": 1300000000000000000,
-            "target": FacilityTypes.CHANCE_MAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CHANCE_MAKER,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.TURBOCHARGED_LUCK: {
-            "name": "Turbocharged luck",
-            "description": "Chancemakers are twice as efficient.",
-            "price": 13000000000000000000,
-            "target": FacilityTypes.CHANCE_MAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CHANCE_MAKER,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.LUCKY_DIGITS: {
-            "name": "Lucky digits",
-            "description": "Chancemakers are twice as efficient.",
-            "price": 1300000000000000000000,
-            "target": FacilityTypes.CHANCE_MAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CHANCE_MAKER,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.LUCKY_PAYOUT: {
-            "name": "Lucky payout",
-            "description": "Chancemakers are twice as efficient.",
-            "price": 130000000000000000000000,
-            "target": FacilityTypes.CHANCE_MAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CHANCE_MAKER,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.LUCKY_FINGERS: {
-            "name": "Lucky fingers",
-            "description": "Chancemakers are twice as efficient.",
-            "price": 13000000000000000000000000,
-            "target": FacilityTypes.CHANCE_MAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CHANCE_MAKER,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.ENTANGLEMENT: {
-            "name": "Entanglement",
-            "description": "Chancemakers are twice as efficient.",
-            "price": 13000000000000000000000000000,
-            "target": FacilityTypes.CHANCE_MAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CHANCE_MAKER,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.JUST_IN_TIME: {
-            "name": "Just in time",
-            "description": "Chancemakers are twice as efficient.",
-            "price": 13000000000000000000000000000000,
-            "target": FacilityTypes.CHANCE_MAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CHANCE_MAKER,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.WAGER_WAR: {
-            "name": "Wager war",
-            "description": "Chancemakers are twice as efficient.",
-            "price": 13000000000000000000000000000000000,
-            "target": FacilityTypes.CHANCE_MAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CHANCE_MAKER,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.CHANCEMAKER_AUTOMATION: {
-            "name": "Chancemaker automation",
-            "description": "Chancemakers are twice as efficient.",
-            "price": 130000000000000000000000000000000000000,
-            "target": FacilityTypes.CHANCE_MAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CHANCE_MAKER,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.LUCKY_GRANDMA: {
-            "name": "Lucky grandma",
-            "description": "Chancemakers are twice as efficient.",
-            "price": 1300000000000000000000000000000000000000000,
-            "target": FacilityTypes.CHANCE_MAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CHANCE_MAKER,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.THE_ULTIMATE_GAMBLE: {
-            "name": "The ultimate gamble",
-            "description": "Chancemakers are twice as efficient.",
-            "price": 13000000000000000000000000000000000000000000000,
-            "target": FacilityTypes.CHANCE_MAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CHANCE_MAKER,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.METABAKERIES: {
-            "name": "Metabakeries",
-            "description": "Fractal engines are twice as efficient.",
-            "price": 3100000000000000000,
-            "target": FacilityTypes.FRACTAL_ENGINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FRACTAL_ENGINE,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.MANDELBROWN_SUGAR: {
-            "name": "Mandelbrown sugar",
-            "description": "Fractal engines are twice as efficient.",
-            "price": 15500000000000000000,
-            "target": FacilityTypes.FRACTAL_ENGINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FRACTAL_ENGINE,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.FRACTOIDS: {
-            "name": "Fractoids",
-            "description": "Fractal engines are twice as efficient.",
-            "price": 155000000000000000000,
-            "target": FacilityTypes.FRACTAL_ENGINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FRACTAL_ENGINE,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.NESTED_UNIVERSE_THEORY: {
-            "name": "Nested universe theory",
-            "description": "Fractal engines are twice as efficient.",
-            "price": 15500000000000000000000,
-            "target": FacilityTypes.FRACTAL_ENGINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FRACTAL_ENGINE,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.MENGER_SPONGE_CAKE: {
-            "name": "Menger sponge cake",
-            "description": "Fractal engines are twice as efficient.",
-            "price": 1550000000000000000000000,
-            "target": FacilityTypes.FRACTAL_ENGINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FRACTAL_ENGINE,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.ONE_PARTICULARLY_GOOD_INFINITY: {
-            "name": "One particularly good infinity",
-            "description": "Fractal engines are twice as efficient.",
-            "price": 155000000000000000000000000,
-            "target": FacilityTypes.FRACTAL_ENGINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FRACTAL_ENGINE,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.INFINITE_SUGARCUBES: {
-            "name": "Infinite sugarcubes",
-            "description": "Fractal engines are twice as efficient.",
-            "price": 155000000000000000000000000000,
-            "target": FacilityTypes.FRACTAL_ENGINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FRACTAL_ENGINE,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.ENDLESS_BOOK_OF_PROSE: {
-            "name": "Endless book of prose",
-            "description": "Fractal engines are twice as efficient.",
-            "price": 155000000000000000000000000000000,
-            "target": FacilityTypes.FRACTAL_ENGINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FRACTAL_ENGINE,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.DOUGH_BLOOMING: {
-            "name": "Dough blooming",
-            "description": "Fractal engines are twice as efficient.",
-            "price": 155000000000000000000000000000000000,
-            "target": FacilityTypes.FRACTAL_ENGINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FRACTAL_ENGINE,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.FRACTAL_ENGINE_AUTOMATION: {
-            "name": "Fractal engine automation",
-            "description": "Fractal engines are twice as efficient.",
-            "price": 1550000000000000000000000000000000000000,
-            "target": FacilityTypes.FRACTAL_ENGINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FRACTAL_ENGINE,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.DOUGHSCENSION: {
-            "name": "Doughscension",
-            "description": "Fractal engines are twice as efficient.",
-            "price": 15500000000000000000000000000000000000000000,
-            "target": FacilityTypes.FRACTAL_ENGINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FRACTAL_ENGINE,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.RECURSIVE_DELICACIES: {
-            "name": "Recursive delicacies",
-            "description": "Fractal engines are twice as efficient.",
-            "price": 155000000000000000000000000000000000000000000000,
-            "target": FacilityTypes.FRACTAL_ENGINE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.FRACTAL_ENGINE,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.ALERT_JS: {
-            "name": "alert.py",
-            "description": "Python consoles are twice as efficient.",
-            "price": 71000000000000000000,
-            "target": FacilityTypes.PYTHON_CONSOLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PYTHON_CONSOLE,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.EVAL_JS: {
-            "name": "eval.py",
-            "description": "Python consoles are twice as efficient.",
-            "price": 355000000000000000000,
-            "target": FacilityTypes.PYTHON_CONSOLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PYTHON_CONSOLE,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.TOSTRING_JS: {
-            "name": "__str__.py",
-            "description": "Python consoles are twice as efficient.",
-            "price": 3550000000000000000000,
-            "target": FacilityTypes.PYTHON_CONSOLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PYTHON_CONSOLE,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.MOAR_MONEYS_JS: {
-            "name": "moar_moneys.py",
-            "description": "Python consoles are twice as efficient.",
-            "price": 355000000000000000000000,
-            "target": FacilityTypes.PYTHON_CONSOLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PYTHON_CONSOLE,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.ALGORITHM_GOODNESS: {
-            "name": "Algorithm goodness",
-            "description": "Python consoles are twice as efficient.",
-            "price": 35500000000000000000000000,
-            "target": FacilityTypes.PYTHON_CONSOLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PYTHON_CONSOLE,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.SOURCE_CODE: {
-            "name": "Source code",
-            "description": "Python consoles are twice as efficient.",
-            "price": 3550000000000000000000000000,
-            "target": FacilityTypes.PYTHON_CONSOLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PYTHON_CONSOLE,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.AUTOCOMPLETE: {
-            "name": "Autocomplete",
-            "description": "Python consoles are twice as efficient.",
-            "price": 3550000000000000000000000000000,
-            "target": FacilityTypes.PYTHON_CONSOLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PYTHON_CONSOLE,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.AI_BAKERS: {
-            "name": "AI bakers",
-            "description": "Python consoles are twice as efficient.",
-            "price": 3550000000000000000000000000000000,
-            "target": FacilityTypes.PYTHON_CONSOLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PYTHON_CONSOLE,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.SENTIENT_CODE: {
-            "name": "Sentient code",
-            "description": "Python consoles are twice as efficient.",
-            "price": 3550000000000000000000000000000000000,
-            "target": FacilityTypes.PYTHON_CONSOLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PYTHON_CONSOLE,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.CONSOLE_AUTOMATION: {
-            "name": "Console automation",
-            "description": "Python consoles are twice as efficient.",
-            "price": 35500000000000000000000000000000000000000,
-            "target": FacilityTypes.PYTHON_CONSOLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PYTHON_CONSOLE,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.MALWARE: {
-            "name": "Malware",
-            "description": "Python consoles are twice as efficient.",
-            "price": 355000000000000000000000000000000000000000000,
-            "target": FacilityTypes.PYTHON_CONSOLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PYTHON_CONSOLE,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.SUPERBUG: {
-            "name": "Superbug",
-            "description": "Python consoles are twice as efficient.",
-            "price": 3550000000000000000000000000000000000000000000000,
-            "target": FacilityTypes.PYTHON_CONSOLE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.PYTHON_CONSOLE,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.MANIFEST_DESTINY: {
-            "name": "Manifest destiny",
-            "description": "Idleverses are twice as efficient.",
-            "price": 12000000000000000000000,
-            "target": FacilityTypes.IDLEVERSE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.IDLEVERSE,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.THE_MULTIVERSE_IN_A_NUTSHELL: {
-            "name": "The multiverse in a nutshell",
-            "description": "Idleverses are twice as efficient.",
-            "price": 60000000000000000000000,
-            "target": FacilityTypes.IDLEVERSE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.IDLEVERSE,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.ALL_CONSUMING: {
-            "name": "All-consuming",
-            "description": "Idleverses are twice as efficient.",
-            "price": 600000000000000000000000,
-            "target": FacilityTypes.IDLEVERSE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.IDLEVERSE,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.ETERNAL_RECURSION: {
-            "name": "Eternal recursion",
-            "description": "Idleverses are twice as efficient.",
-            "price": 60000000000000000000000000,
-            "target": FacilityTypes.IDLEVERSE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.IDLEVERSE,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.PARA_REALITY_ADAPTATION: {
-            "name": "Para-reality adaptation",
-            "description": "Idleverses are twice as efficient.",
-            "price": 6000000000000000000000000000,
-            "target": FacilityTypes.IDLEVERSE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.IDLEVERSE,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.HYPNODRONES: {
-            "name": "Hypnodrones",
-            "description": "Idleverses are twice as efficient.",
-            "price": 600000000000000000000000000000,
-            "target": FacilityTypes.IDLEVERSE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.IDLEVERSE,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.DARK_MATTER_INTERFERENCE: {
-            "name": "Dark matter interference",
-            "description": "Idleverses are twice as efficient.",
-            "price": 600000000000000000000000000000000,
-            "target": FacilityTypes.IDLEVERSE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.IDLEVERSE,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.MULTIVERSE_MAYHEM: {
-            "name": "Multiverse mayhem",
-            "description": "Idleverses are twice as efficient.",
-            "price": 600000000000000000000000000000000000,
-            "target": FacilityTypes.IDLEVERSE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.IDLEVERSE,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.LIGHT_SPEED_IDLEVERSE: {
-            "name": "Light-speed Idleverse",
-            "description": "Idleverses are twice as efficient.",
-            "price": 600000000000000000000000000000000000000,
-            "target": FacilityTypes.IDLEVERSE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.IDLEVERSE,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.IDLEVERSE_AUTOMATION: {
-            "name": "Idleverse automation",
-            "description": "Idleverses are twice as efficient.",
-            "price": 6000000000000000000000000000000000000000000,
-            "target": FacilityTypes.IDLEVERSE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.IDLEVERSE,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.SELF_CONTAINED_REALITY: {
-            "name": "Self-contained reality",
-            "description": "Idleverses are twice as efficient.",
-            "price": 60000000000000000000000000000000000000000000000,
-            "target": FacilityTypes.IDLEVERSE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.IDLEVERSE,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.ENDLESS_LOOP: {
-            "name": "Endless loop",
-            "description": "Idleverses are twice as efficient.",
-            "price": 600000000000000000000000000000000000000000000000000,
-            "target": FacilityTypes.IDLEVERSE,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.IDLEVERSE,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.NEURAL_NETWORKS: {
-            "name": "Neural networks",
-            "description": "Cortex bakers are twice as efficient.",
-            "price": 1900000000000000000000000,
-            "target": FacilityTypes.CORTEX_BAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CORTEX_BAKER,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.BRAIN_TRUST: {
-            "name": "Brain trust",
-            "description": "Cortex bakers are twice as efficient.",
-            "price": 9500000000000000000000000,
-            "target": FacilityTypes.CORTEX_BAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CORTEX_BAKER,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.MEMORY_PALACES: {
-            "name": "Memory palaces",
-            "description": "Cortex bakers are twice as efficient.",
-            "price": 95000000000000000000000000,
-            "target": FacilityTypes.CORTEX_BAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CORTEX_BAKER,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.QUANTUM_MINDS: {
-            "name": "Quantum minds",
-            "description": "Cortex bakers are twice as efficient.",
-            "price": 9500000000000000000000000000,
-            "target": FacilityTypes.CORTEX_BAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CORTEX_BAKER,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.SYNTHETIC_SYNAPSE: {
-            "name": "Synthetic synapse",
-            "description": "Cortex bakers are twice as efficient.",
-            "price": 950000000000000000000000000000,
-            "target": FacilityTypes.CORTEX_BAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CORTEX_BAKER,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.COLLECTIVE_THINKING: {
-            "name": "Collective thinking",
-            "description": "Cortex bakers are twice as efficient.",
-            "price": 95000000000000000000000000000000,
-            "target": FacilityTypes.CORTEX_BAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CORTEX_BAKER,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.HIVE_MIND: {
-            "name": "Hive mind",
-            "description": "Cortex bakers are twice as efficient.",
-            "price": 95000000000000000000000000000000000,
-            "target": FacilityTypes.CORTEX_BAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CORTEX_BAKER,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.CORTEX_CONSCIOUSNESS: {
-            "name": "Cortex consciousness",
-            "description": "Cortex bakers are twice as efficient.",
-            "price": 95000000000000000000000000000000000000,
-            "target": FacilityTypes.CORTEX_BAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CORTEX_BAKER,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.BRAINSTORM: {
-            "name": "Brainstorm",
-            "description": "Cortex bakers are twice as efficient.",
-            "price": 95000000000000000000000000000000000000000,
-            "target": FacilityTypes.CORTEX_BAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CORTEX_BAKER,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.CORTEX_AUTOMATION: {
-            "name": "Cortex automation",
-            "description": "Cortex bakers are twice as efficient.",
-            "price": 950000000000000000000000000000000000000000000,
-            "target": FacilityTypes.CORTEX_BAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CORTEX_BAKER,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.DREAM_BAKER: {
-            "name": "Dream baker",
-            "description": "Cortex bakers are twice as efficient.",
-            "price": 9500000000000000000000000000000000000000000000000,
-            "target": FacilityTypes.CORTEX_BAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CORTEX_BAKER,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.PSYCHIC_COOKIES: {
-            "name": "Psychic cookies",
-            "description": "Cortex bakers are twice as efficient.",
-            "price": 95000000000000000000000000000000000000000000000000000,
-            "target": FacilityTypes.CORTEX_BAKER,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.CORTEX_BAKER,
-            "unlock_count": 450,
-        },
-        UpgradeTypes.ME_MYSELF_AND_I: {
-            "name": "Me, myself, and I",
-            "description": "You are twice as efficient.",
-            "price": 540000000000000000000000000000,
-            "target": FacilityTypes.YOU,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.YOU,
-            "unlock_count": 1,
-        },
-        UpgradeTypes.SOUL_SEARCH: {
-            "name": "Soul search",
-            "description": "You are twice as efficient.",
-            "price": 2700000000000000000000000000000,
-            "target": FacilityTypes.YOU,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.YOU,
-            "unlock_count": 5,
-        },
-        UpgradeTypes.EXISTENTIAL_COOKIES: {
-            "name": "Existential cookies",
-            "description": "You are twice as efficient.",
-            "price": 27000000000000000000000000000000,
-            "target": FacilityTypes.YOU,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.YOU,
-            "unlock_count": 25,
-        },
-        UpgradeTypes.MINDFUL_BAKING: {
-            "name": "Mindful baking",
-            "description": "You are twice as efficient.",
-            "price": 2700000000000000000000000000000000,
-            "target": FacilityTypes.YOU,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.YOU,
-            "unlock_count": 50,
-        },
-        UpgradeTypes.INNER_STRENGTH: {
-            "name": "Inner strength",
-            "description": "You are twice as efficient.",
-            "price": 270000000000000000000000000000000000,
-            "target": FacilityTypes.YOU,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.YOU,
-            "unlock_count": 100,
-        },
-        UpgradeTypes.ETERNAL_YOUTH: {
-            "name": "Eternal youth",
-            "description": "You are twice as efficient.",
-            "price": 27000000000000000000000000000000000000,
-            "target": FacilityTypes.YOU,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.YOU,
-            "unlock_count": 150,
-        },
-        UpgradeTypes.SELF_DISCOVERY: {
-            "name": "Self-discovery",
-            "description": "You are twice as efficient.",
-            "price": 27000000000000000000000000000000000000000,
-            "target": FacilityTypes.YOU,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.YOU,
-            "unlock_count": 200,
-        },
-        UpgradeTypes.EXISTENTIAL_CRISIS: {
-            "name": "Existential crisis",
-            "description": "You are twice as efficient.",
-            "price": 27000000000000000000000000000000000000000000,
-            "target": FacilityTypes.YOU,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.YOU,
-            "unlock_count": 250,
-        },
-        UpgradeTypes.THE_REAL_YOU: {
-            "name": "The real you",
-            "description": "You are twice as efficient.",
-            "price": 27000000000000000000000000000000000000000000000,
-            "target": FacilityTypes.YOU,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.YOU,
-            "unlock_count": 300,
-        },
-        UpgradeTypes.YOU_AUTOMATION: {
-            "name": "You automation",
-            "description": "You are twice as efficient.",
-            "price": 270000000000000000000000000000000000000000000000000,
-            "target": FacilityTypes.YOU,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.YOU,
-            "unlock_count": 350,
-        },
-        UpgradeTypes.ENLIGHTENMENT: {
-            "name": "Enlightenment",
-            "description": "You are twice as efficient.",
-            "price": 2700000000000000000000000000000000000000000000000000000,
-            "target": FacilityTypes.YOU,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.YOU,
-            "unlock_count": 400,
-        },
-        UpgradeTypes.GODHOOD: {
-            "name": "Godhood",
-            "description": "You are twice as efficient.",
-            "price": 27000000000000000000000000000000000000000000000000000000000,
-            "target": FacilityTypes.YOU,
-            "effect_type": EffectType.MULTIPLIER,
-            "value": 2.0,
-            "unlock_facility": FacilityTypes.YOU,
-            "unlock_count": 450,
-        },
+        UpgradeTypes.REINFORCED_INDEX_FINGER: UpgradeConfig(
+            name="Reinforced index finger",
+            description="The keyboard is twice as efficient.",
+            price=100,
+            target=FacilityTypes.KEYBOARD,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.KEYBOARD,
+            unlock_count=1,
+        ),
+        UpgradeTypes.CARPAL_TUNNEL_PREVENTION: UpgradeConfig(
+            name="Carpal tunnel prevention cream",
+            description="The keyboard is twice as efficient.",
+            price=500,
+            target=FacilityTypes.KEYBOARD,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.KEYBOARD,
+            unlock_count=1,
+        ),
+        UpgradeTypes.AMBIDEXTROUS: UpgradeConfig(
+            name="Ambidextrous",
+            description="The keyboard is twice as efficient.",
+            price=10000,
+            target=FacilityTypes.KEYBOARD,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.KEYBOARD,
+            unlock_count=10,
+        ),
+        UpgradeTypes.FORWARD_FROM_GRANDMA: UpgradeConfig(
+            name="Forwards from grandma",
+            description="Grandmas are twice as efficient.",
+            price=1000,
+            target=FacilityTypes.GRANDMA,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.GRANDMA,
+            unlock_count=1,
+        ),
+        UpgradeTypes.STEEL_PLATED_ROLLING_PINS: UpgradeConfig(
+            name="Steel-plated rolling pins",
+            description="Grandmas are twice as efficient.",
+            price=5000,
+            target=FacilityTypes.GRANDMA,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.GRANDMA,
+            unlock_count=5,
+        ),
+        UpgradeTypes.CHEAP_HOES: UpgradeConfig(
+            name="Cheap hoes",
+            description="Farms are twice as efficient.",
+            price=11000,
+            target=FacilityTypes.FARM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FARM,
+            unlock_count=1,
+        ),
+        UpgradeTypes.FERTILIZER: UpgradeConfig(
+            name="Fertilizer",
+            description="Farms are twice as efficient.",
+            price=55000,
+            target=FacilityTypes.FARM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FARM,
+            unlock_count=5,
+        ),
+        UpgradeTypes.SUGAR_GAS: UpgradeConfig(
+            name="Sugar gas",
+            description="Mines are twice as efficient.",
+            price=120000,
+            target=FacilityTypes.MINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.MINE,
+            unlock_count=1,
+        ),
+        UpgradeTypes.MEGADRILL: UpgradeConfig(
+            name="Megadrill",
+            description="Mines are twice as efficient.",
+            price=600000,
+            target=FacilityTypes.MINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.MINE,
+            unlock_count=5,
+        ),
+        UpgradeTypes.THOUSAND_FINGERS: UpgradeConfig(
+            name="Thousand fingers",
+            description="Keyboards are twice as efficient.",
+            price=100000,
+            target=FacilityTypes.KEYBOARD,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.KEYBOARD,
+            unlock_count=25,
+        ),
+        UpgradeTypes.MILLION_FINGERS: UpgradeConfig(
+            name="Million fingers",
+            description="Keyboards are twice as efficient.",
+            price=10000000,
+            target=FacilityTypes.KEYBOARD,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.KEYBOARD,
+            unlock_count=50,
+        ),
+        UpgradeTypes.BILLION_FINGERS: UpgradeConfig(
+            name="Billion fingers",
+            description="Keyboards are twice as efficient.",
+            price=100000000,
+            target=FacilityTypes.KEYBOARD,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.KEYBOARD,
+            unlock_count=100,
+        ),
+        UpgradeTypes.TRILLION_FINGERS: UpgradeConfig(
+            name="Trillion fingers",
+            description="Keyboards are twice as efficient.",
+            price=1000000000,
+            target=FacilityTypes.KEYBOARD,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.KEYBOARD,
+            unlock_count=150,
+        ),
+        UpgradeTypes.QUADRILLION_FINGERS: UpgradeConfig(
+            name="Quadrillion fingers",
+            description="Keyboards are twice as efficient.",
+            price=10000000000,
+            target=FacilityTypes.KEYBOARD,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.KEYBOARD,
+            unlock_count=200,
+        ),
+        UpgradeTypes.QUINTILLION_FINGERS: UpgradeConfig(
+            name="Quintillion fingers",
+            description="Keyboards are twice as efficient.",
+            price=10000000000000,
+            target=FacilityTypes.KEYBOARD,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.KEYBOARD,
+            unlock_count=250,
+        ),
+        UpgradeTypes.SEXTILLION_FINGERS: UpgradeConfig(
+            name="Sextillion fingers",
+            description="Keyboards are twice as efficient.",
+            price=10000000000000000,
+            target=FacilityTypes.KEYBOARD,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.KEYBOARD,
+            unlock_count=300,
+        ),
+        UpgradeTypes.SEPTILLION_FINGERS: UpgradeConfig(
+            name="Septillion fingers",
+            description="Keyboards are twice as efficient.",
+            price=10000000000000000000,
+            target=FacilityTypes.KEYBOARD,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.KEYBOARD,
+            unlock_count=350,
+        ),
+        UpgradeTypes.OCTILLION_FINGERS: UpgradeConfig(
+            name="Octillion fingers",
+            description="Keyboards are twice as efficient.",
+            price=10000000000000000000000,
+            target=FacilityTypes.KEYBOARD,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.KEYBOARD,
+            unlock_count=400,
+        ),
+        UpgradeTypes.NONILLION_FINGERS: UpgradeConfig(
+            name="Nonillion fingers",
+            description="Keyboards are twice as efficient.",
+            price=10000000000000000000000000,
+            target=FacilityTypes.KEYBOARD,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.KEYBOARD,
+            unlock_count=450,
+        ),
+        UpgradeTypes.DECILLION_FINGERS: UpgradeConfig(
+            name="Decillion fingers",
+            description="Keyboards are twice as efficient.",
+            price=10000000000000000000000000000,
+            target=FacilityTypes.KEYBOARD,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.KEYBOARD,
+            unlock_count=500,
+        ),
+        UpgradeTypes.UNDECILLION_FINGERS: UpgradeConfig(
+            name="Undecillion fingers",
+            description="Keyboards are twice as efficient.",
+            price=10000000000000000000000000000000,
+            target=FacilityTypes.KEYBOARD,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.KEYBOARD,
+            unlock_count=550,
+        ),
+        UpgradeTypes.LUBRICATED_DENTURES: UpgradeConfig(
+            name="Lubricated dentures",
+            description="Grandmas are twice as efficient.",
+            price=50000,
+            target=FacilityTypes.GRANDMA,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.GRANDMA,
+            unlock_count=25,
+        ),
+        UpgradeTypes.PRUNE_JUICE: UpgradeConfig(
+            name="Prune juice",
+            description="Grandmas are twice as efficient.",
+            price=5000000,
+            target=FacilityTypes.GRANDMA,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.GRANDMA,
+            unlock_count=50,
+        ),
+        UpgradeTypes.DOUBLE_THICK_GLASSES: UpgradeConfig(
+            name="Double-thick glasses",
+            description="Grandmas are twice as efficient.",
+            price=500000000,
+            target=FacilityTypes.GRANDMA,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.GRANDMA,
+            unlock_count=100,
+        ),
+        UpgradeTypes.AGING_AGENTS: UpgradeConfig(
+            name="Aging agents",
+            description="Grandmas are twice as efficient.",
+            price=50000000000,
+            target=FacilityTypes.GRANDMA,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.GRANDMA,
+            unlock_count=150,
+        ),
+        UpgradeTypes.XTREME_WALKERS: UpgradeConfig(
+            name="Xtreme walkers",
+            description="Grandmas are twice as efficient.",
+            price=50000000000000,
+            target=FacilityTypes.GRANDMA,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.GRANDMA,
+            unlock_count=200,
+        ),
+        UpgradeTypes.THE_UNBRIDLING: UpgradeConfig(
+            name="The Unbridling",
+            description="Grandmas are twice as efficient.",
+            price=50000000000000000,
+            target=FacilityTypes.GRANDMA,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.GRANDMA,
+            unlock_count=250,
+        ),
+        UpgradeTypes.REVERSE_DEMENTIA: UpgradeConfig(
+            name="Reverse dementia",
+            description="Grandmas are twice as efficient.",
+            price=50000000000000000000,
+            target=FacilityTypes.GRANDMA,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.GRANDMA,
+            unlock_count=300,
+        ),
+        UpgradeTypes.TIMEPROOF_HAIR_DYES: UpgradeConfig(
+            name="Timeproof hair dyes",
+            description="Grandmas are twice as efficient.",
+            price=50000000000000000000000,
+            target=FacilityTypes.GRANDMA,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.GRANDMA,
+            unlock_count=350,
+        ),
+        UpgradeTypes.GOOD_MANNERS: UpgradeConfig(
+            name="Good manners",
+            description="Grandmas are twice as efficient.",
+            price=500000000000000000000000,
+            target=FacilityTypes.GRANDMA,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.GRANDMA,
+            unlock_count=400,
+        ),
+        UpgradeTypes.GENERATION_DEGENERATION: UpgradeConfig(
+            name="Generation degeneration",
+            description="Grandmas are twice as efficient.",
+            price=5000000000000000000000000000,
+            target=FacilityTypes.GRANDMA,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.GRANDMA,
+            unlock_count=450,
+        ),
+        UpgradeTypes.VISITS: UpgradeConfig(
+            name="Visits",
+            description="Grandmas are twice as efficient.",
+            price=50000000000000000000000000000000,
+            target=FacilityTypes.GRANDMA,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.GRANDMA,
+            unlock_count=500,
+        ),
+        UpgradeTypes.KITCHEN_CABINETS: UpgradeConfig(
+            name="Kitchen cabinets",
+            description="Grandmas are twice as efficient.",
+            price=500000000000000000000000000000000,
+            target=FacilityTypes.GRANDMA,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.GRANDMA,
+            unlock_count=550,
+        ),
+        UpgradeTypes.FOAM_TIPPED_CANES: UpgradeConfig(
+            name="Foam-tipped canes",
+            description="Grandmas are twice as efficient.",
+            price=5000000000000000000000000000000000000,
+            target=FacilityTypes.GRANDMA,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.GRANDMA,
+            unlock_count=600,
+        ),
+        UpgradeTypes.COOKIE_TREES: UpgradeConfig(
+            name="Cookie trees",
+            description="Farms are twice as efficient.",
+            price=550000,
+            target=FacilityTypes.FARM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FARM,
+            unlock_count=25,
+        ),
+        UpgradeTypes.GENETICALLY_MODIFIED_COOKIES: UpgradeConfig(
+            name="Genetically-modified cookies",
+            description="Farms are twice as efficient.",
+            price=55000000,
+            target=FacilityTypes.FARM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FARM,
+            unlock_count=50,
+        ),
+        UpgradeTypes.GINGERBREAD_SCARECROWS: UpgradeConfig(
+            name="Gingerbread scarecrows",
+            description="Farms are twice as efficient.",
+            price=5500000000,
+            target=FacilityTypes.FARM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FARM,
+            unlock_count=100,
+        ),
+        UpgradeTypes.PULSAR_SPRINKLERS: UpgradeConfig(
+            name="Pulsar sprinklers",
+            description="Farms are twice as efficient.",
+            price=550000000000,
+            target=FacilityTypes.FARM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FARM,
+            unlock_count=150,
+        ),
+        UpgradeTypes.FUDGE_FUNGUS: UpgradeConfig(
+            name="Fudge fungus",
+            description="Farms are twice as efficient.",
+            price=550000000000000,
+            target=FacilityTypes.FARM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FARM,
+            unlock_count=200,
+        ),
+        UpgradeTypes.WHEAT_TRIFFIDS: UpgradeConfig(
+            name="Wheat triffids",
+            description="Farms are twice as efficient.",
+            price=550000000000000000,
+            target=FacilityTypes.FARM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FARM,
+            unlock_count=250,
+        ),
+        UpgradeTypes.HUMANE_PESTICIDES: UpgradeConfig(
+            name="Humane pesticides",
+            description="Farms are twice as efficient.",
+            price=550000000000000000000,
+            target=FacilityTypes.FARM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FARM,
+            unlock_count=300,
+        ),
+        UpgradeTypes.BARNSTARS: UpgradeConfig(
+            name="Barnstars",
+            description="Farms are twice as efficient.",
+            price=550000000000000000000000,
+            target=FacilityTypes.FARM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FARM,
+            unlock_count=350,
+        ),
+        UpgradeTypes.LINDWORMS: UpgradeConfig(
+            name="Lindworms",
+            description="Farms are twice as efficient.",
+            price=5500000000000000000000000000,
+            target=FacilityTypes.FARM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FARM,
+            unlock_count=400,
+        ),
+        UpgradeTypes.GLOBAL_SEED_VAULT: UpgradeConfig(
+            name="Global seed vault",
+            description="Farms are twice as efficient.",
+            price=55000000000000000000000000000000,
+            target=FacilityTypes.FARM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FARM,
+            unlock_count=450,
+        ),
+        UpgradeTypes.REVERSE_SEASONS: UpgradeConfig(
+            name="Reverse seasons",
+            description="Farms are twice as efficient.",
+            price=550000000000000000000000000000000,
+            target=FacilityTypes.FARM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FARM,
+            unlock_count=500,
+        ),
+        UpgradeTypes.FARM_AUTOMATION: UpgradeConfig(
+            name="Farm automation",
+            description="Farms are twice as efficient.",
+            price=5500000000000000000000000000000000000,
+            target=FacilityTypes.FARM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FARM,
+            unlock_count=550,
+        ),
+        UpgradeTypes.ULTRADRILL: UpgradeConfig(
+            name="Ultradrill",
+            description="Mines are twice as efficient.",
+            price=6000000,
+            target=FacilityTypes.MINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.MINE,
+            unlock_count=25,
+        ),
+        UpgradeTypes.ULTIMADRILL: UpgradeConfig(
+            name="Ultimadrill",
+            description="Mines are twice as efficient.",
+            price=600000000,
+            target=FacilityTypes.MINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.MINE,
+            unlock_count=50,
+        ),
+        UpgradeTypes.H_BOMB_MINING: UpgradeConfig(
+            name="H-bomb mining",
+            description="Mines are twice as efficient.",
+            price=60000000000,
+            target=FacilityTypes.MINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.MINE,
+            unlock_count=100,
+        ),
+        UpgradeTypes.COREFORGE: UpgradeConfig(
+            name="Coreforge",
+            description="Mines are twice as efficient.",
+            price=6000000000000,
+            target=FacilityTypes.MINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.MINE,
+            unlock_count=150,
+        ),
+        UpgradeTypes.PLANETSPLITTERS: UpgradeConfig(
+            name="Planetsplitters",
+            description="Mines are twice as efficient.",
+            price=6000000000000000,
+            target=FacilityTypes.MINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.MINE,
+            unlock_count=200,
+        ),
+        UpgradeTypes.CANOLA_OIL_WELLS: UpgradeConfig(
+            name="Canola oil wells",
+            description="Mines are twice as efficient.",
+            price=6000000000000000000,
+            target=FacilityTypes.MINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.MINE,
+            unlock_count=250,
+        ),
+        UpgradeTypes.MOLE_PEOPLE: UpgradeConfig(
+            name="Mole people",
+            description="Mines are twice as efficient.",
+            price=6000000000000000000000,
+            target=FacilityTypes.MINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.MINE,
+            unlock_count=300,
+        ),
+        UpgradeTypes.MINE_CANARIES: UpgradeConfig(
+            name="Mine canaries",
+            description="Mines are twice as efficient.",
+            price=60000000000000000000000000,
+            target=FacilityTypes.MINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.MINE,
+            unlock_count=350,
+        ),
+        UpgradeTypes.BORE_AGAIN: UpgradeConfig(
+            name="Bore again",
+            description="Mines are twice as efficient.",
+            price=600000000000000000000000000000,
+            target=FacilityTypes.MINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.MINE,
+            unlock_count=400,
+        ),
+        UpgradeTypes.MOUNTAIN_MACAROONS: UpgradeConfig(
+            name="Mountain macaroons",
+            description="Mines are twice as efficient.",
+            price=6000000000000000000000000000000000,
+            target=FacilityTypes.MINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.MINE,
+            unlock_count=450,
+        ),
+        UpgradeTypes.MINE_MILK: UpgradeConfig(
+            name="Mine milk",
+            description="Mines are twice as efficient.",
+            price=60000000000000000000000000000000000,
+            target=FacilityTypes.MINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.MINE,
+            unlock_count=500,
+        ),
+        UpgradeTypes.MINE_AUTOMATION: UpgradeConfig(
+            name="Mine automation",
+            description="Mines are twice as efficient.",
+            price=600000000000000000000000000000000000000,
+            target=FacilityTypes.MINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.MINE,
+            unlock_count=550,
+        ),
+        UpgradeTypes.STURDIER_CONVEYOR_BELTS: UpgradeConfig(
+            name="Sturdier conveyor belts",
+            description="Factories are twice as efficient.",
+            price=1300000,
+            target=FacilityTypes.FACTORY,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FACTORY,
+            unlock_count=1,
+        ),
+        UpgradeTypes.CHILD_LABOR: UpgradeConfig(
+            name="Child labor",
+            description="Factories are twice as efficient.",
+            price=6500000,
+            target=FacilityTypes.FACTORY,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FACTORY,
+            unlock_count=5,
+        ),
+        UpgradeTypes.SWEATSHOP: UpgradeConfig(
+            name="Sweatshop",
+            description="Factories are twice as efficient.",
+            price=65000000,
+            target=FacilityTypes.FACTORY,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FACTORY,
+            unlock_count=25,
+        ),
+        UpgradeTypes.RADIUM_REACTORS: UpgradeConfig(
+            name="Radium reactors",
+            description="Factories are twice as efficient.",
+            price=6500000000,
+            target=FacilityTypes.FACTORY,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FACTORY,
+            unlock_count=50,
+        ),
+        UpgradeTypes.RECOMBOBULATORS: UpgradeConfig(
+            name="Recombobulators",
+            description="Factories are twice as efficient.",
+            price=650000000000,
+            target=FacilityTypes.FACTORY,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FACTORY,
+            unlock_count=100,
+        ),
+        UpgradeTypes.DEEP_BOP: UpgradeConfig(
+            name="Deep-bop",
+            description="Factories are twice as efficient.",
+            price=65000000000000,
+            target=FacilityTypes.FACTORY,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FACTORY,
+            unlock_count=150,
+        ),
+        UpgradeTypes.CYBORG_WORKFORCE: UpgradeConfig(
+            name="Cyborg workforce",
+            description="Factories are twice as efficient.",
+            price=65000000000000000,
+            target=FacilityTypes.FACTORY,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FACTORY,
+            unlock_count=200,
+        ),
+        UpgradeTypes.DRONE_HIVE: UpgradeConfig(
+            name="Drone hive",
+            description="Factories are twice as efficient.",
+            price=65000000000000000000,
+            target=FacilityTypes.FACTORY,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FACTORY,
+            unlock_count=250,
+        ),
+        UpgradeTypes.FACTORY_CANARIES: UpgradeConfig(
+            name="Factory canaries",
+            description="Factories are twice as efficient.",
+            price=65000000000000000000000,
+            target=FacilityTypes.FACTORY,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FACTORY,
+            unlock_count=300,
+        ),
+        UpgradeTypes.FACTORY_AUTOMATION: UpgradeConfig(
+            name="Factory automation",
+            description="Factories are twice as efficient.",
+            price=650000000000000000000000000,
+            target=FacilityTypes.FACTORY,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FACTORY,
+            unlock_count=350,
+        ),
+        UpgradeTypes.FULLFILLING_COOKIES: UpgradeConfig(
+            name="Fullfilling cookies",
+            description="Factories are twice as efficient.",
+            price=6500000000000000000000000000000,
+            target=FacilityTypes.FACTORY,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FACTORY,
+            unlock_count=400,
+        ),
+        UpgradeTypes.COOKIE_CRUMBS_RECYCLING: UpgradeConfig(
+            name="Cookie crumbs recycling",
+            description="Factories are twice as efficient.",
+            price=65000000000000000000000000000000000,
+            target=FacilityTypes.FACTORY,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FACTORY,
+            unlock_count=450,
+        ),
+        UpgradeTypes.FACTORY_AUTOMATION_2: UpgradeConfig(
+            name="Factory automation II",
+            description="Factories are twice as efficient.",
+            price=650000000000000000000000000000000000000,
+            target=FacilityTypes.FACTORY,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FACTORY,
+            unlock_count=500,
+        ),
+        UpgradeTypes.TALLER_TELLERS: UpgradeConfig(
+            name="Taller tellers",
+            description="Banks are twice as efficient.",
+            price=14000000,
+            target=FacilityTypes.BANK,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.BANK,
+            unlock_count=1,
+        ),
+        UpgradeTypes.SCISSOR_RESISTANT_CREDIT_CARDS: UpgradeConfig(
+            name="Scissor-resistant credit cards",
+            description="Banks are twice as efficient.",
+            price=70000000,
+            target=FacilityTypes.BANK,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.BANK,
+            unlock_count=5,
+        ),
+        UpgradeTypes.ACID_PROOF_VAULTS: UpgradeConfig(
+            name="Acid-proof vaults",
+            description="Banks are twice as efficient.",
+            price=700000000,
+            target=FacilityTypes.BANK,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.BANK,
+            unlock_count=25,
+        ),
+        UpgradeTypes.CHOCOLATE_COINS: UpgradeConfig(
+            name="Chocolate coins",
+            description="Banks are twice as efficient.",
+            price=70000000000,
+            target=FacilityTypes.BANK,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.BANK,
+            unlock_count=50,
+        ),
+        UpgradeTypes.EXPONENTIAL_INTEREST_RATES: UpgradeConfig(
+            name="Exponential interest rates",
+            description="Banks are twice as efficient.",
+            price=7000000000000,
+            target=FacilityTypes.BANK,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.BANK,
+            unlock_count=100,
+        ),
+        UpgradeTypes.FINANCIAL_ZEN: UpgradeConfig(
+            name="Financial zen",
+            description="Banks are twice as efficient.",
+            price=700000000000000,
+            target=FacilityTypes.BANK,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.BANK,
+            unlock_count=150,
+        ),
+        UpgradeTypes.WAY_OF_THE_WALLET: UpgradeConfig(
+            name="Way of the wallet",
+            description="Banks are twice as efficient.",
+            price=700000000000000000,
+            target=FacilityTypes.BANK,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.BANK,
+            unlock_count=200,
+        ),
+        UpgradeTypes.THE_STIMULUS_PACKAGE: UpgradeConfig(
+            name="The stimulus package",
+            description="Banks are twice as efficient.",
+            price=700000000000000000000,
+            target=FacilityTypes.BANK,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.BANK,
+            unlock_count=250,
+        ),
+        UpgradeTypes.BUDGET_CAPS: UpgradeConfig(
+            name="Budget caps",
+            description="Banks are twice as efficient.",
+            price=700000000000000000000000,
+            target=FacilityTypes.BANK,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.BANK,
+            unlock_count=300,
+        ),
+        UpgradeTypes.COOKIE_BANKS: UpgradeConfig(
+            name="Cookie banks",
+            description="Banks are twice as efficient.",
+            price=7000000000000000000000000000,
+            target=FacilityTypes.BANK,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.BANK,
+            unlock_count=350,
+        ),
+        UpgradeTypes.MEGABANKS: UpgradeConfig(
+            name="Megabanks",
+            description="Banks are twice as efficient.",
+            price=70000000000000000000000000000000,
+            target=FacilityTypes.BANK,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.BANK,
+            unlock_count=400,
+        ),
+        UpgradeTypes.BANK_AUTOMATION: UpgradeConfig(
+            name="Bank automation",
+            description="Banks are twice as efficient.",
+            price=700000000000000000000000000000000000,
+            target=FacilityTypes.BANK,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.BANK,
+            unlock_count=450,
+        ),
+        UpgradeTypes.INSURANCE_FRAUD: UpgradeConfig(
+            name="Insurance fraud",
+            description="Banks are twice as efficient.",
+            price=7000000000000000000000000000000000000000,
+            target=FacilityTypes.BANK,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.BANK,
+            unlock_count=500,
+        ),
+        UpgradeTypes.BANK_OF_BANKS: UpgradeConfig(
+            name="Bank of banks",
+            description="Banks are twice as efficient.",
+            price=70000000000000000000000000000000000000000000,
+            target=FacilityTypes.BANK,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.BANK,
+            unlock_count=550,
+        ),
+        UpgradeTypes.GOLDEN_IDOLS: UpgradeConfig(
+            name="Golden idols",
+            description="Temples are twice as efficient.",
+            price=200000000,
+            target=FacilityTypes.TEMPLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TEMPLE,
+            unlock_count=1,
+        ),
+        UpgradeTypes.SACRIFICES: UpgradeConfig(
+            name="Sacrifices",
+            description="Temples are twice as efficient.",
+            price=1000000000,
+            target=FacilityTypes.TEMPLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TEMPLE,
+            unlock_count=5,
+        ),
+        UpgradeTypes.DELICIOUS_BLESSING: UpgradeConfig(
+            name="Delicious blessing",
+            description="Temples are twice as efficient.",
+            price=10000000000,
+            target=FacilityTypes.TEMPLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TEMPLE,
+            unlock_count=25,
+        ),
+        UpgradeTypes.SUN_FESTIVAL: UpgradeConfig(
+            name="Sun festival",
+            description="Temples are twice as efficient.",
+            price=1000000000000,
+            target=FacilityTypes.TEMPLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TEMPLE,
+            unlock_count=50,
+        ),
+        UpgradeTypes.ENLARGED_PANTHEON: UpgradeConfig(
+            name="Enlarged pantheon",
+            description="Temples are twice as efficient.",
+            price=100000000000000,
+            target=FacilityTypes.TEMPLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TEMPLE,
+            unlock_count=100,
+        ),
+        UpgradeTypes.GREAT_BAKER_IN_THE_SKY: UpgradeConfig(
+            name="Great Baker in the sky",
+            description="Temples are twice as efficient.",
+            price=10000000000000000,
+            target=FacilityTypes.TEMPLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TEMPLE,
+            unlock_count=150,
+        ),
+        UpgradeTypes.CREATION_MYTH: UpgradeConfig(
+            name="Creation myth",
+            description="Temples are twice as efficient.",
+            price=10000000000000000000,
+            target=FacilityTypes.TEMPLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TEMPLE,
+            unlock_count=200,
+        ),
+        UpgradeTypes.THEOCRACY: UpgradeConfig(
+            name="Theocracy",
+            description="Temples are twice as efficient.",
+            price=10000000000000000000000,
+            target=FacilityTypes.TEMPLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TEMPLE,
+            unlock_count=250,
+        ),
+        UpgradeTypes.SICK_BEATS: UpgradeConfig(
+            name="Sick beats",
+            description="Temples are twice as efficient.",
+            price=10000000000000000000000000,
+            target=FacilityTypes.TEMPLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TEMPLE,
+            unlock_count=300,
+        ),
+        UpgradeTypes.TEMPLE_CANARIES: UpgradeConfig(
+            name="Temple canaries",
+            description="Temples are twice as efficient.",
+            price=100000000000000000000000000000,
+            target=FacilityTypes.TEMPLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TEMPLE,
+            unlock_count=350,
+        ),
+        UpgradeTypes.TEMPLE_AUTOMATION: UpgradeConfig(
+            name="Temple automation",
+            description="Temples are twice as efficient.",
+            price=1000000000000000000000000000000000,
+            target=FacilityTypes.TEMPLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TEMPLE,
+            unlock_count=400,
+        ),
+        UpgradeTypes.DEVOTED_FOLLOWERS: UpgradeConfig(
+            name="Devoted followers",
+            description="Temples are twice as efficient.",
+            price=10000000000000000000000000000000000000,
+            target=FacilityTypes.TEMPLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TEMPLE,
+            unlock_count=450,
+        ),
+        UpgradeTypes.THE_FINAL_SACRIFICE: UpgradeConfig(
+            name="The final sacrifice",
+            description="Temples are twice as efficient.",
+            price=100000000000000000000000000000000000000000,
+            target=FacilityTypes.TEMPLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TEMPLE,
+            unlock_count=500,
+        ),
+        UpgradeTypes.POINTIER_HATS: UpgradeConfig(
+            name="Pointier hats",
+            description="Wizard towers are twice as efficient.",
+            price=3300000000,
+            target=FacilityTypes.WIZARD_TOWER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.WIZARD_TOWER,
+            unlock_count=1,
+        ),
+        UpgradeTypes.BEARDIER_BEARDS: UpgradeConfig(
+            name="Beardier beards",
+            description="Wizard towers are twice as efficient.",
+            price=16500000000,
+            target=FacilityTypes.WIZARD_TOWER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.WIZARD_TOWER,
+            unlock_count=5,
+        ),
+        UpgradeTypes.ANCIENT_GRIMOIRES: UpgradeConfig(
+            name="Ancient grimoires",
+            description="Wizard towers are twice as efficient.",
+            price=165000000000,
+            target=FacilityTypes.WIZARD_TOWER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.WIZARD_TOWER,
+            unlock_count=25,
+        ),
+        UpgradeTypes.KITCHEN_CURSORS: UpgradeConfig(
+            name="Kitchen cursors",
+            description="Wizard towers are twice as efficient.",
+            price=16500000000000,
+            target=FacilityTypes.WIZARD_TOWER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.WIZARD_TOWER,
+            unlock_count=50,
+        ),
+        UpgradeTypes.SCHOOL_OF_SORCERY: UpgradeConfig(
+            name="School of sorcery",
+            description="Wizard towers are twice as efficient.",
+            price=1650000000000000,
+            target=FacilityTypes.WIZARD_TOWER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.WIZARD_TOWER,
+            unlock_count=100,
+        ),
+        UpgradeTypes.DARK_FORMULAS: UpgradeConfig(
+            name="Dark formulas",
+            description="Wizard towers are twice as efficient.",
+            price=165000000000000000,
+            target=FacilityTypes.WIZARD_TOWER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.WIZARD_TOWER,
+            unlock_count=150,
+        ),
+        UpgradeTypes.COOKIEMANCY: UpgradeConfig(
+            name="Cookiemancy",
+            description="Wizard towers are twice as efficient.",
+            price=165000000000000000000,
+            target=FacilityTypes.WIZARD_TOWER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.WIZARD_TOWER,
+            unlock_count=200,
+        ),
+        UpgradeTypes.RABBIT_TRICK: UpgradeConfig(
+            name="Rabbit trick",
+            description="Wizard towers are twice as efficient.",
+            price=165000000000000000000000,
+            target=FacilityTypes.WIZARD_TOWER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.WIZARD_TOWER,
+            unlock_count=250,
+        ),
+        UpgradeTypes.DELUXE_TAILORED_WANDS: UpgradeConfig(
+            name="Deluxe tailored wands",
+            description="Wizard towers are twice as efficient.",
+            price=165000000000000000000000000,
+            target=FacilityTypes.WIZARD_TOWER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.WIZARD_TOWER,
+            unlock_count=300,
+        ),
+        UpgradeTypes.WHOOPEE_CUSHION: UpgradeConfig(
+            name="Whoopee cushion",
+            description="Wizard towers are twice as efficient.",
+            price=1650000000000000000000000000000,
+            target=FacilityTypes.WIZARD_TOWER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.WIZARD_TOWER,
+            unlock_count=350,
+        ),
+        UpgradeTypes.WIZARD_AUTOMATION: UpgradeConfig(
+            name="Wizard automation",
+            description="Wizard towers are twice as efficient.",
+            price=16500000000000000000000000000000000,
+            target=FacilityTypes.WIZARD_TOWER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.WIZARD_TOWER,
+            unlock_count=400,
+        ),
+        UpgradeTypes.MAGIC_SHROOMS: UpgradeConfig(
+            name="Magic shrooms",
+            description="Wizard towers are twice as efficient.",
+            price=165000000000000000000000000000000000000,
+            target=FacilityTypes.WIZARD_TOWER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.WIZARD_TOWER,
+            unlock_count=450,
+        ),
+        UpgradeTypes.THE_ULTIMATE_CLICKSPORT: UpgradeConfig(
+            name="The ultimate clicksport",
+            description="Wizard towers are twice as efficient.",
+            price=1650000000000000000000000000000000000000000,
+            target=FacilityTypes.WIZARD_TOWER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.WIZARD_TOWER,
+            unlock_count=500,
+        ),
+        UpgradeTypes.VANILLA_NEBULAE: UpgradeConfig(
+            name="Vanilla nebulae",
+            description="Shipments are twice as efficient.",
+            price=51000000000,
+            target=FacilityTypes.SHIPMENT,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.SHIPMENT,
+            unlock_count=1,
+        ),
+        UpgradeTypes.WORMHOLES: UpgradeConfig(
+            name="Wormholes",
+            description="Shipments are twice as efficient.",
+            price=255000000000,
+            target=FacilityTypes.SHIPMENT,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.SHIPMENT,
+            unlock_count=5,
+        ),
+        UpgradeTypes.FREQUENT_FLYER: UpgradeConfig(
+            name="Frequent flyer",
+            description="Shipments are twice as efficient.",
+            price=2550000000000,
+            target=FacilityTypes.SHIPMENT,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.SHIPMENT,
+            unlock_count=25,
+        ),
+        UpgradeTypes.WARP_DRIVE: UpgradeConfig(
+            name="Warp drive",
+            description="Shipments are twice as efficient.",
+            price=255000000000000,
+            target=FacilityTypes.SHIPMENT,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.SHIPMENT,
+            unlock_count=50,
+        ),
+        UpgradeTypes.CHOCOLATE_MONOLITHS: UpgradeConfig(
+            name="Chocolate monoliths",
+            description="Shipments are twice as efficient.",
+            price=25500000000000000,
+            target=FacilityTypes.SHIPMENT,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.SHIPMENT,
+            unlock_count=100,
+        ),
+        UpgradeTypes.GENERATION_SHIP: UpgradeConfig(
+            name="Generation ship",
+            description="Shipments are twice as efficient.",
+            price=2550000000000000000,
+            target=FacilityTypes.SHIPMENT,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.SHIPMENT,
+            unlock_count=150,
+        ),
+        UpgradeTypes.DYSON_SPHERE: UpgradeConfig(
+            name="Dyson sphere",
+            description="Shipments are twice as efficient.",
+            price=2550000000000000000000,
+            target=FacilityTypes.SHIPMENT,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.SHIPMENT,
+            unlock_count=200,
+        ),
+        UpgradeTypes.THE_FINAL_FRONTIER: UpgradeConfig(
+            name="The final frontier",
+            description="Shipments are twice as efficient.",
+            price=2550000000000000000000000,
+            target=FacilityTypes.SHIPMENT,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.SHIPMENT,
+            unlock_count=250,
+        ),
+        UpgradeTypes.AUTOPILOT: UpgradeConfig(
+            name="Autopilot",
+            description="Shipments are twice as efficient.",
+            price=2550000000000000000000000000,
+            target=FacilityTypes.SHIPMENT,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.SHIPMENT,
+            unlock_count=300,
+        ),
+        UpgradeTypes.SHIPMENT_AUTOMATION: UpgradeConfig(
+            name="Shipment automation",
+            description="Shipments are twice as efficient.",
+            price=25500000000000000000000000000000,
+            target=FacilityTypes.SHIPMENT,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.SHIPMENT,
+            unlock_count=350,
+        ),
+        UpgradeTypes.SHIPMENT_REUSABILITY: UpgradeConfig(
+            name="Shipment reusability",
+            description="Shipments are twice as efficient.",
+            price=255000000000000000000000000000000000,
+            target=FacilityTypes.SHIPMENT,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.SHIPMENT,
+            unlock_count=400,
+        ),
+        UpgradeTypes.THE_COSMIC_BAKER: UpgradeConfig(
+            name="The Cosmic Baker",
+            description="Shipments are twice as efficient.",
+            price=2550000000000000000000000000000000000000,
+            target=FacilityTypes.SHIPMENT,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.SHIPMENT,
+            unlock_count=450,
+        ),
+        UpgradeTypes.ANTIMONY: UpgradeConfig(
+            name="Antimony",
+            description="Alchemy labs are twice as efficient.",
+            price=750000000000,
+            target=FacilityTypes.ALCHEMY_LAB,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ALCHEMY_LAB,
+            unlock_count=1,
+        ),
+        UpgradeTypes.ESSENCE_OF_DOUGH: UpgradeConfig(
+            name="Essence of dough",
+            description="Alchemy labs are twice as efficient.",
+            price=3750000000000,
+            target=FacilityTypes.ALCHEMY_LAB,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ALCHEMY_LAB,
+            unlock_count=5,
+        ),
+        UpgradeTypes.TRUE_CHOCOLATE: UpgradeConfig(
+            name="True chocolate",
+            description="Alchemy labs are twice as efficient.",
+            price=37500000000000,
+            target=FacilityTypes.ALCHEMY_LAB,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ALCHEMY_LAB,
+            unlock_count=25,
+        ),
+        UpgradeTypes.AMBROSIA: UpgradeConfig(
+            name="Ambrosia",
+            description="Alchemy labs are twice as efficient.",
+            price=3750000000000000,
+            target=FacilityTypes.ALCHEMY_LAB,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ALCHEMY_LAB,
+            unlock_count=50,
+        ),
+        UpgradeTypes.AQUA_CRUSTULAE: UpgradeConfig(
+            name="Aqua crustulae",
+            description="Alchemy labs are twice as efficient.",
+            price=375000000000000000,
+            target=FacilityTypes.ALCHEMY_LAB,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ALCHEMY_LAB,
+            unlock_count=100,
+        ),
+        UpgradeTypes.ORIGIN_CRUCIBLE: UpgradeConfig(
+            name="Origin crucible",
+            description="Alchemy labs are twice as efficient.",
+            price=37500000000000000000,
+            target=FacilityTypes.ALCHEMY_LAB,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ALCHEMY_LAB,
+            unlock_count=150,
+        ),
+        UpgradeTypes.THEORY_OF_ATOMIC_FLUIDITY: UpgradeConfig(
+            name="Theory of atomic fluidity",
+            description="Alchemy labs are twice as efficient.",
+            price=37500000000000000000000,
+            target=FacilityTypes.ALCHEMY_LAB,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ALCHEMY_LAB,
+            unlock_count=200,
+        ),
+        UpgradeTypes.BEIGE_GOO: UpgradeConfig(
+            name="Beige goo",
+            description="Alchemy labs are twice as efficient.",
+            price=37500000000000000000000000,
+            target=FacilityTypes.ALCHEMY_LAB,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ALCHEMY_LAB,
+            unlock_count=250,
+        ),
+        UpgradeTypes.THE_PHILOSOPHERS_COOKIE: UpgradeConfig(
+            name="The philosopher's cookie",
+            description="Alchemy labs are twice as efficient.",
+            price=37500000000000000000000000000,
+            target=FacilityTypes.ALCHEMY_LAB,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ALCHEMY_LAB,
+            unlock_count=300,
+        ),
+        UpgradeTypes.ALCHEMY_AUTOMATION: UpgradeConfig(
+            name="Alchemy automation",
+            description="Alchemy labs are twice as efficient.",
+            price=375000000000000000000000000000000,
+            target=FacilityTypes.ALCHEMY_LAB,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ALCHEMY_LAB,
+            unlock_count=350,
+        ),
+        UpgradeTypes.THE_MIDAS_TOUCH: UpgradeConfig(
+            name="The Midas touch",
+            description="Alchemy labs are twice as efficient.",
+            price=3750000000000000000000000000000000000,
+            target=FacilityTypes.ALCHEMY_LAB,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ALCHEMY_LAB,
+            unlock_count=400,
+        ),
+        UpgradeTypes.BEYOND_GOLD: UpgradeConfig(
+            name="Beyond gold",
+            description="Alchemy labs are twice as efficient.",
+            price=37500000000000000000000000000000000000000,
+            target=FacilityTypes.ALCHEMY_LAB,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ALCHEMY_LAB,
+            unlock_count=450,
+        ),
+        UpgradeTypes.ANCIENT_TABLET: UpgradeConfig(
+            name="Ancient tablet",
+            description="Portals are twice as efficient.",
+            price=10000000000000,
+            target=FacilityTypes.PORTAL,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PORTAL,
+            unlock_count=1,
+        ),
+        UpgradeTypes.INSANE_OATLING_WORKERS: UpgradeConfig(
+            name="Insane oatling workers",
+            description="Portals are twice as efficient.",
+            price=50000000000000,
+            target=FacilityTypes.PORTAL,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PORTAL,
+            unlock_count=5,
+        ),
+        UpgradeTypes.SOUL_BOND: UpgradeConfig(
+            name="Soul bond",
+            description="Portals are twice as efficient.",
+            price=500000000000000,
+            target=FacilityTypes.PORTAL,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PORTAL,
+            unlock_count=25,
+        ),
+        UpgradeTypes.SANITY_DANCE: UpgradeConfig(
+            name="Sanity dance",
+            description="Portals are twice as efficient.",
+            price=50000000000000000,
+            target=FacilityTypes.PORTAL,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PORTAL,
+            unlock_count=50,
+        ),
+        UpgradeTypes.BRANE_TRANSPLANT: UpgradeConfig(
+            name="Brane transplant",
+            description="Portals are twice as efficient.",
+            price=5000000000000000000,
+            target=FacilityTypes.PORTAL,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PORTAL,
+            unlock_count=100,
+        ),
+        UpgradeTypes.DEITY_SIZED_PORTALS: UpgradeConfig(
+            name="Deity-sized portals",
+            description="Portals are twice as efficient.",
+            price=500000000000000000000,
+            target=FacilityTypes.PORTAL,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PORTAL,
+            unlock_count=150,
+        ),
+        UpgradeTypes.END_OF_TIMES_BACK_UP_PLAN: UpgradeConfig(
+            name="End of times back-up plan",
+            description="Portals are twice as efficient.",
+            price=500000000000000000000000,
+            target=FacilityTypes.PORTAL,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PORTAL,
+            unlock_count=200,
+        ),
+        UpgradeTypes.MADDENING_CHANTS: UpgradeConfig(
+            name="Maddening chants",
+            description="Portals are twice as efficient.",
+            price=500000000000000000000000000,
+            target=FacilityTypes.PORTAL,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PORTAL,
+            unlock_count=250,
+        ),
+        UpgradeTypes.THE_REAL_WORLD: UpgradeConfig(
+            name="The real world",
+            description="Portals are twice as efficient.",
+            price=500000000000000000000000000000,
+            target=FacilityTypes.PORTAL,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PORTAL,
+            unlock_count=300,
+        ),
+        UpgradeTypes.PORTAL_AUTOMATION: UpgradeConfig(
+            name="Portal automation",
+            description="Portals are twice as efficient.",
+            price=5000000000000000000000000000000000,
+            target=FacilityTypes.PORTAL,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PORTAL,
+            unlock_count=350,
+        ),
+        UpgradeTypes.PORTAL_MAINTENANCE: UpgradeConfig(
+            name="Portal maintenance",
+            description="Portals are twice as efficient.",
+            price=50000000000000000000000000000000000000,
+            target=FacilityTypes.PORTAL,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PORTAL,
+            unlock_count=400,
+        ),
+        UpgradeTypes.COOKIE_DIMENSION: UpgradeConfig(
+            name="Cookie dimension",
+            description="Portals are twice as efficient.",
+            price=500000000000000000000000000000000000000000,
+            target=FacilityTypes.PORTAL,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PORTAL,
+            unlock_count=450,
+        ),
+        UpgradeTypes.FLUX_CAPACITORS: UpgradeConfig(
+            name="Flux capacitors",
+            description="Time machines are twice as efficient.",
+            price=140000000000000,
+            target=FacilityTypes.TIME_MACHINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TIME_MACHINE,
+            unlock_count=1,
+        ),
+        UpgradeTypes.TIME_PARADOX_RESOLVER: UpgradeConfig(
+            name="Time paradox resolver",
+            description="Time machines are twice as efficient.",
+            price=700000000000000,
+            target=FacilityTypes.TIME_MACHINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TIME_MACHINE,
+            unlock_count=5,
+        ),
+        UpgradeTypes.QUANTUM_CONUNDRUM: UpgradeConfig(
+            name="Quantum conundrum",
+            description="Time machines are twice as efficient.",
+            price=7000000000000000,
+            target=FacilityTypes.TIME_MACHINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TIME_MACHINE,
+            unlock_count=25,
+        ),
+        UpgradeTypes.CAUSALITY_ENFORCER: UpgradeConfig(
+            name="Causality enforcer",
+            description="Time machines are twice as efficient.",
+            price=700000000000000000,
+            target=FacilityTypes.TIME_MACHINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TIME_MACHINE,
+            unlock_count=50,
+        ),
+        UpgradeTypes.YESTERMORROW_COMPARATORS: UpgradeConfig(
+            name="Yestermorrow comparators",
+            description="Time machines are twice as efficient.",
+            price=70000000000000000000,
+            target=FacilityTypes.TIME_MACHINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TIME_MACHINE,
+            unlock_count=100,
+        ),
+        UpgradeTypes.FAR_FUTURE_ENACTMENT: UpgradeConfig(
+            name="Far future enactment",
+            description="Time machines are twice as efficient.",
+            price=7000000000000000000000,
+            target=FacilityTypes.TIME_MACHINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TIME_MACHINE,
+            unlock_count=150,
+        ),
+        UpgradeTypes.GREAT_LOOP_HYPOTHESIS: UpgradeConfig(
+            name="Great loop hypothesis",
+            description="Time machines are twice as efficient.",
+            price=7000000000000000000000000,
+            target=FacilityTypes.TIME_MACHINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TIME_MACHINE,
+            unlock_count=200,
+        ),
+        UpgradeTypes.COOKIETOPIAN_MOMENTS_OF_MAYBE: UpgradeConfig(
+            name="Cookietopian moments of maybe",
+            description="Time machines are twice as efficient.",
+            price=7000000000000000000000000000,
+            target=FacilityTypes.TIME_MACHINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TIME_MACHINE,
+            unlock_count=250,
+        ),
+        UpgradeTypes.SECOND_SECONDS: UpgradeConfig(
+            name="Second seconds",
+            description="Time machines are twice as efficient.",
+            price=7000000000000000000000000000000,
+            target=FacilityTypes.TIME_MACHINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TIME_MACHINE,
+            unlock_count=300,
+        ),
+        UpgradeTypes.TIME_MACHINE_AUTOMATION: UpgradeConfig(
+            name="Time machine automation",
+            description="Time machines are twice as efficient.",
+            price=70000000000000000000000000000000000,
+            target=FacilityTypes.TIME_MACHINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TIME_MACHINE,
+            unlock_count=350,
+        ),
+        UpgradeTypes.NOSTALGIA_TRIP: UpgradeConfig(
+            name="Nostalgia trip",
+            description="Time machines are twice as efficient.",
+            price=700000000000000000000000000000000000000,
+            target=FacilityTypes.TIME_MACHINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TIME_MACHINE,
+            unlock_count=400,
+        ),
+        UpgradeTypes.EPOCH_MANIPULATION: UpgradeConfig(
+            name="Epoch manipulation",
+            description="Time machines are twice as efficient.",
+            price=7000000000000000000000000000000000000000000,
+            target=FacilityTypes.TIME_MACHINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.TIME_MACHINE,
+            unlock_count=450,
+        ),
+        UpgradeTypes.SUGAR_BOSONS: UpgradeConfig(
+            name="Sugar bosons",
+            description="Antimatter condensers are twice as efficient.",
+            price=1700000000000000,
+            target=FacilityTypes.ANTIMATTER_CONDENSER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ANTIMATTER_CONDENSER,
+            unlock_count=1,
+        ),
+        UpgradeTypes.STRING_THEORY: UpgradeConfig(
+            name="String theory",
+            description="Antimatter condensers are twice as efficient.",
+            price=8500000000000000,
+            target=FacilityTypes.ANTIMATTER_CONDENSER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ANTIMATTER_CONDENSER,
+            unlock_count=5,
+        ),
+        UpgradeTypes.LARGE_MACARON_COLLIDER: UpgradeConfig(
+            name="Large macaron collider",
+            description="Antimatter condensers are twice as efficient.",
+            price=85000000000000000,
+            target=FacilityTypes.ANTIMATTER_CONDENSER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ANTIMATTER_CONDENSER,
+            unlock_count=25,
+        ),
+        UpgradeTypes.BIG_BANG_BAKE: UpgradeConfig(
+            name="Big bang bake",
+            description="Antimatter condensers are twice as efficient.",
+            price=8500000000000000000,
+            target=FacilityTypes.ANTIMATTER_CONDENSER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ANTIMATTER_CONDENSER,
+            unlock_count=50,
+        ),
+        UpgradeTypes.REVERSE_CYCLOTRONS: UpgradeConfig(
+            name="Reverse cyclotrons",
+            description="Antimatter condensers are twice as efficient.",
+            price=850000000000000000000,
+            target=FacilityTypes.ANTIMATTER_CONDENSER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ANTIMATTER_CONDENSER,
+            unlock_count=100,
+        ),
+        UpgradeTypes.NANOCOSMICS: UpgradeConfig(
+            name="Nanocosmics",
+            description="Antimatter condensers are twice as efficient.",
+            price=85000000000000000000000,
+            target=FacilityTypes.ANTIMATTER_CONDENSER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ANTIMATTER_CONDENSER,
+            unlock_count=150,
+        ),
+        UpgradeTypes.THE_PULSE: UpgradeConfig(
+            name="The Pulse",
+            description="Antimatter condensers are twice as efficient.",
+            price=85000000000000000000000000,
+            target=FacilityTypes.ANTIMATTER_CONDENSER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ANTIMATTER_CONDENSER,
+            unlock_count=200,
+        ),
+        UpgradeTypes.SOME_OTHER_SUPER_PARTICLE: UpgradeConfig(
+            name="Some other super particle",
+            description="Antimatter condensers are twice as efficient.",
+            price=85000000000000000000000000000,
+            target=FacilityTypes.ANTIMATTER_CONDENSER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ANTIMATTER_CONDENSER,
+            unlock_count=250,
+        ),
+        UpgradeTypes.QUANTUM_OVENPROOFING: UpgradeConfig(
+            name="Quantum ovenproofing",
+            description="Antimatter condensers are twice as efficient.",
+            price=85000000000000000000000000000000,
+            target=FacilityTypes.ANTIMATTER_CONDENSER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ANTIMATTER_CONDENSER,
+            unlock_count=300,
+        ),
+        UpgradeTypes.ANTIMATTER_AUTOMATION: UpgradeConfig(
+            name="Antimatter automation",
+            description="Antimatter condensers are twice as efficient.",
+            price=850000000000000000000000000000000000,
+            target=FacilityTypes.ANTIMATTER_CONDENSER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ANTIMATTER_CONDENSER,
+            unlock_count=350,
+        ),
+        UpgradeTypes.PRIMORDIAL_PARTICLE: UpgradeConfig(
+            name="Primordial particle",
+            description="Antimatter condensers are twice as efficient.",
+            price=8500000000000000000000000000000000000000,
+            target=FacilityTypes.ANTIMATTER_CONDENSER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ANTIMATTER_CONDENSER,
+            unlock_count=400,
+        ),
+        UpgradeTypes.ANTI_UNIVERSE: UpgradeConfig(
+            name="Anti-universe",
+            description="Antimatter condensers are twice as efficient.",
+            price=85000000000000000000000000000000000000000000,
+            target=FacilityTypes.ANTIMATTER_CONDENSER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.ANTIMATTER_CONDENSER,
+            unlock_count=450,
+        ),
+        UpgradeTypes.GEM_POLISH: UpgradeConfig(
+            name="Gem polish",
+            description="Prisms are twice as efficient.",
+            price=21000000000000000,
+            target=FacilityTypes.PRISM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PRISM,
+            unlock_count=1,
+        ),
+        UpgradeTypes.NINTH_COLOR: UpgradeConfig(
+            name="9th color",
+            description="Prisms are twice as efficient.",
+            price=105000000000000000,
+            target=FacilityTypes.PRISM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PRISM,
+            unlock_count=5,
+        ),
+        UpgradeTypes.CHOCOLATE_LIGHT: UpgradeConfig(
+            name="Chocolate light",
+            description="Prisms are twice as efficient.",
+            price=1050000000000000000,
+            target=FacilityTypes.PRISM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PRISM,
+            unlock_count=25,
+        ),
+        UpgradeTypes.GRAINBOW: UpgradeConfig(
+            name="Grainbow",
+            description="Prisms are twice as efficient.",
+            price=105000000000000000000,
+            target=FacilityTypes.PRISM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PRISM,
+            unlock_count=50,
+        ),
+        UpgradeTypes.PURE_COSMIC_LIGHT: UpgradeConfig(
+            name="Pure cosmic light",
+            description="Prisms are twice as efficient.",
+            price=10500000000000000000000,
+            target=FacilityTypes.PRISM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PRISM,
+            unlock_count=100,
+        ),
+        UpgradeTypes.GLOW_IN_THE_DARK: UpgradeConfig(
+            name="Glow-in-the-dark",
+            description="Prisms are twice as efficient.",
+            price=1050000000000000000000000,
+            target=FacilityTypes.PRISM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PRISM,
+            unlock_count=150,
+        ),
+        UpgradeTypes.LENSES_OF_TRUTH: UpgradeConfig(
+            name="Lenses of truth",
+            description="Prisms are twice as efficient.",
+            price=1050000000000000000000000000,
+            target=FacilityTypes.PRISM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PRISM,
+            unlock_count=200,
+        ),
+        UpgradeTypes.RECURSIVE_MIRRORS: UpgradeConfig(
+            name="Recursive mirrors",
+            description="Prisms are twice as efficient.",
+            price=1050000000000000000000000000000,
+            target=FacilityTypes.PRISM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PRISM,
+            unlock_count=250,
+        ),
+        UpgradeTypes.CRYSTAL_MEMORIES: UpgradeConfig(
+            name="Crystal memories",
+            description="Prisms are twice as efficient.",
+            price=1050000000000000000000000000000000,
+            target=FacilityTypes.PRISM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PRISM,
+            unlock_count=300,
+        ),
+        UpgradeTypes.PRISM_AUTOMATION: UpgradeConfig(
+            name="Prism automation",
+            description="Prisms are twice as efficient.",
+            price=10500000000000000000000000000000000000,
+            target=FacilityTypes.PRISM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PRISM,
+            unlock_count=350,
+        ),
+        UpgradeTypes.COLORBLIND_GLASSES: UpgradeConfig(
+            name="Colorblind glasses",
+            description="Prisms are twice as efficient.",
+            price=105000000000000000000000000000000000000000,
+            target=FacilityTypes.PRISM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PRISM,
+            unlock_count=400,
+        ),
+        UpgradeTypes.SHIMMERING_HORIZON: UpgradeConfig(
+            name="Shimmering horizon",
+            description="Prisms are twice as efficient.",
+            price=1050000000000000000000000000000000000000000000,
+            target=FacilityTypes.PRISM,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PRISM,
+            unlock_count=450,
+        ),
+        UpgradeTypes.YOUR_LUCKY_COOKIE: UpgradeConfig(
+            name="Your lucky cookie",
+            description="Chancemakers are twice as efficient.",
+            price=260000000000000000,
+            target=FacilityTypes.CHANCE_MAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CHANCE_MAKER,
+            unlock_count=1,
+        ),
+        UpgradeTypes.ALL_OR_NOTHING: UpgradeConfig(
+            name="All or nothing",
+            description="Chancemakers are twice as efficient.",
+            price=1300000000000000000,
+            target=FacilityTypes.CHANCE_MAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CHANCE_MAKER,
+            unlock_count=5,
+        ),
+        UpgradeTypes.TURBOCHARGED_LUCK: UpgradeConfig(
+            name="Turbocharged luck",
+            description="Chancemakers are twice as efficient.",
+            price=13000000000000000000,
+            target=FacilityTypes.CHANCE_MAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CHANCE_MAKER,
+            unlock_count=25,
+        ),
+        UpgradeTypes.LUCKY_DIGITS: UpgradeConfig(
+            name="Lucky digits",
+            description="Chancemakers are twice as efficient.",
+            price=1300000000000000000000,
+            target=FacilityTypes.CHANCE_MAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CHANCE_MAKER,
+            unlock_count=50,
+        ),
+        UpgradeTypes.LUCKY_PAYOUT: UpgradeConfig(
+            name="Lucky payout",
+            description="Chancemakers are twice as efficient.",
+            price=130000000000000000000000,
+            target=FacilityTypes.CHANCE_MAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CHANCE_MAKER,
+            unlock_count=100,
+        ),
+        UpgradeTypes.LUCKY_FINGERS: UpgradeConfig(
+            name="Lucky fingers",
+            description="Chancemakers are twice as efficient.",
+            price=13000000000000000000000000,
+            target=FacilityTypes.CHANCE_MAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CHANCE_MAKER,
+            unlock_count=150,
+        ),
+        UpgradeTypes.ENTANGLEMENT: UpgradeConfig(
+            name="Entanglement",
+            description="Chancemakers are twice as efficient.",
+            price=13000000000000000000000000000,
+            target=FacilityTypes.CHANCE_MAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CHANCE_MAKER,
+            unlock_count=200,
+        ),
+        UpgradeTypes.JUST_IN_TIME: UpgradeConfig(
+            name="Just in time",
+            description="Chancemakers are twice as efficient.",
+            price=13000000000000000000000000000000,
+            target=FacilityTypes.CHANCE_MAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CHANCE_MAKER,
+            unlock_count=250,
+        ),
+        UpgradeTypes.WAGER_WAR: UpgradeConfig(
+            name="Wager war",
+            description="Chancemakers are twice as efficient.",
+            price=13000000000000000000000000000000000,
+            target=FacilityTypes.CHANCE_MAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CHANCE_MAKER,
+            unlock_count=300,
+        ),
+        UpgradeTypes.CHANCEMAKER_AUTOMATION: UpgradeConfig(
+            name="Chancemaker automation",
+            description="Chancemakers are twice as efficient.",
+            price=130000000000000000000000000000000000000,
+            target=FacilityTypes.CHANCE_MAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CHANCE_MAKER,
+            unlock_count=350,
+        ),
+        UpgradeTypes.LUCKY_GRANDMA: UpgradeConfig(
+            name="Lucky grandma",
+            description="Chancemakers are twice as efficient.",
+            price=1300000000000000000000000000000000000000000,
+            target=FacilityTypes.CHANCE_MAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CHANCE_MAKER,
+            unlock_count=400,
+        ),
+        UpgradeTypes.THE_ULTIMATE_GAMBLE: UpgradeConfig(
+            name="The ultimate gamble",
+            description="Chancemakers are twice as efficient.",
+            price=13000000000000000000000000000000000000000000000,
+            target=FacilityTypes.CHANCE_MAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CHANCE_MAKER,
+            unlock_count=450,
+        ),
+        UpgradeTypes.METABAKERIES: UpgradeConfig(
+            name="Metabakeries",
+            description="Fractal engines are twice as efficient.",
+            price=3100000000000000000,
+            target=FacilityTypes.FRACTAL_ENGINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FRACTAL_ENGINE,
+            unlock_count=1,
+        ),
+        UpgradeTypes.MANDELBROWN_SUGAR: UpgradeConfig(
+            name="Mandelbrown sugar",
+            description="Fractal engines are twice as efficient.",
+            price=15500000000000000000,
+            target=FacilityTypes.FRACTAL_ENGINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FRACTAL_ENGINE,
+            unlock_count=5,
+        ),
+        UpgradeTypes.FRACTOIDS: UpgradeConfig(
+            name="Fractoids",
+            description="Fractal engines are twice as efficient.",
+            price=155000000000000000000,
+            target=FacilityTypes.FRACTAL_ENGINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FRACTAL_ENGINE,
+            unlock_count=25,
+        ),
+        UpgradeTypes.NESTED_UNIVERSE_THEORY: UpgradeConfig(
+            name="Nested universe theory",
+            description="Fractal engines are twice as efficient.",
+            price=15500000000000000000000,
+            target=FacilityTypes.FRACTAL_ENGINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FRACTAL_ENGINE,
+            unlock_count=50,
+        ),
+        UpgradeTypes.MENGER_SPONGE_CAKE: UpgradeConfig(
+            name="Menger sponge cake",
+            description="Fractal engines are twice as efficient.",
+            price=1550000000000000000000000,
+            target=FacilityTypes.FRACTAL_ENGINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FRACTAL_ENGINE,
+            unlock_count=100,
+        ),
+        UpgradeTypes.ONE_PARTICULARLY_GOOD_INFINITY: UpgradeConfig(
+            name="One particularly good infinity",
+            description="Fractal engines are twice as efficient.",
+            price=155000000000000000000000000,
+            target=FacilityTypes.FRACTAL_ENGINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FRACTAL_ENGINE,
+            unlock_count=150,
+        ),
+        UpgradeTypes.INFINITE_SUGARCUBES: UpgradeConfig(
+            name="Infinite sugarcubes",
+            description="Fractal engines are twice as efficient.",
+            price=155000000000000000000000000000,
+            target=FacilityTypes.FRACTAL_ENGINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FRACTAL_ENGINE,
+            unlock_count=200,
+        ),
+        UpgradeTypes.ENDLESS_BOOK_OF_PROSE: UpgradeConfig(
+            name="Endless book of prose",
+            description="Fractal engines are twice as efficient.",
+            price=155000000000000000000000000000000,
+            target=FacilityTypes.FRACTAL_ENGINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FRACTAL_ENGINE,
+            unlock_count=250,
+        ),
+        UpgradeTypes.DOUGH_BLOOMING: UpgradeConfig(
+            name="Dough blooming",
+            description="Fractal engines are twice as efficient.",
+            price=155000000000000000000000000000000000,
+            target=FacilityTypes.FRACTAL_ENGINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FRACTAL_ENGINE,
+            unlock_count=300,
+        ),
+        UpgradeTypes.FRACTAL_ENGINE_AUTOMATION: UpgradeConfig(
+            name="Fractal engine automation",
+            description="Fractal engines are twice as efficient.",
+            price=1550000000000000000000000000000000000000,
+            target=FacilityTypes.FRACTAL_ENGINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FRACTAL_ENGINE,
+            unlock_count=350,
+        ),
+        UpgradeTypes.DOUGHSCENSION: UpgradeConfig(
+            name="Doughscension",
+            description="Fractal engines are twice as efficient.",
+            price=15500000000000000000000000000000000000000000,
+            target=FacilityTypes.FRACTAL_ENGINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FRACTAL_ENGINE,
+            unlock_count=400,
+        ),
+        UpgradeTypes.RECURSIVE_DELICACIES: UpgradeConfig(
+            name="Recursive delicacies",
+            description="Fractal engines are twice as efficient.",
+            price=155000000000000000000000000000000000000000000000,
+            target=FacilityTypes.FRACTAL_ENGINE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.FRACTAL_ENGINE,
+            unlock_count=450,
+        ),
+        UpgradeTypes.ALERT_JS: UpgradeConfig(
+            name="alert.py",
+            description="Python consoles are twice as efficient.",
+            price=71000000000000000000,
+            target=FacilityTypes.PYTHON_CONSOLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PYTHON_CONSOLE,
+            unlock_count=1,
+        ),
+        UpgradeTypes.EVAL_JS: UpgradeConfig(
+            name="eval.py",
+            description="Python consoles are twice as efficient.",
+            price=355000000000000000000,
+            target=FacilityTypes.PYTHON_CONSOLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PYTHON_CONSOLE,
+            unlock_count=5,
+        ),
+        UpgradeTypes.TOSTRING_JS: UpgradeConfig(
+            name="__str__.py",
+            description="Python consoles are twice as efficient.",
+            price=3550000000000000000000,
+            target=FacilityTypes.PYTHON_CONSOLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PYTHON_CONSOLE,
+            unlock_count=25,
+        ),
+        UpgradeTypes.MOAR_MONEYS_JS: UpgradeConfig(
+            name="moar_moneys.py",
+            description="Python consoles are twice as efficient.",
+            price=355000000000000000000000,
+            target=FacilityTypes.PYTHON_CONSOLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PYTHON_CONSOLE,
+            unlock_count=50,
+        ),
+        UpgradeTypes.ALGORITHM_GOODNESS: UpgradeConfig(
+            name="Algorithm goodness",
+            description="Python consoles are twice as efficient.",
+            price=35500000000000000000000000,
+            target=FacilityTypes.PYTHON_CONSOLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PYTHON_CONSOLE,
+            unlock_count=100,
+        ),
+        UpgradeTypes.SOURCE_CODE: UpgradeConfig(
+            name="Source code",
+            description="Python consoles are twice as efficient.",
+            price=3550000000000000000000000000,
+            target=FacilityTypes.PYTHON_CONSOLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PYTHON_CONSOLE,
+            unlock_count=150,
+        ),
+        UpgradeTypes.AUTOCOMPLETE: UpgradeConfig(
+            name="Autocomplete",
+            description="Python consoles are twice as efficient.",
+            price=3550000000000000000000000000000,
+            target=FacilityTypes.PYTHON_CONSOLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PYTHON_CONSOLE,
+            unlock_count=200,
+        ),
+        UpgradeTypes.AI_BAKERS: UpgradeConfig(
+            name="AI bakers",
+            description="Python consoles are twice as efficient.",
+            price=3550000000000000000000000000000000,
+            target=FacilityTypes.PYTHON_CONSOLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PYTHON_CONSOLE,
+            unlock_count=250,
+        ),
+        UpgradeTypes.SENTIENT_CODE: UpgradeConfig(
+            name="Sentient code",
+            description="Python consoles are twice as efficient.",
+            price=3550000000000000000000000000000000000,
+            target=FacilityTypes.PYTHON_CONSOLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PYTHON_CONSOLE,
+            unlock_count=300,
+        ),
+        UpgradeTypes.CONSOLE_AUTOMATION: UpgradeConfig(
+            name="Console automation",
+            description="Python consoles are twice as efficient.",
+            price=35500000000000000000000000000000000000000,
+            target=FacilityTypes.PYTHON_CONSOLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PYTHON_CONSOLE,
+            unlock_count=350,
+        ),
+        UpgradeTypes.MALWARE: UpgradeConfig(
+            name="Malware",
+            description="Python consoles are twice as efficient.",
+            price=355000000000000000000000000000000000000000000,
+            target=FacilityTypes.PYTHON_CONSOLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PYTHON_CONSOLE,
+            unlock_count=400,
+        ),
+        UpgradeTypes.SUPERBUG: UpgradeConfig(
+            name="Superbug",
+            description="Python consoles are twice as efficient.",
+            price=3550000000000000000000000000000000000000000000000,
+            target=FacilityTypes.PYTHON_CONSOLE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.PYTHON_CONSOLE,
+            unlock_count=450,
+        ),
+        UpgradeTypes.MANIFEST_DESTINY: UpgradeConfig(
+            name="Manifest destiny",
+            description="Idleverses are twice as efficient.",
+            price=12000000000000000000000,
+            target=FacilityTypes.IDLEVERSE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.IDLEVERSE,
+            unlock_count=1,
+        ),
+        UpgradeTypes.THE_MULTIVERSE_IN_A_NUTSHELL: UpgradeConfig(
+            name="The multiverse in a nutshell",
+            description="Idleverses are twice as efficient.",
+            price=60000000000000000000000,
+            target=FacilityTypes.IDLEVERSE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.IDLEVERSE,
+            unlock_count=5,
+        ),
+        UpgradeTypes.ALL_CONSUMING: UpgradeConfig(
+            name="All-consuming",
+            description="Idleverses are twice as efficient.",
+            price=600000000000000000000000,
+            target=FacilityTypes.IDLEVERSE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.IDLEVERSE,
+            unlock_count=25,
+        ),
+        UpgradeTypes.ETERNAL_RECURSION: UpgradeConfig(
+            name="Eternal recursion",
+            description="Idleverses are twice as efficient.",
+            price=60000000000000000000000000,
+            target=FacilityTypes.IDLEVERSE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.IDLEVERSE,
+            unlock_count=50,
+        ),
+        UpgradeTypes.PARA_REALITY_ADAPTATION: UpgradeConfig(
+            name="Para-reality adaptation",
+            description="Idleverses are twice as efficient.",
+            price=6000000000000000000000000000,
+            target=FacilityTypes.IDLEVERSE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.IDLEVERSE,
+            unlock_count=100,
+        ),
+        UpgradeTypes.HYPNODRONES: UpgradeConfig(
+            name="Hypnodrones",
+            description="Idleverses are twice as efficient.",
+            price=600000000000000000000000000000,
+            target=FacilityTypes.IDLEVERSE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.IDLEVERSE,
+            unlock_count=150,
+        ),
+        UpgradeTypes.DARK_MATTER_INTERFERENCE: UpgradeConfig(
+            name="Dark matter interference",
+            description="Idleverses are twice as efficient.",
+            price=600000000000000000000000000000000,
+            target=FacilityTypes.IDLEVERSE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.IDLEVERSE,
+            unlock_count=200,
+        ),
+        UpgradeTypes.MULTIVERSE_MAYHEM: UpgradeConfig(
+            name="Multiverse mayhem",
+            description="Idleverses are twice as efficient.",
+            price=600000000000000000000000000000000000,
+            target=FacilityTypes.IDLEVERSE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.IDLEVERSE,
+            unlock_count=250,
+        ),
+        UpgradeTypes.LIGHT_SPEED_IDLEVERSE: UpgradeConfig(
+            name="Light-speed Idleverse",
+            description="Idleverses are twice as efficient.",
+            price=600000000000000000000000000000000000000,
+            target=FacilityTypes.IDLEVERSE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.IDLEVERSE,
+            unlock_count=300,
+        ),
+        UpgradeTypes.IDLEVERSE_AUTOMATION: UpgradeConfig(
+            name="Idleverse automation",
+            description="Idleverses are twice as efficient.",
+            price=6000000000000000000000000000000000000000000,
+            target=FacilityTypes.IDLEVERSE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.IDLEVERSE,
+            unlock_count=350,
+        ),
+        UpgradeTypes.SELF_CONTAINED_REALITY: UpgradeConfig(
+            name="Self-contained reality",
+            description="Idleverses are twice as efficient.",
+            price=60000000000000000000000000000000000000000000000,
+            target=FacilityTypes.IDLEVERSE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.IDLEVERSE,
+            unlock_count=400,
+        ),
+        UpgradeTypes.ENDLESS_LOOP: UpgradeConfig(
+            name="Endless loop",
+            description="Idleverses are twice as efficient.",
+            price=600000000000000000000000000000000000000000000000000,
+            target=FacilityTypes.IDLEVERSE,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.IDLEVERSE,
+            unlock_count=450,
+        ),
+        UpgradeTypes.NEURAL_NETWORKS: UpgradeConfig(
+            name="Neural networks",
+            description="Cortex bakers are twice as efficient.",
+            price=1900000000000000000000000,
+            target=FacilityTypes.CORTEX_BAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CORTEX_BAKER,
+            unlock_count=1,
+        ),
+        UpgradeTypes.BRAIN_TRUST: UpgradeConfig(
+            name="Brain trust",
+            description="Cortex bakers are twice as efficient.",
+            price=9500000000000000000000000,
+            target=FacilityTypes.CORTEX_BAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CORTEX_BAKER,
+            unlock_count=5,
+        ),
+        UpgradeTypes.MEMORY_PALACES: UpgradeConfig(
+            name="Memory palaces",
+            description="Cortex bakers are twice as efficient.",
+            price=95000000000000000000000000,
+            target=FacilityTypes.CORTEX_BAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CORTEX_BAKER,
+            unlock_count=25,
+        ),
+        UpgradeTypes.QUANTUM_MINDS: UpgradeConfig(
+            name="Quantum minds",
+            description="Cortex bakers are twice as efficient.",
+            price=9500000000000000000000000000,
+            target=FacilityTypes.CORTEX_BAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CORTEX_BAKER,
+            unlock_count=50,
+        ),
+        UpgradeTypes.SYNTHETIC_SYNAPSE: UpgradeConfig(
+            name="Synthetic synapse",
+            description="Cortex bakers are twice as efficient.",
+            price=950000000000000000000000000000,
+            target=FacilityTypes.CORTEX_BAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CORTEX_BAKER,
+            unlock_count=100,
+        ),
+        UpgradeTypes.COLLECTIVE_THINKING: UpgradeConfig(
+            name="Collective thinking",
+            description="Cortex bakers are twice as efficient.",
+            price=95000000000000000000000000000000,
+            target=FacilityTypes.CORTEX_BAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CORTEX_BAKER,
+            unlock_count=150,
+        ),
+        UpgradeTypes.HIVE_MIND: UpgradeConfig(
+            name="Hive mind",
+            description="Cortex bakers are twice as efficient.",
+            price=95000000000000000000000000000000000,
+            target=FacilityTypes.CORTEX_BAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CORTEX_BAKER,
+            unlock_count=200,
+        ),
+        UpgradeTypes.CORTEX_CONSCIOUSNESS: UpgradeConfig(
+            name="Cortex consciousness",
+            description="Cortex bakers are twice as efficient.",
+            price=95000000000000000000000000000000000000,
+            target=FacilityTypes.CORTEX_BAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CORTEX_BAKER,
+            unlock_count=250,
+        ),
+        UpgradeTypes.BRAINSTORM: UpgradeConfig(
+            name="Brainstorm",
+            description="Cortex bakers are twice as efficient.",
+            price=95000000000000000000000000000000000000000,
+            target=FacilityTypes.CORTEX_BAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CORTEX_BAKER,
+            unlock_count=300,
+        ),
+        UpgradeTypes.CORTEX_AUTOMATION: UpgradeConfig(
+            name="Cortex automation",
+            description="Cortex bakers are twice as efficient.",
+            price=950000000000000000000000000000000000000000000,
+            target=FacilityTypes.CORTEX_BAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CORTEX_BAKER,
+            unlock_count=350,
+        ),
+        UpgradeTypes.DREAM_BAKER: UpgradeConfig(
+            name="Dream baker",
+            description="Cortex bakers are twice as efficient.",
+            price=9500000000000000000000000000000000000000000000000,
+            target=FacilityTypes.CORTEX_BAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CORTEX_BAKER,
+            unlock_count=400,
+        ),
+        UpgradeTypes.PSYCHIC_COOKIES: UpgradeConfig(
+            name="Psychic cookies",
+            description="Cortex bakers are twice as efficient.",
+            price=95000000000000000000000000000000000000000000000000000,
+            target=FacilityTypes.CORTEX_BAKER,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.CORTEX_BAKER,
+            unlock_count=450,
+        ),
+        UpgradeTypes.ME_MYSELF_AND_I: UpgradeConfig(
+            name="Me, myself, and I",
+            description="You are twice as efficient.",
+            price=540000000000000000000000000000,
+            target=FacilityTypes.YOU,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.YOU,
+            unlock_count=1,
+        ),
+        UpgradeTypes.SOUL_SEARCH: UpgradeConfig(
+            name="Soul search",
+            description="You are twice as efficient.",
+            price=2700000000000000000000000000000,
+            target=FacilityTypes.YOU,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.YOU,
+            unlock_count=5,
+        ),
+        UpgradeTypes.EXISTENTIAL_COOKIES: UpgradeConfig(
+            name="Existential cookies",
+            description="You are twice as efficient.",
+            price=27000000000000000000000000000000,
+            target=FacilityTypes.YOU,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.YOU,
+            unlock_count=25,
+        ),
+        UpgradeTypes.MINDFUL_BAKING: UpgradeConfig(
+            name="Mindful baking",
+            description="You are twice as efficient.",
+            price=2700000000000000000000000000000000,
+            target=FacilityTypes.YOU,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.YOU,
+            unlock_count=50,
+        ),
+        UpgradeTypes.INNER_STRENGTH: UpgradeConfig(
+            name="Inner strength",
+            description="You are twice as efficient.",
+            price=270000000000000000000000000000000000,
+            target=FacilityTypes.YOU,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.YOU,
+            unlock_count=100,
+        ),
+        UpgradeTypes.ETERNAL_YOUTH: UpgradeConfig(
+            name="Eternal youth",
+            description="You are twice as efficient.",
+            price=27000000000000000000000000000000000000,
+            target=FacilityTypes.YOU,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.YOU,
+            unlock_count=150,
+        ),
+        UpgradeTypes.SELF_DISCOVERY: UpgradeConfig(
+            name="Self-discovery",
+            description="You are twice as efficient.",
+            price=27000000000000000000000000000000000000000,
+            target=FacilityTypes.YOU,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.YOU,
+            unlock_count=200,
+        ),
+        UpgradeTypes.EXISTENTIAL_CRISIS: UpgradeConfig(
+            name="Existential crisis",
+            description="You are twice as efficient.",
+            price=27000000000000000000000000000000000000000000,
+            target=FacilityTypes.YOU,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.YOU,
+            unlock_count=250,
+        ),
+        UpgradeTypes.THE_REAL_YOU: UpgradeConfig(
+            name="The real you",
+            description="You are twice as efficient.",
+            price=27000000000000000000000000000000000000000000000,
+            target=FacilityTypes.YOU,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.YOU,
+            unlock_count=300,
+        ),
+        UpgradeTypes.YOU_AUTOMATION: UpgradeConfig(
+            name="You automation",
+            description="You are twice as efficient.",
+            price=270000000000000000000000000000000000000000000000000,
+            target=FacilityTypes.YOU,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.YOU,
+            unlock_count=350,
+        ),
+        UpgradeTypes.ENLIGHTENMENT: UpgradeConfig(
+            name="Enlightenment",
+            description="You are twice as efficient.",
+            price=2700000000000000000000000000000000000000000000000000000,
+            target=FacilityTypes.YOU,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.YOU,
+            unlock_count=400,
+        ),
+        UpgradeTypes.GODHOOD: UpgradeConfig(
+            name="Godhood",
+            description="You are twice as efficient.",
+            price=27000000000000000000000000000000000000000000000000000000000,
+            target=FacilityTypes.YOU,
+            effect_type=EffectType.MULTIPLIER,
+            value=2.0,
+            unlock_facility=FacilityTypes.YOU,
+            unlock_count=450,
+        ),
     }
 
 
-def facilities() -> dict[FacilityTypes, FacilityConfig]:
+def _facility_table() -> dict[FacilityTypes, FacilityConfig]:
     return {
-        FacilityTypes.KEYBOARD: {
-            "name": "Keyboard",
-            "description": "Autotypes once every 10 seconds.",
-            "base_cost": 15,
-            "base_cps": 0.1,
-            "init_visual": VisualState.COVERED,
-        },
-        FacilityTypes.GRANDMA: {
-            "name": "Grandma",
-            "description": "Nice grandma to bake more cookies.",
-            "base_cost": 100,
-            "base_cps": 1,
-            "init_visual": VisualState.COVERED,
-        },
-        FacilityTypes.FARM: {
-            "name": "Farm",
-            "description": "Grows cookie plants from cookie seeds.",
-            "base_cost": 1100,
-            "base_cps": 8,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.MINE: {
-            "name": "Mine",
-            "description": "Mines our cookie dough and chocolate chips.",
-            "base_cost": 12000,
-            "base_cps": 47,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.FACTORY: {
-            "name": "Factory",
-            "description": "Produces large quantities of cookies.",
-            "base_cost": 130000,
-            "base_cps": 260,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.BANK: {
-            "name": "Bank",
-            "description": "Generates cookies from interest.",
-            "base_cost": 1400000,
-            "base_cps": 1400,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.TEMPLE: {
-            "name": "Temple",
-            "description": "Full of precious, ancient chocolate.",
-            "base_cost": 20000000,
-            "base_cps": 7800,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.WIZARD_TOWER: {
-            "name": "Wizard Tower",
-            "description": "Summons cookies with magic spells.",
-            "base_cost": 330000000,
-            "base_cps": 44000,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.SHIPMENT: {
-            "name": "Shipment",
-            "description": "Brings in fresh cookies from the cookie planet.",
-            "base_cost": 5100000000,
-            "base_cps": 260000,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.ALCHEMY_LAB: {
-            "name": "Alchemy Lab",
-            "description": "Turns gold into cookies!",
-            "base_cost": 75000000000,
-            "base_cps": 1600000,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.PORTAL: {
-            "name": "Portal",
-            "description": "Opens a door to the Cookieverse.",
-            "base_cost": 1000000000000,
-            "base_cps": 10000000,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.TIME_MACHINE: {
-            "name": "Time Machine",
-            "description": "Brings cookies from the past, before they were even eaten.",
-            "base_cost": 14000000000000,
-            "base_cps": 65000000,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.ANTIMATTER_CONDENSER: {
-            "name": "Antimatter Condenser",
-            "description": "Condenses the antimatter in the universe into cookies.",
-            "base_cost": 170000000000000,
-            "base_cps": 430000000,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.PRISM: {
-            "name": "Prism",
-            "description": "Converts light itself into cookies.",
-            "base_cost": 2100000000000000,
-            "base_cps": 2900000000,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.CHANCE_MAKER: {
-            "name": "Chancemaker",
-            "description": "Generates cookies out of thin air through sheer luck.",
-            "base_cost": 26000000000000000,
-            "base_cps": 21000000000,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.FRACTAL_ENGINE: {
-            "name": "Fractal Engine",
-            "description": "Turns cookies into even more cookies.",
-            "base_cost": 310000000000000000,
-            "base_cps": 150000000000,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.PYTHON_CONSOLE: {
-            "name": "Python Console",
-            "description": "Creates cookies from the every code this game was written in.",
-            "base_cost": 71000000000000000000,
-            "base_cps": 1100000000000,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.IDLEVERSE: {
-            "name": "Idleverse",
-            "description": "Hijack other idle universes' production and convert them into cookies!",
-            "base_cost": 12000000000000000000000,
-            "base_cps": 8300000000000,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.CORTEX_BAKER: {
-            "name": "Cortex Baker",
-            "description": "Artificial brains the size of planets capable of dreaming up cookies.",
-            "base_cost": 1900000000000000000000000,
-            "base_cps": 64000000000000,
-            "init_visual": VisualState.HIDDEN,
-        },
-        FacilityTypes.YOU: {
-            "name": "You",
-            "description": "You, alone, are the reason behind all these cookies.",
-            "base_cost": 540000000000000000000000000,
-            "base_cps": 510000000000000,
-            "init_visual": VisualState.HIDDEN,
-        },
+        FacilityTypes.KEYBOARD: FacilityConfig(
+            name="Keyboard",
+            description="Autotypes once every 10 seconds.",
+            base_cost=15,
+            base_cps=0.1,
+            init_visual=VisualState.COVERED,
+        ),
+        FacilityTypes.GRANDMA: FacilityConfig(
+            name="Grandma",
+            description="Nice grandma to bake more cookies.",
+            base_cost=100,
+            base_cps=1,
+            init_visual=VisualState.COVERED,
+        ),
+        FacilityTypes.FARM: FacilityConfig(
+            name="Farm",
+            description="Grows cookie plants from cookie seeds.",
+            base_cost=1100,
+            base_cps=8,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.MINE: FacilityConfig(
+            name="Mine",
+            description="Mines our cookie dough and chocolate chips.",
+            base_cost=12000,
+            base_cps=47,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.FACTORY: FacilityConfig(
+            name="Factory",
+            description="Produces large quantities of cookies.",
+            base_cost=130000,
+            base_cps=260,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.BANK: FacilityConfig(
+            name="Bank",
+            description="Generates cookies from interest.",
+            base_cost=1400000,
+            base_cps=1400,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.TEMPLE: FacilityConfig(
+            name="Temple",
+            description="Full of precious, ancient chocolate.",
+            base_cost=20000000,
+            base_cps=7800,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.WIZARD_TOWER: FacilityConfig(
+            name="Wizard Tower",
+            description="Summons cookies with magic spells.",
+            base_cost=330000000,
+            base_cps=44000,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.SHIPMENT: FacilityConfig(
+            name="Shipment",
+            description="Brings in fresh cookies from the cookie planet.",
+            base_cost=5100000000,
+            base_cps=260000,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.ALCHEMY_LAB: FacilityConfig(
+            name="Alchemy Lab",
+            description="Turns gold into cookies!",
+            base_cost=75000000000,
+            base_cps=1600000,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.PORTAL: FacilityConfig(
+            name="Portal",
+            description="Opens a door to the Cookieverse.",
+            base_cost=1000000000000,
+            base_cps=10000000,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.TIME_MACHINE: FacilityConfig(
+            name="Time Machine",
+            description="Brings cookies from the past, before they were even eaten.",
+            base_cost=14000000000000,
+            base_cps=65000000,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.ANTIMATTER_CONDENSER: FacilityConfig(
+            name="Antimatter Condenser",
+            description="Condenses the antimatter in the universe into cookies.",
+            base_cost=170000000000000,
+            base_cps=430000000,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.PRISM: FacilityConfig(
+            name="Prism",
+            description="Converts light itself into cookies.",
+            base_cost=2100000000000000,
+            base_cps=2900000000,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.CHANCE_MAKER: FacilityConfig(
+            name="Chancemaker",
+            description="Generates cookies out of thin air through sheer luck.",
+            base_cost=26000000000000000,
+            base_cps=21000000000,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.FRACTAL_ENGINE: FacilityConfig(
+            name="Fractal Engine",
+            description="Turns cookies into even more cookies.",
+            base_cost=310000000000000000,
+            base_cps=150000000000,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.PYTHON_CONSOLE: FacilityConfig(
+            name="Python Console",
+            description="Creates cookies from the every code this game was written in.",
+            base_cost=71000000000000000000,
+            base_cps=1100000000000,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.IDLEVERSE: FacilityConfig(
+            name="Idleverse",
+            description="Hijack other idle universes' production and convert them into cookies!",
+            base_cost=12000000000000000000000,
+            base_cps=8300000000000,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.CORTEX_BAKER: FacilityConfig(
+            name="Cortex Baker",
+            description="Artificial brains the size of planets capable of dreaming up cookies.",
+            base_cost=1900000000000000000000000,
+            base_cps=64000000000000,
+            init_visual=VisualState.HIDDEN,
+        ),
+        FacilityTypes.YOU: FacilityConfig(
+            name="You",
+            description="You, alone, are the reason behind all these cookies.",
+            base_cost=540000000000000000000000000,
+            base_cps=510000000000000,
+            init_visual=VisualState.HIDDEN,
+        ),
     }
 
 
-def random_sentence() -> str:
-    random_sentence_database: list[str] = [
+def _sentence_table() -> list[str]:
+    return [
         # VCS & Git/Jujutsu
         "jj desc -m 'bugf: fix circular dependency in core'",
         "jj log -r ..@",
@@ -3249,4 +3269,20 @@ def random_sentence() -> str:
         "If you type 'rm -rf /', your cookies will turn into crumbs. Please don't.",
         "Basedpyright is actually me, Gemini, disguised as a type checker.",
     ]
-    return choice(random_sentence_database)
+
+
+# The single registry every engine reads. The mappings are read-only views,
+# so a stray write cannot leak from one session into all the others.
+_PARAMETERS: Parameters = Parameters(
+    facility_cost_multiplier_by_amount=1.15,
+    tick_rate=20,
+    max_catch_up_ticks=5,
+    command_workers=2,
+    autosave_interval=30.0,
+    journal_compact_bytes=1 << 20,
+)
+_UPGRADES: Mapping[UpgradeTypes, UpgradeConfig] = MappingProxyType(_upgrade_table())
+_FACILITIES: Mapping[FacilityTypes, FacilityConfig] = MappingProxyType(
+    _facility_table()
+)
+_SENTENCES: tuple[str, ...] = tuple(_sentence_table())
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable
+
+type Mutation = Callable[[], None]
+
+
+class CommandExecutor:
+    """Runs CPU-heavy command work off the tick thread.
+
+    work runs on a worker pool and must be a pure function of its arguments
+    (with processes it must also be picklable). Its result is handed to
+    commit, which is handed to post (the engine's submit_mutation), so engine
+    state only ever changes on the tick thread. Before start() is called there
+    is no pool and both steps run inline, which keeps headless runs
+    deterministic, and costs no more than the object itself. drain() blocks
+    until every submitted commit is posted.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        post: Callable[[Mutation], None],
+        use_processes: bool = False,
+    ) -> None:
+        self.workers: int = workers
+        self.use_processes: bool = use_processes
+        self.post: Callable[[Mutation], None] = post
+        self._pool: Executor | None = None
+        self._in_flight: int = 0
+        self._idle: threading.Condition | None = None
+
+    def start(self) -> None:
+        if self._pool is not None or self.workers <= 0:
+            return
+        if self._idle is None:
+            self._idle = threading.Condition()
+        if self.use_processes:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        else:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="cookey-worker"
+            )
+
+    def shutdown(self) -> None:
+        if self._pool is None:
+            return
+        # Let queued work finish: its input is already in the journal.
+        self._pool.shutdown(wait=True)
+        self._pool = None
+        self.drain()
+
+    def drain(self) -> None:
+        idle = self._idle
+        if idle is None:
+            return
+        with idle:
+            idle.wait_for(lambda: self._in_flight == 0)
+
+    def submit[T, *Ts](
+        self, work: Callable[[*Ts], T], *args: *Ts, commit: Callable[[T], None]
+    ) -> None:
+        if self._pool is None or self._idle is None:
+            commit(work(*args))
+            return
+        idle = self._idle
+
+        def on_done(future: Future[T]) -> None:
+            try:
+                if future.cancelled():
+                    return
+                error = future.exception()
+                if error is not None:
+                    self.post(lambda: _report(error))
+                    return
+                result = future.result()
+                self.post(lambda: commit(result))
+            finally:
+                with idle:
+                    self._in_flight -= 1
+                    idle.notify_all()
+
+        with idle:
+            self._in_flight += 1
+        self._pool.submit(work, *args).add_done_callback(on_done)
+
+
+def _report(error: BaseException) -> None:
+    print("-" * 50)
+    print(f"[CRITICAL ERROR] Command worker failed: {error!r}")
+    print("Please report this bug to the author with your input.")
+    print("-" * 50)
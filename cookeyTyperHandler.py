@@ -1,35 +1,70 @@
 from __future__ import annotations
 
-import difflib
 import queue
 import threading
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from cookeyTyperCore import CookeyTyper
+    from cookeyTyperModels import Facility
 
-from cookeyTyperData import random_sentence
-from cookeyTyperModels import into_facility, into_upgrade
+from cookeyTyperData import facilities, random_sentence, upgrades
+from cookeyTyperModels import (facility_trie, into_facility, into_upgrade,
+                               suggest_facility, suggest_upgrade, upgrade_trie)
+from cookeyTyperScore import typing_score
 from cookeyTyperTypes import (Command, CommandFacility, CommandHelp,
                               CommandInspectCookieCount,
                               CommandInspectCookiePerSecond,
-                              CommandInspectCookiePerType, CommandUpgrade,
+                              CommandInspectCookiePerType,
+                              CommandInspectLatency, CommandUpgrade,
                               CommandUserInput, CookieSource, Operations,
                               VisualState)
 from cookeyTyperUtils import format_cookies, format_cps
 from result import Err, Ok, Result, is_err
 
+try:
+    import readline
+except ImportError:  # Not shipped with every Python build (e.g. Windows).
+    readline = None
 
-def spawn_handler_thread(q: queue.Queue[str]) -> None:
+
+def spawn_handler_thread(
+    q: queue.Queue[tuple[float, str] | None], clock: Callable[[], float]
+) -> None:
     while True:
-        q.put(input())
+        raw_input = input()
+        q.put((clock(), raw_input))
+
+
+@dataclass
+class LatencyStats:
+    count: int = 0
+    last: float = 0.0
+    max: float = 0.0
+    total: float = 0.0
+
+    def record(self, latency: float) -> None:
+        self.count += 1
+        self.last = latency
+        self.max = max(self.max, latency)
+        self.total += latency
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
 
 
 class Handler:
     def __init__(self, engine: CookeyTyper) -> None:
         self.engine: CookeyTyper = engine
-        self.queue: queue.Queue[str] = queue.Queue()
+        # Input lines with the time they arrived. None means only "mutations
+        # are waiting", so a sleeping wait() wakes up to apply them. Created
+        # on first use: server sessions answer lines directly and never queue.
+        self._queue: queue.Queue[tuple[float, str] | None] | None = None
+        self.latency: LatencyStats = LatencyStats()
         self.handler_thread: threading.Thread | None = None
+        self._completions: list[str] = []
         self.target: str = "Hello Cookey Typer!"
 
         self._facility_dispatch: dict[Operations, Callable[[CommandFacility], bool]] = {
@@ -51,42 +86,166 @@ class Handler:
         if self.handler_thread is not None:
             return
 
+        if readline is not None:
+            # Complete against the whole line, not the word under the cursor.
+            readline.set_completer_delims("")
+            readline.set_completer(self._complete)
+            readline.parse_and_bind("tab: complete")
+
         self.handler_thread = threading.Thread(
-            target=spawn_handler_thread, args=(self.queue,), daemon=True
+            target=spawn_handler_thread,
+            args=(self.queue, self.engine.clock),
+            daemon=True,
         )
         self.handler_thread.start()
+        self.print_target()
+
+    @property
+    def queue(self) -> queue.Queue[tuple[float, str] | None]:
+        """The input queue. Tick thread only, like the rest of the handler."""
+        if self._queue is None:
+            self._queue = queue.Queue()
+        return self._queue
+
+    def submit(self, raw_input: str) -> None:
+        self.queue.put((self.engine.clock(), raw_input))
+
+    def wake(self) -> None:
+        # Without a queue nothing can be asleep in wait(); the next tick
+        # applies the mutation.
+        if self._queue is not None:
+            self._queue.put(None)
+
+    def update(self) -> bool:
+        if self._queue is None:
+            return False
+        handled = False
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                return handled
+            handled |= self._take(item)
+
+    def wait(self, timeout: float) -> None:
+        """Sleep for up to timeout seconds, answering input as soon as it arrives."""
+        deadline = self.engine.clock() + timeout
+        while True:
+            remaining = deadline - self.engine.clock()
+            if remaining <= 0:
+                return
+            try:
+                item = self.queue.get(timeout=remaining)
+            except queue.Empty:
+                return
+            self._take(item)
+            self.update()
+
+    def _take(self, item: tuple[float, str] | None) -> bool:
+        if item is not None:
+            self._respond(*item)
+        self.engine.apply_mutations()
+        return item is not None
+
+    def _respond(self, enqueued_at: float, raw_input: str) -> None:
+        # A pasted burst must run in the order it was typed: a purchase may
+        # not see the balance before an earlier line's typing credit.
+        self.engine.settle()
+        journal = self.engine.journal
+        if journal is not None:
+            self.engine.journal_seq = journal.append(
+                self.engine.ticks, self.engine.time, self.target, raw_input
+            )
+        self.handle_input(raw_input, enqueued_at)
+
+    def handle_input(self, raw_input: str, received_at: float | None = None) -> bool:
+        """Answer one line. received_at, when given, is when the line arrived;
+        latency is measured from it to the moment the reply is printed."""
+        command = self.parse_command(raw_input)
+        match command:
+            case Ok(CommandUserInput() as val):
+                # Scored on a worker; the result and new target print on commit.
+                target = self.target
+                self.target = random_sentence(self.engine.rng)
+                self.score_typing(target, val.content, received_at)
+                return True
+            case Ok(val):
+                self.execute_command(val)
+                self.target = random_sentence(self.engine.rng)
+                self.print_target()
+                self._replied(received_at)
+                return True
+            case Err(str):
+                print(str)
+                self.print_target()
+                self.engine.delta_cookie(1, CookieSource.TYPING)
+                self._replied(received_at)
+                return False
+
+    def _replied(self, received_at: float | None) -> None:
+        if received_at is not None:
+            self.latency.record(self.engine.clock() - received_at)
+
+    def print_target(self) -> None:
         print("=" * 70)
         print("Target:")
         print(self.target)
 
-    def update(self) -> bool:
-        try:
-            raw_input = self.queue.get_nowait()
-            command = self.parse_command(raw_input)
-            match command:
-                case Ok(val):
-                    self.execute_command(val)
-                    self.target = random_sentence()
-                    print("=" * 70)
-                    print("Target:")
-                    print(self.target)
-
-                    return True
-                case Err(str):
-                    print(str)
-                    print("=" * 70)
-                    print("Target:")
-                    print(self.target)
-                    self.engine.delta_cookie(1, CookieSource.TYPING)
-                    return False
-        except queue.Empty:
-            return False
+    def score_typing(
+        self, target: str, content: str, received_at: float | None = None
+    ) -> None:
+        self.engine.executor.submit(
+            typing_score,
+            target,
+            content,
+            commit=lambda score: self._commit_typing_score(score, received_at),
+        )
+
+    def _commit_typing_score(
+        self, score: tuple[int, int], received_at: float | None = None
+    ) -> None:
+        accurate_typing, calibrated_score = score
+        cookies_gain = (
+            calibrated_score * self.engine.cpt * self.engine.global_multipliers["cpt"]
+        )
+        print(f"You typed {accurate_typing} characters correctly and")
+        print(f"earned {format_cookies(cookies_gain)}!")
+        self.engine.delta_cookie(cookies_gain, CookieSource.TYPING)
+        self.print_target()
+        self._replied(received_at)
+
+    def completions(self, line: str) -> list[str]:
+        args = line.lower().split(" ")
+        match args:
+            case ["facility" | "fac" | "f", op_str, target_str]:
+                keys = facility_trie().complete(target_str)
+            case ["upgrade" | "upg" | "u", op_str, *target_args] if target_args:
+                keys = upgrade_trie().complete("_".join(target_args).replace("-", "_"))
+            case _:
+                return []
+        return [f"{args[0]} {op_str} {key}" for key in keys]
+
+    def _complete(self, text: str, state: int) -> str | None:
+        if state == 0:
+            self._completions = self.completions(text)
+        if state < len(self._completions):
+            return self._completions[state]
+        return None
+
+    def _facility_error(self, target_str: str, error: str) -> str:
+        suggestion = suggest_facility(target_str)
+        if suggestion is None:
+            return error
+        return f"{error}. Did you mean '{facilities()[suggestion].name}'?"
+
+    def _upgrade_error(self, target_str: str, error: str) -> str:
+        suggestion = suggest_upgrade(target_str)
+        if suggestion is None:
+            return error
+        return f"{error}. Did you mean '{upgrades()[suggestion].name}'?"
 
     def calculate_typing_score(self, target: str, user_input: str) -> tuple[int, int]:
-        matcher = difflib.SequenceMatcher(None, target, user_input)
-        correct_chars = sum(match.size for match in matcher.get_matching_blocks())
-        accuracy_score = 2 * correct_chars - len(user_input)
-        return (correct_chars, max(0, accuracy_score))
+        return typing_score(target, user_input)
 
     def parse_operation(self, arg: str) -> Result[Operations, str]:
         match arg.lower():
@@ -113,7 +272,14 @@ class Handler:
 
                 target = into_facility(target_str)
                 if is_err(target):
-                    return Err(target.error)
+                    return Err(self._facility_error(target_str, target.error))
+
+                if op.value == Operations.BUY and amount_str == "max":
+                    return Ok(
+                        CommandFacility(
+                            operation=op.value, target=target.value, max_amount=True
+                        )
+                    )
 
                 try:
                     amount = int(amount_str)
@@ -135,7 +301,7 @@ class Handler:
 
                 target = into_facility(target_str)
                 if is_err(target):
-                    return Err(target.error)
+                    return Err(self._facility_error(target_str, target.error))
 
                 # amount default = 1
                 return Ok(CommandFacility(operation=op.value, target=target.value))
@@ -158,7 +324,7 @@ class Handler:
 
                 target = into_upgrade(target_str)
                 if is_err(target):
-                    return Err(target.error)
+                    return Err(self._upgrade_error(target_str, target.error))
 
                 return Ok(CommandUpgrade(operation=op.value, target=target.value))
 
@@ -184,6 +350,9 @@ class Handler:
             case ["cpt"]:
                 return Ok(CommandInspectCookiePerType())
 
+            case ["lat"]:
+                return Ok(CommandInspectLatency())
+
             case _:
                 return Ok(CommandUserInput(content=raw_input))
 
@@ -202,6 +371,7 @@ class Handler:
       la         : List all available facilities
       buy (b)    : Buy facilities
                    Ex: 'f buy cursor 10'
+                   'max' buys as many as you can afford
       sell (s)   : Sell facilities (50% return)
       detail (d) : Show detailed stats of a facility
 
@@ -211,6 +381,7 @@ class Handler:
       buy (b)    : Buy an upgrade
                    Ex: 'u buy reinforced index finger'
                    Names work with spaces or underscores
+                   Press Tab to complete a name
       detail (d) : Show detailed stats of an upgrade
 
   help (h, ?)       : Show this help message
@@ -219,6 +390,7 @@ class Handler:
   cc   : Show current Cookie Count
   cps  : Show current Cookies Per Second
   cpt  : Show Cookies Per Type (production breakdown)
+  lat  : Show input response latency
 ==================================================
 """)
 
@@ -233,23 +405,23 @@ class Handler:
                     return upgrade_handler(command)
                 return False
             case CommandInspectCookieCount():
-                print(f"Current Cookie Count: {format_cookies(self.engine.cookies)}")
+                snapshot = self.engine.publish_snapshot()
+                print(f"Current Cookie Count: {format_cookies(snapshot.cookies)}")
             case CommandInspectCookiePerSecond():
-                print(f"Current Cookie Per Second: {format_cps(self.engine.cps)}")
+                snapshot = self.engine.publish_snapshot()
+                print(f"Current Cookie Per Second: {format_cps(snapshot.cps)}")
             case CommandInspectCookiePerType():
-                print(f"Current Cookie Per Type: {self.engine.cpt}")
-            case CommandUserInput():
-                accurate_typing, calibrated_score = self.calculate_typing_score(
-                    self.target, command.content
-                )
-                cookies_gain = (
-                    calibrated_score
-                    * self.engine.cpt
-                    * self.engine.global_multipliers["cpt"]
+                snapshot = self.engine.publish_snapshot()
+                print(f"Current Cookie Per Type: {snapshot.cpt}")
+            case CommandInspectLatency():
+                print(
+                    f"Input Latency: last {self.latency.last * 1000:.3f} ms, "
+                    f"mean {self.latency.mean * 1000:.3f} ms, "
+                    f"max {self.latency.max * 1000:.3f} ms "
+                    f"({self.latency.count} commands)"
                 )
-                print(f"You typed {accurate_typing} characters correctly and")
-                print(f"earned {format_cookies(cookies_gain)}!")
-                self.engine.delta_cookie(cookies_gain, CookieSource.TYPING)
+            case CommandUserInput():
+                self.score_typing(self.target, command.content)
 
             case _:
                 pass
@@ -259,12 +431,13 @@ class Handler:
     def _handle_facility_ls(self, command: CommandFacility) -> bool:
         header = f"| {'Name':<16} | {'Owned':^6} | {'Cost':>20} | {'Description'}"
 
+        snapshot = self.engine.publish_snapshot()
         print(f"{'=' * 27} Facility  List {'=' * 27}")
         print(header)
         print("-" * 75)
 
-        for facility in self.engine.facilities.values():
-            cost_str = format_cookies(facility.next_cost(), show_unit=False)
+        for facility in snapshot.facilities:
+            cost_str = format_cookies(facility.next_cost, show_unit=False)
             if facility.visual_state == VisualState.SHOWN:
                 print(
                     f"| {facility.name:<16} "
@@ -276,19 +449,20 @@ class Handler:
                 print(f"| {'---':<16} | {'-':^6} | {cost_str:>20} | {'---'}")
 
         print("=" * 75)
-        print(f"Current Cookie Count: {format_cookies(self.engine.cookies)}")
+        print(f"Current Cookie Count: {format_cookies(snapshot.cookies)}")
         return True
 
     def _handle_facility_la(self, command: CommandFacility) -> bool:
         header = f"| {'Name':<16} | {'Owned':^6} | {'Unit CPS':>12} | {'CPS':>12} | {'Cost':>20} | {'Description'}"
         total_width = 105
 
+        snapshot = self.engine.publish_snapshot()
         print(f"{'=' * 44}  Facility List  {'=' * 44}")
         print(header)
         print("-" * total_width)
 
-        for facility in self.engine.facilities.values():
-            cost_str = format_cookies(facility.next_cost(), show_unit=False)
+        for facility in snapshot.facilities:
+            cost_str = format_cookies(facility.next_cost, show_unit=False)
 
             if facility.visual_state == VisualState.SHOWN:
                 unit_cps = (
@@ -317,7 +491,7 @@ class Handler:
                 )
 
         print("=" * total_width)
-        print(f"Current Cookie Count: {format_cookies(self.engine.cookies)}")
+        print(f"Current Cookie Count: {format_cookies(snapshot.cookies)}")
         return True
 
     def _handle_facility_detail(self, command: CommandFacility) -> bool:
@@ -385,6 +559,8 @@ class Handler:
         if facility.visual_state == VisualState.HIDDEN:
             print("Invalid Facility Name")
             return False
+        if command.max_amount:
+            return self._handle_facility_buy_max(facility)
         amount = command.amount
         if amount < 0:
             print("Expected Positive Integer for perchasing amount.")
@@ -411,6 +587,16 @@ class Handler:
             print(f"Current Cookies: {format_cookies(self.engine.cookies)}")
         return True
 
+    def _handle_facility_buy_max(self, facility: Facility) -> bool:
+        amount, cost = self.engine.buy_facility_max(facility.type)
+        if amount == 0:
+            print("Not enough cookies!")
+            print(f"Cost: {format_cookies(facility.next_cost())}")
+            print(f"Current Cookies: {format_cookies(self.engine.cookies)}")
+        else:
+            print(f"Purchased {amount} {facility.type.name} for {format_cookies(cost)}")
+        return True
+
     def _handle_facility_sell(self, command: CommandFacility) -> bool:
         target = command.target
         if target is None:
@@ -453,31 +639,33 @@ class Handler:
         return True
 
     def _handle_upgrade_ls(self, command: CommandUpgrade) -> bool:
+        snapshot = self.engine.publish_snapshot()
         print(f"{'=' * 27} Available Upgrades {'=' * 27}")
         header = f"| {'Name':<30} | {'Price':>20} | {'Description'}"
         print(header)
         print("-" * 80)
 
-        for upgrade in self.engine.available_upgrades:
+        for upgrade in snapshot.available_upgrades:
             price_str = format_cookies(upgrade.price, show_unit=False)
             print(f"| {upgrade.name:<30} | {price_str:>20} | {upgrade.description}")
 
         print("=" * 80)
-        print(f"Current Cookie Count: {format_cookies(self.engine.cookies)}")
+        print(f"Current Cookie Count: {format_cookies(snapshot.cookies)}")
         return True
 
     def _handle_upgrade_la(self, command: CommandUpgrade) -> bool:
+        snapshot = self.engine.publish_snapshot()
         print(f"{'=' * 27} Available Upgrades {'=' * 27}")
         header = f"| {'Name':<30} | {'Price':>20} | {'Description'}"
         print(header)
         print("-" * 80)
 
-        for upgrade in self.engine.available_upgrades:
+        for upgrade in snapshot.available_upgrades:
             price_str = format_cookies(upgrade.price, show_unit=False)
             print(f"| {upgrade.name:<30} | {price_str:>20} | {upgrade.description}")
 
         print("=" * 80)
-        print(f"Current Cookie Count: {format_cookies(self.engine.cookies)}")
+        print(f"Current Cookie Count: {format_cookies(snapshot.cookies)}")
         return True
 
     def _handle_upgrade_detail(self, command: CommandUpgrade) -> bool:
@@ -498,7 +686,7 @@ class Handler:
         print(f" Price       : {format_cookies(upgrade.price)}")
         status = (
             "Owned"
-            if upgrade.is_purchased
+            if self.engine.is_purchased(upgrade.type)
             else (
                 "Available" if upgrade in self.engine.available_upgrades else "Locked"
             )
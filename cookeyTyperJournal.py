@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from contextlib import redirect_stdout
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from cookeyTyperCore import CookeyTyper
+
+# Record: seq, tick, time, target length, input length, target, input, crc32.
+# The crc covers everything before it, so a torn write at the tail is
+# detected on open and cut off.
+_RECORD = struct.Struct("<QQdII")
+_CRC = struct.Struct("<I")
+
+
+class JournalEntry(NamedTuple):
+    seq: int
+    tick: int
+    time: float
+    target: str
+    raw_input: str
+
+
+def _decode(data: bytes) -> tuple[list[JournalEntry], int]:
+    """Return the valid entries and the byte length they cover."""
+    entries: list[JournalEntry] = []
+    offset = 0
+    while offset + _RECORD.size <= len(data):
+        seq, tick, time, target_size, input_size = _RECORD.unpack_from(data, offset)
+        body_end = offset + _RECORD.size + target_size + input_size
+        if body_end + _CRC.size > len(data):
+            break
+        (crc,) = _CRC.unpack_from(data, body_end)
+        if crc != zlib.crc32(data[offset:body_end]):
+            break
+        text_start = offset + _RECORD.size
+        target = data[text_start : text_start + target_size].decode()
+        raw_input = data[text_start + target_size : body_end].decode()
+        entries.append(JournalEntry(seq, tick, time, target, raw_input))
+        offset = body_end + _CRC.size
+    return entries, offset
+
+
+def read_entries(path: str) -> list[JournalEntry]:
+    with open(path, "rb") as file:
+        return _decode(file.read())[0]
+
+
+class Journal:
+    """Append-only log of every handled input, for crash recovery.
+
+    append() only buffers; commit() writes and fsyncs everything appended
+    since the last commit, once per tick. Entries carry a sequence number,
+    and a save records the last one it includes, so recovery replays only
+    what the save is missing.
+    """
+
+    def __init__(self, path: str, compact_bytes: int) -> None:
+        self.path: str = path
+        self.compact_bytes: int = compact_bytes
+        self.entries: list[JournalEntry] = []
+        data = b""
+        if os.path.exists(path):
+            with open(path, "rb") as file:
+                data = file.read()
+        self.entries, valid_size = _decode(data)
+        self._file = open(path, "ab")
+        if valid_size < len(data):
+            self._file.truncate(valid_size)
+        self.size: int = valid_size
+        self.last_seq: int = self.entries[-1].seq if self.entries else 0
+        self._buffer: bytearray = bytearray()
+
+    def replay(self, engine: CookeyTyper) -> int:
+        """Re-handle every entry newer than the loaded save. Returns the count."""
+        replayed = 0
+        with open(os.devnull, "w") as sink, redirect_stdout(sink):
+            for entry in self.entries:
+                if entry.seq <= engine.journal_seq:
+                    continue
+                engine.advance_to(max(entry.time, engine.time))
+                engine.ticks = max(engine.ticks, entry.tick)
+                engine.handler.target = entry.target
+                engine.handler.handle_input(entry.raw_input)
+                engine.journal_seq = entry.seq
+                replayed += 1
+        engine.apply_mutations()
+        self.last_seq = max(self.last_seq, engine.journal_seq)
+        self.entries = []
+        return replayed
+
+    def append(self, tick: int, time: float, target: str, raw_input: str) -> int:
+        self.last_seq += 1
+        target_bytes = target.encode()
+        input_bytes = raw_input.encode()
+        start = len(self._buffer)
+        self._buffer += _RECORD.pack(
+            self.last_seq, tick, time, len(target_bytes), len(input_bytes)
+        )
+        self._buffer += target_bytes
+        self._buffer += input_bytes
+        self._buffer += _CRC.pack(zlib.crc32(self._buffer[start:]))
+        return self.last_seq
+
+    def commit(self) -> bool:
+        if not self._buffer:
+            return False
+        self._file.write(self._buffer)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.size += len(self._buffer)
+        self._buffer.clear()
+        return True
+
+    def needs_compaction(self) -> bool:
+        return self.size >= self.compact_bytes
+
+    def truncate(self) -> None:
+        """Drop every committed entry; call only after a save includes them."""
+        self.commit()
+        self._file.truncate(0)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.size = 0
+
+    def close(self) -> None:
+        self.commit()
+        self._file.close()
@@ -1,30 +1,33 @@
 from __future__ import annotations
 
+import re
+from array import array
+from collections import Counter
 from dataclasses import dataclass
-from math import ceil
-from typing import TYPE_CHECKING, Callable, Literal
+from math import ceil, fsum, inf, log10, prod
+from types import MappingProxyType
+from typing import Callable, Literal, Mapping
 
-from cookeyTyperData import facilities, parameters
+from cookeyTyperData import facilities, parameters, upgrades
+from cookeyTyperNumber import BigNumber
+from cookeyTyperSearch import FuzzyIndex, NameTrie
 from cookeyTyperTypes import (
     EffectType,
     FacilityTypes,
     ModifierSourceType,
+    UnlockCondition,
     UpgradeTypes,
     VisualState,
 )
 from result import Err, Ok, Result, is_ok
 
-if TYPE_CHECKING:
-    from cookeyTyperCore import CookeyTyper
-
-
 type EffectTarget = FacilityTypes | Literal["Global"] | Literal["Click"]
 
 
 @dataclass(frozen=True, slots=True)
 class Modifier:
     source_type: ModifierSourceType
-    source_id: UpgradeTypes
+    source_id: UpgradeTypes | str
     effect_type: EffectType
     value: float
 
@@ -36,20 +39,133 @@ class Effect[T: EffectTarget]:
     value: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Upgrade:
+    """The config of one upgrade, shared by every engine. Whether an engine
+    owns it is a bit in CookeyTyper.purchased."""
+
     type: UpgradeTypes
     name: str
     description: str
     price: int
-    effects: list[Effect[EffectTarget]]
-    unlock_condition: Callable[[CookeyTyper], bool]
-    is_purchased: bool = False
+    effects: tuple[Effect[EffectTarget], ...]
+    unlock_condition: UnlockCondition
+
+    @property
+    def index(self) -> int:
+        return self.type.value - 1
+
+
+class FacilityTable:
+    """Struct-of-arrays storage for every facility, indexed by FacilityTypes value.
+
+    Facility objects are thin views over one row, so whole-table work such as
+    the CPS total or an affordability scan runs over flat columns.
+    """
+
+    def __init__(self) -> None:
+        size = len(FacilityTypes)
+        self.amount: array[int] = array("q", [0] * size)
+        self.base_cps: array[float] = array("d", [0.0] * size)
+        self.base_cost: array[float] = array("d", [0.0] * size)
+        self.add_total: array[float] = array("d", [0.0] * size)
+        self.mult_total: array[float] = array("d", [1.0] * size)
+        self._cps_vector: array[float] | None = None
+        # Bumped on every row change, so readers can tell when to re-copy.
+        self.version: int = 0
+        # Called with the facility whose row changed.
+        self.on_change: Callable[[Facility], None] | None = None
+
+        self.facilities: dict[FacilityTypes, Facility] = {}
+        for facility_type, config in facilities().items():
+            self.facilities[facility_type] = Facility(
+                table=self,
+                facility_type=facility_type,
+                name=config.name,
+                description=config.description,
+                base_cost=config.base_cost,
+                base_cps=config.base_cps,
+                init_visual=config.init_visual,
+            )
+
+    def invalidate(self) -> None:
+        self._cps_vector = None
+        self.version += 1
+
+    def cps_vector(self) -> array[float]:
+        if self._cps_vector is None:
+            self._cps_vector = array(
+                "d",
+                map(
+                    _row_cps,
+                    self.base_cps,
+                    self.add_total,
+                    self.mult_total,
+                    self.amount,
+                ),
+            )
+        return self._cps_vector
+
+    def total_cps(self) -> BigNumber:
+        return BigNumber(fsum(self.cps_vector()))
+
+    def next_cost_vector(self) -> array[float]:
+        return array("d", map(_row_next_cost, self.base_cost, self.amount))
+
+    def affordable_mask(self, cookies: BigNumber) -> list[bool]:
+        budget = float(cookies)
+        mask = [cost <= budget for cost in self.next_cost_vector()]
+        if budget == inf:
+            # Past float range both sides may be inf; settle those exactly.
+            for facility in self.facilities.values():
+                index = facility.index
+                mask[index] = facility.next_cost() <= cookies
+        return mask
+
+
+def _row_cps(
+    base_cps: float, add_total: float, mult_total: float, amount: int
+) -> float:
+    return (base_cps + add_total) * mult_total * amount
+
+
+def _row_next_cost(base_cost: float, amount: int) -> float:
+    ratio = parameters().facility_cost_multiplier_by_amount
+    try:
+        return ceil(base_cost * (ratio ** (amount + 1) - ratio**amount) / (ratio - 1))
+    except OverflowError:
+        return inf
+
+
+class _ModifierCounts:
+    """The modifiers on one facility, with per-value counts for its totals."""
+
+    __slots__ = ("modifiers", "add_values", "mult_values", "upgrade_sources")
+
+    def __init__(self) -> None:
+        self.modifiers: Counter[Modifier] = Counter()
+        self.add_values: Counter[float] = Counter()
+        self.mult_values: Counter[float] = Counter()
+        self.upgrade_sources: set[UpgradeTypes | str] = set()
 
 
 class Facility:
+    # One per facility per engine, so no __dict__, and no modifier counters
+    # until the first modifier arrives.
+    __slots__ = (
+        "table",
+        "index",
+        "type",
+        "name",
+        "description",
+        "base_cost",
+        "_visual_state",
+        "_counts",
+    )
+
     def __init__(
         self,
+        table: FacilityTable,
         facility_type: FacilityTypes,
         name: str,
         description: str,
@@ -57,42 +173,109 @@ class Facility:
         base_cps: int | float,
         init_visual: VisualState,
     ) -> None:
+        self.table: FacilityTable = table
+        self.index: int = facility_type.value - 1
         self.type: FacilityTypes = facility_type
         self.name: str = name
         self.description: str = description
         self.base_cost: int = base_cost
-        self.base_cps: float = float(base_cps)
-        self.visual_state: VisualState = init_visual
-        self.amount: int = 0
-        self.modifiers: list[Modifier] = []
+        self._visual_state: VisualState = init_visual
+        self._counts: _ModifierCounts | None = None
+
+        table.base_cps[self.index] = float(base_cps)
+        table.base_cost[self.index] = float(base_cost)
+
+    @property
+    def amount(self) -> int:
+        return self.table.amount[self.index]
+
+    @amount.setter
+    def amount(self, value: int) -> None:
+        self.table.amount[self.index] = value
+        self._invalidate()
+
+    @property
+    def visual_state(self) -> VisualState:
+        return self._visual_state
+
+    @visual_state.setter
+    def visual_state(self, value: VisualState) -> None:
+        if value != self._visual_state:
+            self._visual_state = value
+            self.table.version += 1
+
+    @property
+    def base_cps(self) -> float:
+        return self.table.base_cps[self.index]
+
+    @property
+    def add_total(self) -> float:
+        return self.table.add_total[self.index]
+
+    @property
+    def mult_total(self) -> float:
+        return self.table.mult_total[self.index]
+
+    @property
+    def modifiers(self) -> Mapping[Modifier, int]:
+        return self._counts.modifiers if self._counts is not None else {}
+
+    def _invalidate(self) -> None:
+        self.table.invalidate()
+        if self.table.on_change is not None:
+            self.table.on_change(self)
 
     def add_modifier(self, mod: Modifier) -> bool:
+        if self._counts is None:
+            self._counts = _ModifierCounts()
+        counts = self._counts
         if mod.source_type == ModifierSourceType.UPGRADE:
-            for existing in self.modifiers:
-                if (
-                    existing.source_type == ModifierSourceType.UPGRADE
-                    and existing.source_id == mod.source_id
-                ):
-                    return False
-        self.modifiers.append(mod)
+            if mod.source_id in counts.upgrade_sources:
+                return False
+            counts.upgrade_sources.add(mod.source_id)
+        counts.modifiers[mod] += 1
+        self._update_totals(counts, mod, 1)
         return True
 
-    @property
-    def cps(self) -> float:
-        base = self.base_cps
-
-        add_total: float = 0.0
-        mult_total: float = 1.0
+    def remove_modifier(self, mod: Modifier) -> bool:
+        counts = self._counts
+        if counts is None or not counts.modifiers[mod]:
+            return False
+        counts.modifiers[mod] -= 1
+        if not counts.modifiers[mod]:
+            del counts.modifiers[mod]
+        if mod.source_type == ModifierSourceType.UPGRADE:
+            counts.upgrade_sources.discard(mod.source_id)
+        self._update_totals(counts, mod, -1)
+        return True
 
-        for mod in self.modifiers:
-            if mod.effect_type == EffectType.ADD:
-                add_total += mod.value
-            elif mod.effect_type == EffectType.MULTIPLIER:
-                mult_total *= mod.value
+    def _update_totals(
+        self, counts: _ModifierCounts, mod: Modifier, count: int
+    ) -> None:
+        # Totals are rebuilt from per-value counts rather than adjusted in
+        # place, so removing a modifier restores the exact previous value.
+        if mod.effect_type == EffectType.ADD:
+            counts.add_values[mod.value] += count
+            if not counts.add_values[mod.value]:
+                del counts.add_values[mod.value]
+            self.table.add_total[self.index] = fsum(
+                value * n for value, n in sorted(counts.add_values.items())
+            )
+        elif mod.effect_type == EffectType.MULTIPLIER:
+            counts.mult_values[mod.value] += count
+            if not counts.mult_values[mod.value]:
+                del counts.mult_values[mod.value]
+            self.table.mult_total[self.index] = prod(
+                (value**n for value, n in sorted(counts.mult_values.items())),
+                start=1.0,
+            )
+        self._invalidate()
 
-        return (base + add_total) * mult_total * self.amount
+    @property
+    def cps(self) -> BigNumber:
+        return BigNumber(self.table.cps_vector()[self.index])
 
-    def next_cost(self) -> int:
+    def next_cost(self) -> BigNumber:
         next_cost = self.get_cookie_delta(1)
         if is_ok(next_cost):
             next_cost = abs(next_cost.value)
@@ -103,17 +286,17 @@ class Facility:
             print("This should NOT happen if the cost calculater is working correctly")
             print("Please report this bug to the author with your input.")
             print("-" * 50)
-            return 0
+            return BigNumber()
 
     def get_cookie_delta(
         self, diff_amount: int = 1, base_amount: int | None = None
-    ) -> Result[int, int]:
-        ratio = parameters()["facility_cost_multiplier_by_amount"]
+    ) -> Result[BigNumber, BigNumber]:
+        ratio = BigNumber(parameters().facility_cost_multiplier_by_amount)
         if base_amount is None:
             base_amount = self.amount
 
         if diff_amount == 0:
-            return Ok(0)
+            return Ok(BigNumber())
 
         result = True
         if base_amount + diff_amount < 0:
@@ -122,19 +305,39 @@ class Facility:
 
         raw_total = (
             self.base_cost
-            * (pow(ratio, base_amount + diff_amount) - pow(ratio, base_amount))
+            * (ratio ** (base_amount + diff_amount) - ratio**base_amount)
         ) / (ratio - 1)
 
         if diff_amount > 0:
-            final_cost = -int(ceil(raw_total))
+            final_cost = -raw_total.ceil()
         else:
-            final_cost = int(abs(ceil(raw_total)) * 0.5)
+            final_cost = (abs(raw_total.ceil()) * 0.5).floor()
 
         if result:
             return Ok(final_cost)
         else:
             return Err(final_cost)
 
+    def max_affordable(self, cookies: BigNumber) -> int:
+        if cookies <= 0:
+            return 0
+        ratio = parameters().facility_cost_multiplier_by_amount
+        # Invert base * r**a * (r**n - 1) / (r - 1) <= cookies for n.
+        current_cost = BigNumber(ratio) ** self.amount * self.base_cost
+        scaled = cookies * (ratio - 1) / current_cost
+        amount = max(0, int((scaled + 1).log10() / log10(ratio)))
+
+        # Correct for float error and the per-batch ceil() in the real cost.
+        while amount > 0 and self._batch_cost(amount) > cookies:
+            amount -= 1
+        while self._batch_cost(amount + 1) <= cookies:
+            amount += 1
+        return amount
+
+    def _batch_cost(self, amount: int) -> BigNumber:
+        cost = self.get_cookie_delta(amount)
+        return abs(cost.value if is_ok(cost) else cost.error)
+
     def delta_amount(self, amount: int = 1) -> bool:
         if amount < 0:
             if self.amount < abs(amount):
@@ -145,34 +348,137 @@ class Facility:
 
 
 def get_facilities() -> dict[FacilityTypes, Facility]:
-    facilities_dict: dict[FacilityTypes, Facility] = {}
-    for facility_type, config in facilities().items():
-        facilities_dict[facility_type] = Facility(
-            facility_type=facility_type,
-            name=config["name"],
-            description=config["description"],
-            base_cost=config["base_cost"],
-            base_cps=config["base_cps"],
-            init_visual=config["init_visual"],
-        )
-    return facilities_dict
+    return FacilityTable().facilities
+
+
+def normalize_name(name: str) -> str:
+    return "_".join(name.lower().replace("-", " ").split())
+
+
+def _name_keys(name: str) -> set[str]:
+    key = normalize_name(name)
+    # Also accept names typed without punctuation: "philosophers_cookie".
+    return {key, re.sub(r"[^a-z0-9_]", "", key)}
+
+
+def _build_index[T: (FacilityTypes, UpgradeTypes)](
+    names: Mapping[T, str], aliases: Mapping[str, T]
+) -> Mapping[str, T]:
+    index: dict[str, T] = {}
+    for item_type, name in names.items():
+        for key in _name_keys(name) | {item_type.name.lower()}:
+            index.setdefault(key, item_type)
+    for alias, item_type in aliases.items():
+        index.setdefault(normalize_name(alias), item_type)
+    return MappingProxyType(index)
+
+
+def _build_trie[T: (FacilityTypes, UpgradeTypes)](
+    index: Mapping[str, T],
+) -> NameTrie[T]:
+    trie: NameTrie[T] = NameTrie()
+    for key, item_type in index.items():
+        trie.insert(key, item_type)
+    return trie
+
+
+def _build_fuzzy[T: (FacilityTypes, UpgradeTypes)](
+    names: Mapping[T, str], aliases: Mapping[str, T]
+) -> FuzzyIndex[T]:
+    # One key per item (plus aliases): extra spellings only add candidates.
+    fuzzy: FuzzyIndex[T] = FuzzyIndex()
+    for item_type, name in names.items():
+        fuzzy.insert(normalize_name(name), item_type)
+    for alias, item_type in aliases.items():
+        fuzzy.insert(normalize_name(alias), item_type)
+    return fuzzy
+
+
+def _suggest[T: (FacilityTypes, UpgradeTypes)](
+    fuzzy: FuzzyIndex[T], arg: str
+) -> T | None:
+    key = normalize_name(arg)
+    # One edit per four characters, so short typos do not match everything.
+    max_distance = min(2, len(key) // 4)
+    if max_distance == 0:
+        return None
+    match = fuzzy.nearest(key, max_distance)
+    return match[2] if match is not None else None
+
+
+# Name lookup for command parsing, did-you-mean hints and Tab completion,
+# derived from the registry names plus a few short aliases.
+_FACILITY_ALIASES: dict[str, FacilityTypes] = {
+    "cursor": FacilityTypes.KEYBOARD,
+    "kb": FacilityTypes.KEYBOARD,
+    "granny": FacilityTypes.GRANDMA,
+    "wizard": FacilityTypes.WIZARD_TOWER,
+    "lab": FacilityTypes.ALCHEMY_LAB,
+    "condenser": FacilityTypes.ANTIMATTER_CONDENSER,
+    "console": FacilityTypes.PYTHON_CONSOLE,
+}
+_FACILITY_INDEX: Mapping[str, FacilityTypes] = _build_index(
+    {facility: config.name for facility, config in facilities().items()},
+    _FACILITY_ALIASES,
+)
+_UPGRADE_INDEX: Mapping[str, UpgradeTypes] = _build_index(
+    {upgrade: config.name for upgrade, config in upgrades().items()}, {}
+)
 
 
-def into_facility(arg: str) -> Result[FacilityTypes, str]:
-    for facility, config in facilities().items():
-        if config["name"].lower() == arg.lower():
-            return Ok(facility)
-    return Err("Invalid Facility Name")
+_FACILITY_TRIE: NameTrie[FacilityTypes] = _build_trie(_FACILITY_INDEX)
+_UPGRADE_TRIE: NameTrie[UpgradeTypes] = _build_trie(_UPGRADE_INDEX)
+_FACILITY_FUZZY: FuzzyIndex[FacilityTypes] = _build_fuzzy(
+    {facility: config.name for facility, config in facilities().items()},
+    _FACILITY_ALIASES,
+)
+_UPGRADE_FUZZY: FuzzyIndex[UpgradeTypes] = _build_fuzzy(
+    {upgrade: config.name for upgrade, config in upgrades().items()}, {}
+)
 
 
-def into_upgrade(arg: str) -> Result[UpgradeTypes, str]:
-    from cookeyTyperData import upgrades
+def facility_index() -> Mapping[str, FacilityTypes]:
+    return _FACILITY_INDEX
+
+
+def upgrade_index() -> Mapping[str, UpgradeTypes]:
+    return _UPGRADE_INDEX
+
+
+def facility_trie() -> NameTrie[FacilityTypes]:
+    return _FACILITY_TRIE
 
-    # Normalize user input: lowercase, replace spaces/hyphens with underscores
-    normalized_arg = arg.lower().replace(" ", "_").replace("-", "_")
 
-    for upgrade_type, config in upgrades().items():
-        name = config["name"].lower().replace(" ", "_").replace("-", "_")
-        if name == normalized_arg or upgrade_type.name.lower() == normalized_arg:
-            return Ok(upgrade_type)
-    return Err("Invalid Upgrade Name")
+def upgrade_trie() -> NameTrie[UpgradeTypes]:
+    return _UPGRADE_TRIE
+
+
+def facility_fuzzy() -> FuzzyIndex[FacilityTypes]:
+    return _FACILITY_FUZZY
+
+
+def upgrade_fuzzy() -> FuzzyIndex[UpgradeTypes]:
+    return _UPGRADE_FUZZY
+
+
+def suggest_facility(arg: str) -> FacilityTypes | None:
+    return _suggest(_FACILITY_FUZZY, arg)
+
+
+def suggest_upgrade(arg: str) -> UpgradeTypes | None:
+    return _suggest(_UPGRADE_FUZZY, arg)
+
+
+def into_facility(arg: str) -> Result[FacilityTypes, str]:
+    facility = _FACILITY_INDEX.get(normalize_name(arg))
+    if facility is None:
+        return Err("Invalid Facility Name")
+    return Ok(facility)
+
+
+def into_upgrade(arg: str) -> Result[UpgradeTypes, str]:
+    # Spaces, hyphens and underscores are interchangeable in the index keys.
+    upgrade = _UPGRADE_INDEX.get(normalize_name(arg))
+    if upgrade is None:
+        return Err("Invalid Upgrade Name")
+    return Ok(upgrade)
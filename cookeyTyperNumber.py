@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+from math import ceil, floor, inf, isfinite, log10, nextafter
+
+# A BigNumber is mantissa * 10 ** exponent where exponent is a multiple of
+# _STEP. Everything below 10 ** _STEP keeps exponent == 0, so in that range
+# every operation is plain float arithmetic behind one integer comparison.
+_STEP = 100
+_SCALE = 1e100
+_INV_SCALE = 1e-100
+_INT_LIMIT = 10**300
+
+
+class BigNumber:
+    __slots__ = ("mantissa", "exponent")
+
+    mantissa: float
+    exponent: int
+
+    def __init__(self, value: Number = 0, exponent: int = 0) -> None:
+        number = _coerce(value)
+        if exponent:
+            number = _normalized(number.mantissa, number.exponent + exponent)
+        self.mantissa = number.mantissa
+        self.exponent = number.exponent
+
+    @classmethod
+    def from_log10(cls, log: float) -> BigNumber:
+        if log == -inf:
+            return _ZERO
+        exponent = max(0, floor(log / _STEP) * _STEP)
+        return _normalized(10.0 ** (log - exponent), exponent)
+
+    def log10(self) -> float:
+        if self.mantissa == 0:
+            return -inf
+        return log10(abs(self.mantissa)) + self.exponent
+
+    def ceil(self) -> BigNumber:
+        if self.exponent:
+            return self
+        return _raw(float(ceil(self.mantissa)), 0)
+
+    def floor(self) -> BigNumber:
+        if self.exponent:
+            return self
+        return _raw(float(floor(self.mantissa)), 0)
+
+    def next_up(self) -> BigNumber:
+        return _normalized(nextafter(self.mantissa, inf), self.exponent)
+
+    # ----------   Arithmetic   ----------
+
+    def __add__(self, other: Number) -> BigNumber:
+        if not isinstance(other, BigNumber):
+            if self.exponent == 0 and -_SCALE < other < _SCALE:
+                return _normalized(self.mantissa + other, 0)
+            other = _coerce(other)
+        e1, e2 = self.exponent, other.exponent
+        if e1 == e2:
+            return _normalized(self.mantissa + other.mantissa, e1)
+        if e1 > e2:
+            if e1 - e2 > _STEP:
+                return self
+            return _normalized(self.mantissa + other.mantissa * _INV_SCALE, e1)
+        if e2 - e1 > _STEP:
+            return other
+        return _normalized(self.mantissa * _INV_SCALE + other.mantissa, e2)
+
+    def __radd__(self, other: Number) -> BigNumber:
+        return self.__add__(other)
+
+    def __sub__(self, other: Number) -> BigNumber:
+        if not isinstance(other, BigNumber):
+            other = _coerce(other)
+        return self.__add__(_raw(-other.mantissa, other.exponent))
+
+    def __rsub__(self, other: Number) -> BigNumber:
+        return _coerce(other).__sub__(self)
+
+    def __mul__(self, other: Number) -> BigNumber:
+        if not isinstance(other, BigNumber):
+            if self.exponent == 0 and -_SCALE < other < _SCALE:
+                return _normalized(self.mantissa * other, 0)
+            other = _coerce(other)
+        return _normalized(
+            self.mantissa * other.mantissa, self.exponent + other.exponent
+        )
+
+    def __rmul__(self, other: Number) -> BigNumber:
+        return self.__mul__(other)
+
+    def __truediv__(self, other: Number) -> BigNumber:
+        if not isinstance(other, BigNumber):
+            other = _coerce(other)
+        return _normalized(
+            self.mantissa / other.mantissa, self.exponent - other.exponent
+        )
+
+    def __rtruediv__(self, other: Number) -> BigNumber:
+        return _coerce(other).__truediv__(self)
+
+    def __pow__(self, power: float | int) -> BigNumber:
+        if self.exponent == 0 and self.mantissa >= 0:
+            try:
+                return _normalized(float(self.mantissa**power), 0)
+            except OverflowError:
+                pass
+        if self.mantissa < 0:
+            if not float(power).is_integer():
+                raise ValueError("Fractional power of a negative BigNumber")
+            result = BigNumber.from_log10(self.log10() * power)
+            return -result if int(power) % 2 else result
+        return BigNumber.from_log10(self.log10() * power)
+
+    def __neg__(self) -> BigNumber:
+        return _raw(-self.mantissa, self.exponent)
+
+    def __pos__(self) -> BigNumber:
+        return self
+
+    def __abs__(self) -> BigNumber:
+        if self.mantissa >= 0:
+            return self
+        return _raw(-self.mantissa, self.exponent)
+
+    # ----------   Comparison   ----------
+
+    def _compare(self, other: BigNumber) -> int:
+        a, b = self.mantissa, other.mantissa
+        if self.exponent == other.exponent:
+            return (a > b) - (a < b)
+        sign_a, sign_b = (a > 0) - (a < 0), (b > 0) - (b < 0)
+        if sign_a != sign_b:
+            return (sign_a > sign_b) - (sign_a < sign_b)
+        return sign_a if self.exponent > other.exponent else -sign_a
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (BigNumber, float, int)):
+            return NotImplemented
+        other = _coerce(other)
+        return self.mantissa == other.mantissa and self.exponent == other.exponent
+
+    def __lt__(self, other: Number) -> bool:
+        if not isinstance(other, BigNumber):
+            if self.exponent == 0 and -_SCALE < other < _SCALE:
+                return self.mantissa < other
+            other = _coerce(other)
+        if self.exponent == other.exponent:
+            return self.mantissa < other.mantissa
+        return self._compare(other) < 0
+
+    def __le__(self, other: Number) -> bool:
+        if not isinstance(other, BigNumber):
+            if self.exponent == 0 and -_SCALE < other < _SCALE:
+                return self.mantissa <= other
+            other = _coerce(other)
+        if self.exponent == other.exponent:
+            return self.mantissa <= other.mantissa
+        return self._compare(other) <= 0
+
+    def __gt__(self, other: Number) -> bool:
+        if not isinstance(other, BigNumber):
+            if self.exponent == 0 and -_SCALE < other < _SCALE:
+                return self.mantissa > other
+            other = _coerce(other)
+        if self.exponent == other.exponent:
+            return self.mantissa > other.mantissa
+        return self._compare(other) > 0
+
+    def __ge__(self, other: Number) -> bool:
+        if not isinstance(other, BigNumber):
+            if self.exponent == 0 and -_SCALE < other < _SCALE:
+                return self.mantissa >= other
+            other = _coerce(other)
+        if self.exponent == other.exponent:
+            return self.mantissa >= other.mantissa
+        return self._compare(other) >= 0
+
+    def __hash__(self) -> int:
+        if self.exponent == 0:
+            return hash(self.mantissa)
+        return hash((self.mantissa, self.exponent))
+
+    # ----------   Conversion   ----------
+
+    def __bool__(self) -> bool:
+        return self.mantissa != 0
+
+    def __float__(self) -> float:
+        if self.exponent == 0:
+            return self.mantissa
+        try:
+            return self.mantissa * 10.0**self.exponent
+        except OverflowError:
+            return inf if self.mantissa > 0 else -inf
+
+    def __int__(self) -> int:
+        if self.exponent == 0:
+            return int(self.mantissa)
+        # The mantissa's fraction matters once scaled, so convert exactly.
+        numerator, denominator = abs(self.mantissa).as_integer_ratio()
+        value = numerator * 10**self.exponent // denominator
+        return value if self.mantissa > 0 else -value
+
+    def __repr__(self) -> str:
+        return f"BigNumber({self.mantissa!r}, {self.exponent})"
+
+    def __str__(self) -> str:
+        if self.exponent == 0:
+            return str(self.mantissa)
+        return format(self, ".6g")
+
+    def __format__(self, spec: str) -> str:
+        if self.exponent == 0:
+            return format(self.mantissa, spec)
+        digits = floor(log10(abs(self.mantissa)))
+        mantissa = format(self.mantissa / 10.0**digits, spec)
+        if _rounds_to_ten(mantissa):
+            # 9.9996 at ".3f" prints as 10.000; carry into the exponent.
+            digits += 1
+            mantissa = format(self.mantissa / 10.0**digits, spec)
+        return f"{mantissa}e{self.exponent + digits}"
+
+
+type Number = BigNumber | float | int
+
+
+def _rounds_to_ten(text: str) -> bool:
+    try:
+        return abs(float(text.replace(",", "").replace("_", ""))) >= 10
+    except ValueError:
+        return False
+
+
+def _raw(mantissa: float, exponent: int) -> BigNumber:
+    number = object.__new__(BigNumber)
+    number.mantissa = mantissa
+    number.exponent = exponent
+    return number
+
+
+def _normalized(mantissa: float, exponent: int) -> BigNumber:
+    if exponent == 0 and -_SCALE < mantissa < _SCALE:
+        return _raw(mantissa, 0)
+    if mantissa == 0:
+        return _ZERO
+    if not isfinite(mantissa):
+        raise OverflowError("BigNumber mantissa out of range")
+
+    remainder = exponent % _STEP
+    if remainder:
+        mantissa *= 10.0**remainder
+        exponent -= remainder
+    while abs(mantissa) >= _SCALE:
+        mantissa *= _INV_SCALE
+        exponent += _STEP
+    while exponent > 0 and abs(mantissa) < 1:
+        mantissa *= _SCALE
+        exponent -= _STEP
+    while exponent < 0:
+        mantissa *= _INV_SCALE
+        exponent += _STEP
+    return _raw(mantissa, exponent)
+
+
+def _coerce(value: Number) -> BigNumber:
+    if isinstance(value, BigNumber):
+        return value
+    if isinstance(value, int) and not -_INT_LIMIT < value < _INT_LIMIT:
+        shift = len(str(abs(value))) - 18
+        return _normalized(float(value // 10**shift), shift)
+    mantissa = float(value)
+    if -_SCALE < mantissa < _SCALE:
+        return _raw(mantissa, 0)
+    return _normalized(mantissa, 0)
+
+
+_ZERO = _raw(0.0, 0)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from typing import Iterable, NamedTuple
+
+from cookeyTyperCore import CookeyTyper
+from cookeyTyperData import parameters
+from cookeyTyperJournal import read_entries
+from cookeyTyperSave import save_bytes
+from cookeyTyperScheduler import VirtualClock
+
+
+class ReplayCommand(NamedTuple):
+    tick: int
+    raw_input: str
+    # The typing target shown when the line was typed. None lets the seeded
+    # engine pick it, which is what a log written for a given seed wants.
+    target: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayReport:
+    ticks: int
+    commands: int
+    wall_seconds: float
+    state_hash: str
+
+    @property
+    def ticks_per_second(self) -> float:
+        if self.wall_seconds <= 0:
+            return float("inf")
+        return self.ticks / self.wall_seconds
+
+
+def state_hash(engine: CookeyTyper) -> str:
+    """Hash of everything a save keeps; equal hashes mean equal games."""
+    return hashlib.sha256(save_bytes(engine)).hexdigest()
+
+
+def load_commands(path: str) -> list[ReplayCommand]:
+    """Read a command log from a journal file written by CookeyTyper.run."""
+    return [
+        ReplayCommand(entry.tick, entry.raw_input, entry.target)
+        for entry in read_entries(path)
+    ]
+
+
+def replay(
+    commands: Iterable[ReplayCommand], seed: int, ticks: int | None = None
+) -> ReplayReport:
+    """Run commands through a headless seeded engine at full speed.
+
+    A command stamped with tick N is handled after tick N has run, as it was
+    live. The engine runs on a virtual clock with a fixed dt, so the same
+    log and seed always reach the same state hash.
+    """
+    pending = sorted(commands, key=lambda command: command.tick)
+    if ticks is None:
+        ticks = pending[-1].tick + 1 if pending else 0
+    dt = 1 / parameters().tick_rate
+    clock = VirtualClock()
+    engine = CookeyTyper(seed=seed, clock=clock)
+    index = 0
+
+    start = time.perf_counter()
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        for tick in range(ticks + 1):
+            if tick:
+                clock.advance(dt)
+                engine.tick(dt)
+            while index < len(pending) and pending[index].tick <= tick:
+                command = pending[index]
+                if command.target is not None:
+                    engine.handler.target = command.target
+                engine.handler.handle_input(command.raw_input)
+                index += 1
+    wall = time.perf_counter() - start
+
+    return ReplayReport(
+        ticks=ticks, commands=index, wall_seconds=wall, state_hash=state_hash(engine)
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay a CookeyTyper command journal headlessly."
+    )
+    parser.add_argument("journal", help="journal file written by a live session")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ticks", type=int, default=None)
+    parser.add_argument("--expect", help="state hash the run must end on")
+    args = parser.parse_args(argv)
+
+    report = replay(load_commands(args.journal), args.seed, args.ticks)
+    print(f"ticks:      {report.ticks} ({report.ticks_per_second:,.0f} ticks/s)")
+    print(f"commands:   {report.commands}")
+    print(f"wall:       {report.wall_seconds:.3f} s")
+    print(f"state hash: {report.state_hash}")
+    if args.expect is not None and args.expect != report.state_hash:
+        print(f"MISMATCH: expected {args.expect}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
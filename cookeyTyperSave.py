@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import os
+import queue
+import struct
+import threading
+import time
+from array import array
+from typing import TYPE_CHECKING
+
+from cookeyTyperNumber import BigNumber
+from cookeyTyperTypes import FacilityTypes, UpgradeTypes
+from result import Err, Ok, Result
+
+if TYPE_CHECKING:
+    from cookeyTyperCore import CookeyTyper
+
+DEFAULT_SAVE_PATH = "cookeyTyper.sav"
+
+# Layout, all little-endian:
+#   header   magic, version, facility count, upgrade count, time, tick count,
+#            and the sequence number of the last journal entry included
+#   numbers  cookies and the six BigNumber stat counters as (mantissa, exponent)
+#   scalars  total_types, the three global multipliers, global_discount, cpt
+#   amounts  one int64 per facility, in FacilityTypes order
+#   bitset   one bit per upgrade, set when purchased, in UpgradeTypes order
+_MAGIC = b"CKTY"
+_VERSION = 2
+_HEADER = struct.Struct("<4sHHHdQQ")
+_NUMBERS = struct.Struct("<" + "dq" * 7)
+_SCALARS = struct.Struct("<q5d")
+_FACILITY_COUNT = len(FacilityTypes)
+_UPGRADE_COUNT = len(UpgradeTypes)
+_BITSET_SIZE = (_UPGRADE_COUNT + 7) // 8
+_UPGRADE_BY_INDEX: tuple[UpgradeTypes, ...] = tuple(UpgradeTypes)
+SAVE_SIZE = (
+    _HEADER.size + _NUMBERS.size + _SCALARS.size + 8 * _FACILITY_COUNT + _BITSET_SIZE
+)
+
+
+def _stat_numbers(engine: CookeyTyper) -> tuple[BigNumber, ...]:
+    stats = engine.stats
+    return (
+        engine.cookies,
+        stats.total_cookies_ever,
+        stats.total_cookies_consumed_ever,
+        stats.total_cookies_lost_ever,
+        stats.total_cookies_ascension,
+        stats.total_cookies_by_type,
+        stats.total_cookies_by_facilities,
+    )
+
+
+def save_bytes(engine: CookeyTyper) -> bytes:
+    """Encode the engine state. Call on the tick thread."""
+    multipliers = engine.global_multipliers
+    numbers: list[float | int] = []
+    for number in _stat_numbers(engine):
+        numbers += (number.mantissa, number.exponent)
+
+    return b"".join(
+        (
+            _HEADER.pack(
+                _MAGIC,
+                _VERSION,
+                _FACILITY_COUNT,
+                _UPGRADE_COUNT,
+                engine.time,
+                engine.ticks,
+                engine.journal_seq,
+            ),
+            _NUMBERS.pack(*numbers),
+            _SCALARS.pack(
+                engine.stats.total_types,
+                multipliers["global"],
+                multipliers["cpt"],
+                multipliers["cps"],
+                engine.global_discount,
+                engine.cpt,
+            ),
+            engine.facility_table.amount.tobytes(),
+            engine.purchased.to_bytes(_BITSET_SIZE, "little"),
+        )
+    )
+
+
+def load_bytes(engine: CookeyTyper, data: bytes) -> Result[None, str]:
+    """Restore a save into a freshly constructed engine."""
+    if len(data) != SAVE_SIZE:
+        return Err("Save file is truncated or from another version")
+    (
+        magic,
+        version,
+        facility_count,
+        upgrade_count,
+        saved_time,
+        saved_ticks,
+        journal_seq,
+    ) = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC:
+        return Err("Not a CookeyTyper save file")
+    if (
+        version != _VERSION
+        or facility_count != _FACILITY_COUNT
+        or upgrade_count != _UPGRADE_COUNT
+    ):
+        return Err("Save file is from another version")
+
+    offset = _HEADER.size
+    raw = _NUMBERS.unpack_from(data, offset)
+    numbers = [BigNumber(raw[i], raw[i + 1]) for i in range(0, len(raw), 2)]
+    offset += _NUMBERS.size
+    total_types, global_mult, cpt_mult, cps_mult, discount, cpt = (
+        _SCALARS.unpack_from(data, offset)
+    )
+    offset += _SCALARS.size
+    amounts = array("q")
+    amounts.frombytes(data[offset : offset + 8 * _FACILITY_COUNT])
+    offset += 8 * _FACILITY_COUNT
+    bitset = data[offset:]
+    if any(amount < 0 for amount in amounts):
+        return Err("Save file is corrupt")
+
+    for facility in engine.facilities.values():
+        if amount := amounts[facility.index]:
+            facility.amount = amount
+
+    # Facility modifiers come from replaying upgrade effects; the saved
+    # multipliers below then overwrite whatever the effects did globally.
+    for index, upgrade_type in enumerate(_UPGRADE_BY_INDEX):
+        if not bitset[index >> 3] & 1 << (index & 7):
+            continue
+        engine.mark_purchased(upgrade_type)
+        engine.upgrade_manager.apply_effects(engine.upgrades[upgrade_type])
+        engine.unlock_manager.on_upgrade_purchased(upgrade_type)
+
+    stats = engine.stats
+    (
+        engine.cookies,
+        stats.total_cookies_ever,
+        stats.total_cookies_consumed_ever,
+        stats.total_cookies_lost_ever,
+        stats.total_cookies_ascension,
+        stats.total_cookies_by_type,
+        stats.total_cookies_by_facilities,
+    ) = numbers
+    stats.total_types = total_types
+    engine.global_multipliers["global"] = global_mult
+    engine.global_multipliers["cpt"] = cpt_mult
+    engine.global_multipliers["cps"] = cps_mult
+    engine.global_discount = discount
+    engine.cpt = cpt
+    engine.time = saved_time
+    engine.ticks = saved_ticks
+    engine.journal_seq = journal_seq
+    engine.invalidate_cps()
+    return Ok(None)
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Write data to path so a crash leaves either the old or the new file."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+def save_file(engine: CookeyTyper, path: str = DEFAULT_SAVE_PATH) -> None:
+    write_atomic(path, save_bytes(engine))
+
+
+def load_file(engine: CookeyTyper, path: str = DEFAULT_SAVE_PATH) -> Result[None, str]:
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except FileNotFoundError:
+        return Err("No save file")
+    except OSError as error:
+        return Err(f"Could not read save file: {error}")
+    return load_bytes(engine, data)
+
+
+class Autosaver:
+    """Writes saves on a background thread.
+
+    The tick thread encodes the state (a few microseconds) and hands the
+    bytes over; only the file write and fsync happen off-thread. If the
+    writer falls behind, the older pending save is replaced by the newer.
+    Every save gets a generation number and an older generation is never
+    written over a newer one, so save_now() cannot be undone by a stale
+    background write.
+    """
+
+    def __init__(self, path: str, interval: float) -> None:
+        self.path: str = path
+        self.interval: float = interval
+        self._pending: queue.Queue[tuple[int, bytes] | None] = queue.Queue(
+            maxsize=1
+        )
+        self._generation: int = 0
+        self._written_generation: int = 0
+        self._write_lock: threading.Lock = threading.Lock()
+        self._next_save: float = time.monotonic() + interval
+        self._thread: threading.Thread = threading.Thread(
+            target=self._write_loop, name="cookey-autosave", daemon=True
+        )
+        self._thread.start()
+
+    def maybe_save(self, engine: CookeyTyper) -> bool:
+        now = time.monotonic()
+        if now < self._next_save:
+            return False
+        self._next_save = now + self.interval
+        self._offer(self._encode(engine))
+        return True
+
+    def save_now(self, engine: CookeyTyper) -> None:
+        """Write a save synchronously; it is durable when this returns."""
+        generation, data = self._encode(engine)
+        self._write(generation, data)
+
+    def close(self, engine: CookeyTyper) -> None:
+        """Write a final save and stop the writer thread."""
+        self._offer(self._encode(engine))
+        self._pending.put(None)
+        self._thread.join()
+
+    def _encode(self, engine: CookeyTyper) -> tuple[int, bytes]:
+        engine.settle()
+        self._generation += 1
+        return (self._generation, save_bytes(engine))
+
+    def _write(self, generation: int, data: bytes) -> None:
+        with self._write_lock:
+            if generation <= self._written_generation:
+                return
+            write_atomic(self.path, data)
+            self._written_generation = generation
+
+    def _offer(self, save: tuple[int, bytes]) -> None:
+        while True:
+            try:
+                self._pending.put_nowait(save)
+                return
+            except queue.Full:
+                try:
+                    self._pending.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _write_loop(self) -> None:
+        while True:
+            save = self._pending.get()
+            if save is None:
+                return
+            try:
+                self._write(*save)
+            except OSError as error:
+                print(f"Autosave failed: {error}")
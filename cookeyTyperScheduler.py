@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass
+class TickStats:
+    ticks: int = 0
+    overruns: int = 0
+    catch_up_ticks: int = 0
+    dropped_ticks: int = 0
+    max_lateness: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationReport:
+    simulated_seconds: float
+    ticks: int
+    wall_seconds: float
+
+    @property
+    def ticks_per_second(self) -> float:
+        if self.wall_seconds <= 0:
+            return float("inf")
+        return self.ticks / self.wall_seconds
+
+
+class VirtualClock:
+    """A clock that only moves when told to, for deterministic runs."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now: float = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TickScheduler:
+    def __init__(
+        self,
+        tick_rate: int,
+        max_catch_up_ticks: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.interval: float = 1 / tick_rate
+        self.max_catch_up_ticks: int = max_catch_up_ticks
+        self.clock: Callable[[], float] = clock
+        self.sleep: Callable[[float], None] = sleep
+        self.stats: TickStats = TickStats()
+        self._deadline: float | None = None
+        self._last_tick: float = 0.0
+
+    def wait(self) -> list[float]:
+        """Block until the next deadline and return the dt of every tick due.
+
+        The measured time since the previous tick is split evenly over the
+        returned ticks, so production never depends on how long a tick took.
+        """
+        if self._deadline is None:
+            now = self.clock()
+            self._last_tick = now
+            self._deadline = now + self.interval
+
+        now = self.clock()
+        if now < self._deadline:
+            self.sleep(self._deadline - now)
+            now = self.clock()
+
+        lateness = now - self._deadline
+        due = 1 + int(lateness // self.interval) if lateness > 0 else 1
+        steps = min(due, 1 + self.max_catch_up_ticks)
+
+        if due > 1:
+            self.stats.overruns += 1
+            self.stats.catch_up_ticks += steps - 1
+            self.stats.dropped_ticks += due - steps
+        self.stats.max_lateness = max(self.stats.max_lateness, lateness)
+        self.stats.ticks += steps
+
+        elapsed = now - self._last_tick
+        self._last_tick = now
+        self._deadline += due * self.interval
+
+        return [elapsed / steps] * steps
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+# Longest user input that is scored; anything past it is ignored for the
+# correct-character count but still costs accuracy.
+MAX_INPUT_LENGTH = 4096
+
+
+@lru_cache(maxsize=256)
+def _match_masks(target: str) -> dict[str, int]:
+    masks: dict[str, int] = {}
+    for i, char in enumerate(target):
+        masks[char] = masks.get(char, 0) | 1 << i
+    return masks
+
+
+def lcs_length(target: str, user_input: str) -> int:
+    """Length of the longest common subsequence, bit-parallel over target.
+
+    Allison-Dix / Hyyro: one bit per target character, so each input
+    character costs a handful of integer operations. Stops as soon as every
+    target character is matched.
+    """
+    if not target or not user_input:
+        return 0
+    masks = _match_masks(target)
+    full = (1 << len(target)) - 1
+    row = full
+    for char in user_input[:MAX_INPUT_LENGTH]:
+        matches = row & masks.get(char, 0)
+        row = ((row + matches) | (row - matches)) & full
+        if not row:
+            break
+    return len(target) - row.bit_count()
+
+
+def typing_score(target: str, user_input: str) -> tuple[int, int]:
+    correct_chars = lcs_length(target, user_input)
+    accuracy_score = 2 * correct_chars - len(user_input)
+    return (correct_chars, max(0, accuracy_score))
+
+
+# The old SequenceMatcher scorer, kept as the reference for _main().
+def _difflib_score(target: str, user_input: str) -> tuple[int, int]:
+    import difflib
+
+    matcher = difflib.SequenceMatcher(None, target, user_input)
+    correct_chars = sum(match.size for match in matcher.get_matching_blocks())
+    accuracy_score = 2 * correct_chars - len(user_input)
+    return (correct_chars, max(0, accuracy_score))
+
+
+def _typo_corpus(seed: int = 0, variants: int = 20) -> list[tuple[str, str]]:
+    import random
+
+    from cookeyTyperData import sentences
+
+    rng = random.Random(seed)
+    corpus: list[tuple[str, str]] = []
+    for target in sentences():
+        for _ in range(variants):
+            typed = list(target)
+            for _ in range(rng.randint(0, 5)):
+                if not typed:
+                    break
+                i = rng.randrange(len(typed))
+                match rng.randrange(4):
+                    case 0:
+                        typed[i] = rng.choice("abcdefghijklmnopqrstuvwxyz ")
+                    case 1:
+                        del typed[i]
+                    case 2:
+                        typed.insert(i, rng.choice("abcdefghijklmnopqrstuvwxyz"))
+                    case _:
+                        if i + 1 < len(typed):
+                            typed[i], typed[i + 1] = typed[i + 1], typed[i]
+            corpus.append((target, "".join(typed)))
+    return corpus
+
+
+def _main() -> None:
+    """Check typing_score against difflib on a typo corpus and time both."""
+    import timeit
+
+    corpus = _typo_corpus()
+    mismatches = [
+        (target, typed)
+        for target, typed in corpus
+        if typing_score(target, typed) != _difflib_score(target, typed)
+    ]
+    print(f"corpus: {len(corpus)} lines, {len(mismatches)} differ from difflib")
+    for target, typed in mismatches[:5]:
+        print(
+            f"  {typed!r}: {typing_score(target, typed)} vs "
+            f"{_difflib_score(target, typed)}"
+        )
+
+    target = corpus[0][0]
+    cases = {
+        "typo line": corpus[1][1],
+        "pasted 100k": "x" * 100_000,
+    }
+    for label, typed in cases.items():
+        for name, scorer in (
+            ("bit-parallel", typing_score),
+            ("difflib", _difflib_score),
+        ):
+            number = 200 if len(typed) < 1000 else 5
+            seconds = timeit.timeit(lambda: scorer(target, typed), number=number)
+            print(f"{label:<12} {name:<13} {seconds / number * 1e6:10.1f} us")
+
+
+if __name__ == "__main__":
+    _main()
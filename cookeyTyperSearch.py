@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import sys
+import time
+from typing import Callable, Iterator
+
+
+class _Node[T]:
+    __slots__ = ("children", "key", "value")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node[T]] = {}
+        self.key: str | None = None
+        self.value: T | None = None
+
+
+class NameTrie[T]:
+    """Prefix trie over normalized names, for lookup and Tab completion."""
+
+    def __init__(self) -> None:
+        self._root: _Node[T] = _Node()
+
+    def insert(self, key: str, value: T) -> None:
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _Node())
+        if node.key is None:
+            node.key = key
+            node.value = value
+
+    def get(self, key: str) -> T | None:
+        node = self._find(key)
+        return node.value if node is not None else None
+
+    def complete(self, prefix: str, limit: int = 20) -> list[str]:
+        node = self._find(prefix)
+        if node is None:
+            return []
+        # Several keys can name the same value; offer only the first of them.
+        keys: list[str] = []
+        seen: set[T] = set()
+        stack = [node]
+        while stack and len(keys) < limit:
+            node = stack.pop()
+            value = node.value
+            if node.key is not None and value is not None and value not in seen:
+                keys.append(node.key)
+                seen.add(value)
+            stack.extend(
+                node.children[char] for char in sorted(node.children, reverse=True)
+            )
+        return keys
+
+    def _find(self, key: str) -> _Node[T] | None:
+        node = self._root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                return None
+            node = child
+        return node
+
+
+def _deletes(word: str, depth: int) -> set[str]:
+    """word and every string made by deleting up to depth characters."""
+    found = {word}
+    frontier = {word}
+    for _ in range(depth):
+        frontier = {
+            variant[:i] + variant[i + 1 :]
+            for variant in frontier
+            for i in range(len(variant))
+        }
+        found |= frontier
+    return found
+
+
+def _exact_deletes(word: str, depth: int) -> Iterator[str]:
+    """Strings made by deleting exactly depth (1 or 2) characters of word.
+
+    May repeat a string when word has runs of one letter; cheaper than
+    building the set.
+    """
+    size = len(word)
+    if depth == 1:
+        for i in range(size):
+            yield word[:i] + word[i + 1 :]
+        return
+    for i in range(size):
+        head = word[:i]
+        rest = word[i + 1 :]
+        for j in range(len(rest)):
+            yield head + rest[:j] + rest[j + 1 :]
+
+
+def osa_distance(a: str, b: str, bound: int) -> int:
+    """Optimal string alignment distance, or bound + 1 if it exceeds bound.
+
+    Insertions, deletions, substitutions and adjacent transpositions each
+    cost 1. Only the diagonal band of width 2 * bound + 1 is computed.
+    """
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+    limit = bound + 1
+    size = len(b)
+    row_before: list[int] = []
+    row = [j if j < limit else limit for j in range(size + 1)]
+    previous_char = ""
+    for i, char in enumerate(a, 1):
+        next_row = [limit] * (size + 1)
+        left = next_row[0] = i if i < limit else limit
+        best = left
+        low = i - bound if i > bound else 1
+        high = i + bound if i + bound < size else size
+        for j in range(low, high + 1):
+            other = b[j - 1]
+            distance = row[j - 1] if char == other else row[j - 1] + 1
+            if left + 1 < distance:
+                distance = left + 1
+            if row[j] + 1 < distance:
+                distance = row[j] + 1
+            if (
+                j > 1
+                and char == b[j - 2]
+                and previous_char == other
+                and row_before[j - 2] + 1 < distance
+            ):
+                distance = row_before[j - 2] + 1
+            if distance > limit:
+                distance = limit
+            next_row[j] = left = distance
+            if distance < best:
+                best = distance
+        if best >= limit:
+            return limit
+        row_before, row = row, next_row
+        previous_char = char
+    return row[size]
+
+
+class FuzzyIndex[T]:
+    """Nearest-name lookup within a small edit distance.
+
+    Symmetric-delete index: every key is stored under each string reachable
+    by deleting up to max_distance characters. Two words within distance d
+    share such a variant, so a lookup generates the query's own deletions,
+    collects the few keys filed under them and checks only those. Distance
+    1 is tried before 2, so a close match returns after about twenty dict
+    probes. The variants are built on the first lookup.
+    """
+
+    def __init__(self, max_distance: int = 2) -> None:
+        self.max_distance: int = max_distance
+        self._keys: dict[str, T] = {}
+        self._variants: dict[str, list[str]] | None = None
+
+    def insert(self, key: str, value: T) -> None:
+        self._keys.setdefault(key, value)
+        self._variants = None
+
+    def nearest(self, word: str, max_distance: int) -> tuple[int, str, T] | None:
+        """The closest key within max_distance, ties broken by key order."""
+        value = self._keys.get(word)
+        if value is not None:
+            return (0, word, value)
+        variants = self._build()
+        probes = [word]
+        for distance in range(1, min(max_distance, self.max_distance) + 1):
+            # Keys within distance share a variant with word made of at most
+            # distance deletions; the shorter variants were probed already
+            # but are checked again against the larger bound.
+            probes += _exact_deletes(word, distance)
+            best: tuple[int, str] | None = None
+            checked: set[str] = set()
+            for variant in probes:
+                for key in variants.get(variant, ()):
+                    if key in checked:
+                        continue
+                    checked.add(key)
+                    found = osa_distance(word, key, distance)
+                    if found <= distance and (best is None or (found, key) < best):
+                        best = (found, key)
+            if best is not None:
+                return (best[0], best[1], self._keys[best[1]])
+        return None
+
+    def _build(self) -> dict[str, list[str]]:
+        if self._variants is None:
+            variants: dict[str, list[str]] = {}
+            for key in self._keys:
+                for variant in _deletes(key, self.max_distance):
+                    variants.setdefault(variant, []).append(key)
+            self._variants = variants
+        return self._variants
+
+
+def _main() -> None:
+    """Time nearest() against difflib on typos of every upgrade name."""
+    import difflib
+    import random
+
+    from cookeyTyperData import upgrades
+    from cookeyTyperModels import normalize_name, upgrade_fuzzy, upgrade_index
+
+    rng = random.Random(1)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words: list[str] = []
+    for config in upgrades().values():
+        chars = list(normalize_name(config.name))
+        for _ in range(rng.choice((1, 2))):
+            i = rng.randrange(len(chars))
+            match rng.randrange(3):
+                case 0:
+                    chars[i] = rng.choice(letters)
+                case 1:
+                    del chars[i]
+                case _:
+                    chars.insert(i, rng.choice(letters))
+        words.append("".join(chars))
+
+    keys = list(upgrade_index())
+    fuzzy = upgrade_fuzzy()
+    fuzzy.nearest("warm_up", 2)
+    runs: tuple[tuple[str, Callable[[str], object]], ...] = (
+        ("FuzzyIndex.nearest", lambda word: fuzzy.nearest(word, 2)),
+        ("difflib", lambda word: difflib.get_close_matches(word, keys, 1, 0.8)),
+    )
+    for label, lookup in runs:
+        start = time.perf_counter()
+        for word in words:
+            lookup(word)
+        per_word = (time.perf_counter() - start) / len(words)
+        print(f"{label}: {per_word * 1e6:.1f} us per lookup")
+
+
+if __name__ == "__main__":
+    _main()
+    sys.exit(0)
@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import itertools
+import os
+import resource
+import sys
+import time
+from collections import OrderedDict
+from contextlib import redirect_stdout
+from typing import Callable, NamedTuple
+
+from cookeyTyperBatch import BatchTicker
+from cookeyTyperCore import CookeyTyper
+from cookeyTyperData import parameters
+from cookeyTyperSave import load_bytes, save_bytes
+from result import is_err
+
+DEFAULT_SOCKET_PATH = "cookeyTyper.sock"
+
+
+class HibernatedSession(NamedTuple):
+    """A session serialized out of memory: a save blob plus what the save
+    does not keep. A few hundred bytes instead of a whole engine."""
+
+    id: int
+    blob: bytes
+    started: float
+    last_input: float
+    target: str
+    # Reseeds the engine RNG, so the targets that follow do not restart from
+    # the session seed.
+    rng_seed: int
+
+
+class Session:
+    """One player's engine, driven by the server instead of a terminal.
+
+    Game time is wall time since the session opened. Idle sessions are not
+    stepped; advance_to credits their production in closed form the next
+    time they are touched.
+    """
+
+    def __init__(self, session_id: int, now: float) -> None:
+        self.id: int = session_id
+        self.engine: CookeyTyper = CookeyTyper(seed=session_id)
+        self.started: float = now
+        self.last_input: float = now
+
+    @classmethod
+    def restore(cls, session_id: int, blob: bytes, started: float) -> Session:
+        """Rebuild a session from export(), e.g. when waking it."""
+        session = cls(session_id, started)
+        loaded = load_bytes(session.engine, blob)
+        if is_err(loaded):
+            raise ValueError(loaded.error)
+        return session
+
+    @classmethod
+    def wake(cls, hibernated: HibernatedSession) -> Session:
+        """Restore a hibernated session. The idle interval is credited in
+        closed form by advance_to on the next catch_up."""
+        session = cls.restore(hibernated.id, hibernated.blob, hibernated.started)
+        session.last_input = hibernated.last_input
+        session.engine.handler.target = hibernated.target
+        session.engine.rng.seed(hibernated.rng_seed)
+        return session
+
+    def export(self) -> bytes:
+        return save_bytes(self.engine)
+
+    def hibernate(self) -> HibernatedSession:
+        self.engine.apply_mutations()
+        rng_seed = self.engine.rng.getrandbits(64)
+        # Reseed here too, so this copy and a woken one draw the same targets.
+        self.engine.rng.seed(rng_seed)
+        return HibernatedSession(
+            id=self.id,
+            blob=self.export(),
+            started=self.started,
+            last_input=self.last_input,
+            target=self.engine.handler.target,
+            rng_seed=rng_seed,
+        )
+
+    def catch_up(self, now: float) -> None:
+        self.engine.advance_to(now - self.started)
+
+    def welcome(self) -> str:
+        return self._capture(self.engine.handler.print_target)
+
+    def handle(self, line: str, now: float) -> str:
+        self.catch_up(now)
+        self.last_input = now
+        return self._capture(lambda: self.engine.handler.handle_input(line))
+
+    def _capture(self, action: Callable[[], object]) -> str:
+        # print() goes to this buffer; nothing awaits in between, so no other
+        # connection can write into it.
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            self.engine.apply_mutations()
+            action()
+            self.engine.apply_mutations()
+        return buffer.getvalue()
+
+
+class GameServer:
+    """Hosts many sessions over a Unix domain socket.
+
+    Each connection gets its own task and Session. One shared tick loop
+    steps only sessions that had input within active_window seconds; the
+    rest cost nothing until their next command. Active sessions are stepped
+    together by a BatchTicker, except the few it cannot hold (unbatched),
+    which are advanced one by one. active is kept in order of last input,
+    so a tick only looks at the sessions whose window has run out.
+
+    Sessions with no input for hibernate_after seconds are serialized to a
+    HibernatedSession and dropped from memory, and woken on their next
+    command, so resident memory follows active players rather than
+    connected ones.
+    """
+
+    def __init__(
+        self, path: str, active_window: float = 30.0, hibernate_after: float = 300.0
+    ) -> None:
+        self.path: str = path
+        self.active_window: float = active_window
+        self.hibernate_after: float = hibernate_after
+        self.sessions: dict[int, Session] = {}
+        self.active: OrderedDict[int, Session] = OrderedDict()
+        self.unbatched: dict[int, Session] = {}
+        # Resident but inactive sessions, roughly in order of last input.
+        self.idle: OrderedDict[int, Session] = OrderedDict()
+        self.hibernated: dict[int, HibernatedSession] = {}
+        self.batch: BatchTicker = BatchTicker(0.0)
+        self._ids: itertools.count[int] = itertools.count(1)
+
+    def open_session(self, now: float, session_id: int | None = None) -> Session:
+        if session_id is None:
+            session_id = next(self._ids)
+        return self.adopt(Session(session_id, now))
+
+    def adopt(self, session: Session) -> Session:
+        self.sessions[session.id] = session
+        self.idle[session.id] = session
+        return session
+
+    def session(self, session_id: int) -> Session:
+        """The resident session, woken from hibernation if need be."""
+        session = self.sessions.get(session_id)
+        if session is None:
+            session = self.adopt(Session.wake(self.hibernated.pop(session_id)))
+        return session
+
+    def detach(self, session_id: int, now: float) -> Session:
+        """Remove a session, brought up to now, without closing it."""
+        session = self.session(session_id)
+        self.batch.tick(now)
+        self.close_session(session_id)
+        session.catch_up(now)
+        return session
+
+    def close_session(self, session_id: int) -> None:
+        self.hibernated.pop(session_id, None)
+        self.idle.pop(session_id, None)
+        session = self.sessions.pop(session_id, None)
+        if session is not None:
+            self._deactivate(session)
+
+    def handle(self, session_id: int, line: str, now: float) -> str:
+        session = self.session(session_id)
+        self.idle.pop(session_id, None)
+        engine = session.engine
+        self.batch.tick(now)
+        if engine in self.batch:
+            self.batch.sync(engine)
+        output = session.handle(line, now)
+        self.active[session.id] = session
+        self.active.move_to_end(session.id)
+        if engine in self.batch:
+            batched = self.batch.refresh(engine)
+        else:
+            batched = self.batch.add(engine, session.started)
+        if batched:
+            self.unbatched.pop(session.id, None)
+        else:
+            self.unbatched[session.id] = session
+        return output
+
+    def tick(self, now: float) -> None:
+        self.batch.tick(now)
+        deadline = now - self.active_window
+        while self.active:
+            session = self.active[next(iter(self.active))]
+            if session.last_input >= deadline:
+                break
+            self._deactivate(session)
+            self.idle[session.id] = session
+        for session in list(self.unbatched.values()):
+            session.catch_up(now)
+            if self.batch.add(session.engine, session.started):
+                del self.unbatched[session.id]
+        self._hibernate_idle(now)
+
+    def _hibernate_idle(self, now: float) -> None:
+        # idle is ordered by last input, so stop at the first recent one.
+        deadline = now - self.hibernate_after
+        retry: list[Session] = []
+        while self.idle:
+            session = self.idle[next(iter(self.idle))]
+            if session.last_input > deadline:
+                break
+            del self.idle[session.id]
+            session.catch_up(now)
+            if session.engine.next_modifier_expiry() is not None:
+                # Timed buffs are not in the save; retry once they expire.
+                retry.append(session)
+                continue
+            del self.sessions[session.id]
+            self.hibernated[session.id] = session.hibernate()
+        for session in retry:
+            self.idle[session.id] = session
+
+    def _deactivate(self, session: Session) -> None:
+        if self.active.pop(session.id, None) is None:
+            return
+        self.unbatched.pop(session.id, None)
+        if session.engine in self.batch:
+            self.batch.remove(session.engine)
+
+    async def serve_forever(self) -> None:
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        server = await asyncio.start_unix_server(self._connection, path=self.path)
+        ticker = asyncio.create_task(self.run_ticks())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            ticker.cancel()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    async def run_ticks(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = 1 / parameters().tick_rate
+        deadline = loop.time()
+        while True:
+            deadline += interval
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+            now = loop.time()
+            if now - deadline > interval:
+                # Fell behind; production is closed form, so just skip ahead.
+                deadline = now
+            self.tick(now)
+
+    async def _connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        session_id = self.open_session(loop.time()).id
+        try:
+            writer.write(self.sessions[session_id].welcome().encode())
+            await writer.drain()
+            while raw := await reader.readline():
+                line = raw.decode(errors="replace").rstrip("\r\n")
+                writer.write(self.handle(session_id, line, loop.time()).encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.close_session(session_id)
+            writer.close()
+
+
+async def _bench_idle(count: int, seconds: float) -> None:
+    server = GameServer(DEFAULT_SOCKET_PATH)
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    for _ in range(count):
+        server.open_session(loop.time())
+    print(f"opened {count} sessions in {time.perf_counter() - start:.2f} s")
+
+    ticker = asyncio.create_task(server.run_ticks())
+    cpu_start = time.process_time()
+    await asyncio.sleep(seconds)
+    cpu = time.process_time() - cpu_start
+    ticker.cancel()
+
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"idle for {seconds:.0f} s: {cpu / seconds * 100:.1f}% of one core")
+    print(f"peak RSS: {rss_mb:.0f} MB ({rss_mb * 1024 / count:.1f} KB per session)")
+
+
+def _bench_tick(count: int, ticks: int) -> None:
+    """Time GameServer.tick with count sessions that all just had input."""
+    server = GameServer(DEFAULT_SOCKET_PATH)
+    for _ in range(count):
+        session = server.open_session(0.0)
+        server.handle(session.id, "cc", 0.0)
+    dt = 1 / parameters().tick_rate
+    start = time.perf_counter()
+    for i in range(1, ticks + 1):
+        server.tick(i * dt)
+    per_tick = (time.perf_counter() - start) / ticks
+    print(f"{count} active sessions: {per_tick * 1000:.2f} ms per GameServer.tick")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Host CookeyTyper sessions.")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH)
+    parser.add_argument(
+        "--bench-idle",
+        type=int,
+        metavar="N",
+        help="open N idle sessions in-process and report CPU and memory",
+    )
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument(
+        "--bench-tick",
+        type=int,
+        metavar="N",
+        help="time the server tick with N active sessions",
+    )
+    parser.add_argument(
+        "--hibernate-after",
+        type=float,
+        default=300.0,
+        metavar="SECONDS",
+        help="serialize sessions idle this long out of memory",
+    )
+    args = parser.parse_args(argv)
+
+    if args.bench_idle is not None:
+        asyncio.run(_bench_idle(args.bench_idle, args.seconds))
+        return 0
+    if args.bench_tick is not None:
+        _bench_tick(args.bench_tick, 200)
+        return 0
+
+    print(f"Serving on {args.socket} (connect with: nc -U {args.socket})")
+    try:
+        server = GameServer(args.socket, hibernate_after=args.hibernate_after)
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, Pipe
+from typing import cast
+
+from cookeyTyperData import parameters
+from cookeyTyperServer import (
+    DEFAULT_SOCKET_PATH,
+    GameServer,
+    HibernatedSession,
+    Session,
+)
+from result import Err, Ok, Result, is_err
+
+# Worker protocol: the supervisor sends one tuple and waits for one reply,
+# Ok(value) as listed below, or Err(text) if the worker could not do it.
+#   ("open", sid, now)               -> welcome text
+#   ("batch", [(sid, line, now)])    -> list of output texts
+#   ("close", sid)                   -> None
+#   ("export", sid, now)             -> HibernatedSession
+#   ("import", hibernated)           -> None
+#   ("load",)                        -> (busy fraction, sessions, active)
+#   ("stop",)                        -> None, then the worker exits
+type Message = tuple[object, ...]
+type Reply = Result[object, str]
+type SupervisorEnd = Connection[Message, Reply]
+type WorkerEnd = Connection[Reply, Message]
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerLoad:
+    index: int
+    busy: float
+    sessions: int
+    active: int
+
+
+def _failure(error: Exception) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+def _failure_text(error: str) -> str:
+    return f"[CRITICAL ERROR] Shard worker failed: {error}\n"
+
+
+def _handle(server: GameServer, session_id: int, line: str, now: float) -> str:
+    # One broken session must not take the others on its worker down.
+    try:
+        return server.handle(session_id, line, now)
+    except Exception as error:
+        return _failure_text(_failure(error))
+
+
+def _dispatch(server: GameServer, message: Message) -> object:
+    match message:
+        case ("open", int(session_id), float(now)):
+            return server.open_session(now, session_id).welcome()
+        case ("batch", commands):
+            return [
+                _handle(server, session_id, line, now)
+                for session_id, line, now in cast(
+                    list[tuple[int, str, float]], commands
+                )
+            ]
+        case ("close", int(session_id)):
+            server.close_session(session_id)
+            return None
+        case ("export", int(session_id), float(now)):
+            return server.detach(session_id, now).hibernate()
+        case ("import", HibernatedSession() as hibernated):
+            server.adopt(Session.wake(hibernated))
+            return None
+        case _:
+            raise ValueError(f"Unknown worker message: {message[0]!r}")
+
+
+def _worker_main(conn: WorkerEnd) -> None:
+    server = GameServer(path="")
+    interval = 1 / parameters().tick_rate
+    next_tick = time.monotonic() + interval
+    window_start = time.monotonic()
+    busy = 0.0
+
+    while True:
+        if conn.poll(max(0.0, next_tick - time.monotonic())):
+            message = conn.recv()
+            started = time.perf_counter()
+            match message:
+                case ("stop",):
+                    conn.send(Ok(None))
+                    return
+                case ("load",):
+                    now = time.monotonic()
+                    window = max(now - window_start, 1e-9)
+                    load = (busy / window, len(server.sessions), len(server.active))
+                    conn.send(Ok(load))
+                    window_start, busy = now, 0.0
+                    continue
+                case _:
+                    try:
+                        reply: Reply = Ok(_dispatch(server, message))
+                    except Exception as error:
+                        reply = Err(_failure(error))
+                    conn.send(reply)
+            busy += time.perf_counter() - started
+
+        now = time.monotonic()
+        if now >= next_tick:
+            started = time.perf_counter()
+            server.tick(now)
+            busy += time.perf_counter() - started
+            # Production is closed form, so a late worker just skips ahead.
+            next_tick = max(next_tick + interval, now)
+
+
+class ShardSupervisor:
+    """Spreads sessions over worker processes, one GameServer in each.
+
+    A session lives on the worker its id hashes to until rebalance() moves
+    it: the session is hibernated on the hot worker and woken on the coldest
+    one, target, last input and RNG position included. Calls for different workers can
+    run concurrently from different threads; calls to one worker are
+    serialized by its lock. The routing lock guards placement and is held
+    for a whole move, so no command or close reaches a session while it is
+    between workers. It is always taken before a worker lock.
+    """
+
+    def __init__(self, workers: int, hot_load: float = 0.75) -> None:
+        self.hot_load: float = hot_load
+        self.placement: dict[int, int] = {}
+        self._routing: threading.Lock = threading.Lock()
+        self._conns: list[SupervisorEnd] = []
+        self._processes: list[multiprocessing.Process] = []
+        self._locks: list[threading.Lock] = []
+        for index in range(workers):
+            parent, child = cast(tuple[SupervisorEnd, WorkerEnd], Pipe())
+            process = multiprocessing.Process(
+                target=_worker_main,
+                args=(child,),
+                name=f"cookey-shard-{index}",
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self._conns.append(parent)
+            self._processes.append(process)
+            self._locks.append(threading.Lock())
+
+    @property
+    def workers(self) -> int:
+        return len(self._conns)
+
+    def worker_of(self, session_id: int) -> int:
+        worker = self.placement.get(session_id)
+        if worker is None:
+            worker = zlib.crc32(session_id.to_bytes(8, "little")) % self.workers
+        return worker
+
+    def open(self, session_id: int) -> str:
+        with self._routing:
+            worker = self.worker_of(session_id)
+            self.placement[session_id] = worker
+            reply = self._request(worker, ("open", session_id, time.monotonic()))
+        return _text(reply)
+
+    def close(self, session_id: int) -> None:
+        with self._routing:
+            worker = self.placement.pop(session_id, None)
+            if worker is not None:
+                self._request(worker, ("close", session_id))
+
+    def send(self, session_id: int, line: str) -> str:
+        return self.send_many([(session_id, line)])[0]
+
+    def send_many(self, commands: list[tuple[int, str]]) -> list[str]:
+        """Route commands to their workers; all workers run them in parallel."""
+        now = time.monotonic()
+        outputs: list[str] = [""] * len(commands)
+        groups: dict[int, list[int]] = {}
+        with self._routing:
+            for position, (session_id, _) in enumerate(commands):
+                worker = self.placement.get(session_id)
+                if worker is None:
+                    outputs[position] = _failure_text(f"no session {session_id}")
+                else:
+                    groups.setdefault(worker, []).append(position)
+            # Holding the worker locks keeps a move from starting until these
+            # batches are answered.
+            workers = sorted(groups)
+            for worker in workers:
+                self._locks[worker].acquire()
+        try:
+            for worker in workers:
+                batch = [(*commands[position], now) for position in groups[worker]]
+                self._conns[worker].send(("batch", batch))
+            for worker in workers:
+                reply = self._conns[worker].recv()
+                if is_err(reply):
+                    replies = [_failure_text(reply.error)] * len(groups[worker])
+                else:
+                    replies = cast(list[str], reply.value)
+                for position, output in zip(groups[worker], replies):
+                    outputs[position] = output
+        finally:
+            for worker in workers:
+                self._locks[worker].release()
+        return outputs
+
+    def loads(self) -> list[WorkerLoad]:
+        loads: list[WorkerLoad] = []
+        for index in range(self.workers):
+            reply = self._request(index, ("load",))
+            if is_err(reply):
+                raise RuntimeError(reply.error)
+            busy, sessions, active = cast(tuple[float, int, int], reply.value)
+            loads.append(WorkerLoad(index, busy, sessions, active))
+        return loads
+
+    def move(self, session_id: int, worker: int) -> bool:
+        """Move a session to worker. Returns False if it stayed put."""
+        with self._routing:
+            source = self.placement.get(session_id)
+            if source is None or source == worker:
+                return False
+            exported = self._request(
+                source, ("export", session_id, time.monotonic())
+            )
+            if is_err(exported):
+                return False
+            restore = ("import", cast(HibernatedSession, exported.value))
+            if is_err(self._request(worker, restore)):
+                # The export is all that is left of the session; put it back.
+                self._request(source, restore)
+                return False
+            self.placement[session_id] = worker
+            return True
+
+    def rebalance(self) -> int:
+        """Move sessions off a worker that runs hot. Returns how many moved."""
+        loads = self.loads()
+        hot = max(loads, key=lambda load: load.busy)
+        cold = min(loads, key=lambda load: load.busy)
+        if hot.busy < self.hot_load or hot.busy - cold.busy < self.hot_load / 3:
+            return 0
+        with self._routing:
+            on_hot = [
+                sid for sid, worker in self.placement.items() if worker == hot.index
+            ]
+        # Move the share of sessions that would even out the two workers.
+        # Each move takes the routing lock on its own, so commands for other
+        # sessions keep flowing in between.
+        count = max(1, int(len(on_hot) * (hot.busy - cold.busy) / (2 * hot.busy)))
+        return sum(self.move(session_id, cold.index) for session_id in on_hot[:count])
+
+    def shutdown(self) -> None:
+        for index in range(self.workers):
+            self._request(index, ("stop",))
+        for process in self._processes:
+            process.join()
+
+    def _request(self, worker: int, message: Message) -> Reply:
+        with self._locks[worker]:
+            self._conns[worker].send(message)
+            return self._conns[worker].recv()
+
+
+def _text(reply: Reply) -> str:
+    if is_err(reply):
+        return _failure_text(reply.error)
+    return cast(str, reply.value)
+
+
+class ShardedServer:
+    """The Unix-socket front end of GameServer, backed by a ShardSupervisor."""
+
+    def __init__(
+        self, path: str, supervisor: ShardSupervisor, rebalance_every: float = 5.0
+    ) -> None:
+        self.path: str = path
+        self.supervisor: ShardSupervisor = supervisor
+        self.rebalance_every: float = rebalance_every
+        self._ids: itertools.count[int] = itertools.count(1)
+
+    async def serve_forever(self) -> None:
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        server = await asyncio.start_unix_server(self._connection, path=self.path)
+        balancer = asyncio.create_task(self._rebalance_loop())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            balancer.cancel()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    async def _rebalance_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.rebalance_every)
+            await asyncio.to_thread(self.supervisor.rebalance)
+
+    async def _connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        session_id = next(self._ids)
+        try:
+            welcome = await asyncio.to_thread(self.supervisor.open, session_id)
+            writer.write(welcome.encode())
+            await writer.drain()
+            while raw := await reader.readline():
+                line = raw.decode(errors="replace").rstrip("\r\n")
+                output = await asyncio.to_thread(self.supervisor.send, session_id, line)
+                writer.write(output.encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            await asyncio.to_thread(self.supervisor.close, session_id)
+            writer.close()
+
+
+def _bench(workers: int, sessions: int, rounds: int) -> None:
+    supervisor = ShardSupervisor(workers)
+    try:
+        for session_id in range(1, sessions + 1):
+            supervisor.open(session_id)
+        line = "The quick brown fox jumps over the lazy cookie jar " * 4
+        commands = [(session_id, line) for session_id in range(1, sessions + 1)]
+        start = time.perf_counter()
+        for _ in range(rounds):
+            supervisor.send_many(commands)
+        elapsed = time.perf_counter() - start
+        total = sessions * rounds
+        print(f"{workers} worker(s): {total / elapsed:,.0f} commands/s")
+        counts = [load.sessions for load in supervisor.loads()]
+        print(f"sessions per worker: {counts}")
+    finally:
+        supervisor.shutdown()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Host CookeyTyper sessions across worker processes."
+    )
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--bench",
+        type=int,
+        metavar="SESSIONS",
+        help="time typed commands across SESSIONS sessions instead of serving",
+    )
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if args.bench is not None:
+        _bench(args.workers, args.bench, args.rounds)
+        return 0
+
+    supervisor = ShardSupervisor(args.workers)
+    print(f"Serving on {args.socket} with {args.workers} worker(s)")
+    try:
+        asyncio.run(ShardedServer(args.socket, supervisor).serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        supervisor.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from cookeyTyperNumber import BigNumber
+from cookeyTyperTypes import FacilityTypes, UpgradeTypes, VisualState
+
+if TYPE_CHECKING:
+    from cookeyTyperCore import CookeyTyper
+
+
+class FacilityRow(NamedTuple):
+    type: FacilityTypes
+    name: str
+    description: str
+    visual_state: VisualState
+    amount: int
+    base_cps: float
+    cps: BigNumber
+    next_cost: BigNumber
+
+
+class UpgradeRow(NamedTuple):
+    type: UpgradeTypes
+    name: str
+    description: str
+    price: int
+
+
+class EngineSnapshot(NamedTuple):
+    time: float
+    cookies: BigNumber
+    cps: BigNumber
+    cpt: float
+    cpt_multiplier: float
+    facilities: tuple[FacilityRow, ...]
+    available_upgrades: tuple[UpgradeRow, ...]
+
+
+class SnapshotPublisher:
+    """Builds immutable EngineSnapshots, copying only the parts that changed.
+
+    The facility and upgrade tuples are rebuilt only when their version
+    counter moves, and a tick that changes nothing returns the previous
+    snapshot itself, so steady-state ticks allocate at most one small tuple.
+    """
+
+    def __init__(self, engine: CookeyTyper) -> None:
+        self.engine: CookeyTyper = engine
+        self._facility_version: int = -1
+        self._upgrade_version: int = -1
+        self._facilities: tuple[FacilityRow, ...] = ()
+        self._upgrades: tuple[UpgradeRow, ...] = ()
+        self.current: EngineSnapshot | None = None
+
+    def publish(self) -> EngineSnapshot:
+        engine = self.engine
+        table = engine.facility_table
+        if table.version != self._facility_version:
+            self._facility_version = table.version
+            self._facilities = tuple(
+                FacilityRow(
+                    type=facility.type,
+                    name=facility.name,
+                    description=facility.description,
+                    visual_state=facility.visual_state,
+                    amount=facility.amount,
+                    base_cps=facility.base_cps,
+                    cps=facility.cps,
+                    next_cost=facility.next_cost(),
+                )
+                for facility in engine.facilities.values()
+            )
+        if engine.upgrade_version != self._upgrade_version:
+            self._upgrade_version = engine.upgrade_version
+            self._upgrades = tuple(
+                UpgradeRow(
+                    type=upgrade.type,
+                    name=upgrade.name,
+                    description=upgrade.description,
+                    price=upgrade.price,
+                )
+                for upgrade in engine.available_upgrades
+            )
+
+        current = self.current
+        cpt_multiplier = engine.global_multipliers["cpt"]
+        if (
+            current is not None
+            and current.time == engine.time
+            and current.cookies is engine.cookies
+            and current.cps is engine.cps
+            and current.cpt == engine.cpt
+            and current.cpt_multiplier == cpt_multiplier
+            and current.facilities is self._facilities
+            and current.available_upgrades is self._upgrades
+        ):
+            return current
+
+        self.current = EngineSnapshot(
+            time=engine.time,
+            cookies=engine.cookies,
+            cps=engine.cps,
+            cpt=engine.cpt,
+            cpt_multiplier=cpt_multiplier,
+            facilities=self._facilities,
+            available_upgrades=self._upgrades,
+        )
+        return self.current
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from cookeyTyperData import facilities
+from cookeyTyperNumber import BigNumber, Number
 from cookeyTyperTypes import CookieSource, FacilityConfig, FacilityTypes, VisualState
 
 if TYPE_CHECKING:
@@ -16,16 +17,16 @@ class CookeyTyperStats:
             list[FacilityTypes], list[FacilityConfig]
         ] = (list(facilities().keys()), list(facilities().values()))
 
-        self.total_cookies_ever: float = 0
-        self.total_cookies_consumed_ever: float = 0
-        self.total_cookies_lost_ever: float = 0
-        self.total_cookies_ascension: float = 0
+        self.total_cookies_ever: BigNumber = BigNumber()
+        self.total_cookies_consumed_ever: BigNumber = BigNumber()
+        self.total_cookies_lost_ever: BigNumber = BigNumber()
+        self.total_cookies_ascension: BigNumber = BigNumber()
         self.total_types: int = 0
-        self.total_cookies_by_type: float = 0
-        self.total_cookies_by_facilities: float = 0
+        self.total_cookies_by_type: BigNumber = BigNumber()
+        self.total_cookies_by_facilities: BigNumber = BigNumber()
 
     def on_cookie_amount_change(
-        self, amount: float, source: CookieSource = CookieSource.ELSE
+        self, amount: Number, source: CookieSource = CookieSource.ELSE
     ) -> None:
         if amount >= 0:
             match source:
@@ -46,17 +47,25 @@ class CookeyTyperStats:
                     pass
 
     def update(self) -> None:
-        if (
-            self.total_cookies_ascension
-            >= self.facility_visual_state_manager[1][0]["base_cost"]
+        while (
+            len(self.facility_visual_state_manager[1]) >= 3
+            and self.total_cookies_ascension
+            >= self.facility_visual_state_manager[1][0].base_cost
         ):
-            if len(self.facility_visual_state_manager[1]) >= 3:
-                self.engine.facilities[
-                    self.facility_visual_state_manager[0][0]
-                ].visual_state = VisualState.SHOWN
-                self.engine.facilities[
-                    self.facility_visual_state_manager[0][2]
-                ].visual_state = VisualState.COVERED
-
-                self.facility_visual_state_manager[0].pop(0)
-                self.facility_visual_state_manager[1].pop(0)
+            self.engine.facilities[
+                self.facility_visual_state_manager[0][0]
+            ].visual_state = VisualState.SHOWN
+            self.engine.facilities[
+                self.facility_visual_state_manager[0][2]
+            ].visual_state = VisualState.COVERED
+
+            self.facility_visual_state_manager[0].pop(0)
+            self.facility_visual_state_manager[1].pop(0)
+
+    def next_cookie_threshold(self) -> int | None:
+        if len(self.facility_visual_state_manager[1]) < 3:
+            return None
+        threshold = self.facility_visual_state_manager[1][0].base_cost
+        if threshold <= self.total_cookies_ascension:
+            return None
+        return threshold
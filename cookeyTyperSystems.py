@@ -1,14 +1,22 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
 
 from cookeyTyperData import upgrades
-from cookeyTyperModels import Effect, Modifier, Upgrade
+from cookeyTyperModels import Effect, EffectTarget, Modifier, Upgrade
 from cookeyTyperTypes import (
     CookieSource,
     EffectType,
     FacilityTypes,
     ModifierSourceType,
+    UnlockAll,
+    UnlockAny,
+    UnlockCondition,
+    UnlockFacilityCount,
+    UnlockTotalCookies,
+    UnlockUpgradeOwned,
+    UpgradeConfig,
     UpgradeTypes,
     VisualState,
 )
@@ -17,38 +25,124 @@ if TYPE_CHECKING:
     from cookeyTyperCore import CookeyTyper
 
 
-def create_upgrade_from_config(
-    upgrade_type: UpgradeTypes, engine: CookeyTyper
-) -> Upgrade:
-    config = upgrades()[upgrade_type]
-    target = config["target"]
+def shared_upgrades() -> Mapping[UpgradeTypes, Upgrade]:
+    """The Upgrade records, built once and read by every engine."""
+    return _UPGRADES
+
+
+def _upgrade_parts(
+    config: UpgradeConfig,
+) -> tuple[tuple[Effect[EffectTarget], ...], UnlockCondition]:
     effect = Effect(
-        target=target, effect_type=config["effect_type"], value=config["value"]
+        target=config.target, effect_type=config.effect_type, value=config.value
     )
+    unlock_condition = config.unlock or UnlockFacilityCount(
+        facility=config.unlock_facility, count=config.unlock_count
+    )
+    return ((effect,), unlock_condition)
 
-    unlock_facility = config["unlock_facility"]
-    unlock_count = config["unlock_count"]
 
-    def unlock_condition(e: CookeyTyper) -> bool:
-        facility = e.facilities.get(unlock_facility)
-        if facility is None:
-            return False
-        return facility.amount >= unlock_count
-
-    return Upgrade(
-        type=upgrade_type,
-        name=config["name"],
-        description=config["description"],
-        price=config["price"],
-        effects=[effect],
-        unlock_condition=unlock_condition,
-    )
+def evaluate_condition(condition: UnlockCondition, engine: CookeyTyper) -> bool:
+    match condition:
+        case UnlockFacilityCount(facility_type, count):
+            facility = engine.facilities.get(facility_type)
+            return facility is not None and facility.amount >= count
+        case UnlockTotalCookies(amount):
+            return engine.stats.total_cookies_ascension >= amount
+        case UnlockUpgradeOwned(upgrade_type):
+            return engine.is_purchased(upgrade_type)
+        case UnlockAll(conditions):
+            return all(evaluate_condition(c, engine) for c in conditions)
+        case UnlockAny(conditions):
+            return any(evaluate_condition(c, engine) for c in conditions)
+
+
+def condition_dependencies(
+    condition: UnlockCondition,
+) -> set[FacilityTypes | UpgradeTypes]:
+    match condition:
+        case UnlockFacilityCount(facility_type, _):
+            return {facility_type}
+        case UnlockTotalCookies():
+            return set()
+        case UnlockUpgradeOwned(upgrade_type):
+            return {upgrade_type}
+        case UnlockAll(conditions) | UnlockAny(conditions):
+            return set[FacilityTypes | UpgradeTypes]().union(
+                *(condition_dependencies(c) for c in conditions)
+            )
+
+
+def cookie_thresholds(condition: UnlockCondition) -> list[float]:
+    match condition:
+        case UnlockTotalCookies(amount):
+            return [amount]
+        case UnlockAll(conditions) | UnlockAny(conditions):
+            return [amount for c in conditions for amount in cookie_thresholds(c)]
+        case _:
+            return []
+
+
+class _UnlockIndex:
+    """Which upgrade unlocks on what; identical for every engine."""
+
+    def __init__(self) -> None:
+        # Plain facility-count conditions: (count, upgrade) sorted per facility.
+        self.thresholds: dict[FacilityTypes, list[tuple[int, UpgradeTypes]]] = {}
+        # Every cookie amount mentioned by any condition, sorted.
+        self.cookie_thresholds: list[tuple[float, UpgradeTypes]] = []
+        # Any other condition is re-evaluated whenever one of its
+        # dependencies (a facility or an upgrade) changes.
+        self.dependents: dict[FacilityTypes | UpgradeTypes, list[UpgradeTypes]] = {}
+
+        for upgrade_type, (_, condition) in _UPGRADE_PARTS.items():
+            match condition:
+                case UnlockFacilityCount(facility_type, count):
+                    self.thresholds.setdefault(facility_type, []).append(
+                        (count, upgrade_type)
+                    )
+                case _:
+                    for dependency in condition_dependencies(condition):
+                        self.dependents.setdefault(dependency, []).append(
+                            upgrade_type
+                        )
+            for amount in cookie_thresholds(condition):
+                self.cookie_thresholds.append((amount, upgrade_type))
+        for thresholds in self.thresholds.values():
+            thresholds.sort(key=lambda threshold: threshold[0])
+        self.cookie_thresholds.sort(key=lambda threshold: threshold[0])
 
 
 class UnlockManager:
     def __init__(self, engine: CookeyTyper) -> None:
         self.engine = engine
 
+        self._unlocked: set[UpgradeTypes] = set()
+
+        # The index is shared and read-only; only the cursors past every
+        # threshold already reached belong to this engine.
+        self._thresholds = _UNLOCK_INDEX.thresholds
+        self._cursors: dict[FacilityTypes, int] = dict.fromkeys(self._thresholds, 0)
+        self._pending_facilities: set[FacilityTypes] = set(self._thresholds)
+
+        self._cookie_thresholds = _UNLOCK_INDEX.cookie_thresholds
+        self._cookie_cursor: int = 0
+
+        self._dependents = _UNLOCK_INDEX.dependents
+        self._pending_dependencies: set[FacilityTypes | UpgradeTypes] = set(
+            self._dependents
+        )
+
+    def on_facility_change(self, facility_type: FacilityTypes) -> None:
+        if facility_type in self._thresholds:
+            self._pending_facilities.add(facility_type)
+        if facility_type in self._dependents:
+            self._pending_dependencies.add(facility_type)
+
+    def on_upgrade_purchased(self, upgrade_type: UpgradeTypes) -> None:
+        if upgrade_type in self._dependents:
+            self._pending_dependencies.add(upgrade_type)
+
     def check_unlocks(self) -> None:
         self._check_facility_unlocks()
         self._check_upgrade_unlocks()
@@ -68,14 +162,85 @@ class UnlockManager:
                 if total >= facility.base_cost:
                     facility.visual_state = VisualState.SHOWN
 
-    def _check_upgrade_unlocks(self) -> None:
-        for upgrade in self.engine.upgrades.values():
-            if upgrade.is_purchased:
+    def next_cookie_threshold(self) -> float | None:
+        total = self.engine.stats.total_cookies_ascension
+        threshold: float | None = None
+        if self._cookie_cursor < len(self._cookie_thresholds):
+            amount = self._cookie_thresholds[self._cookie_cursor][0]
+            if total < amount:
+                threshold = amount
+        for facility in self.engine.facilities.values():
+            if facility.visual_state != VisualState.COVERED:
                 continue
-            if upgrade in self.engine.available_upgrades:
+            if total < facility.base_cost and (
+                threshold is None or facility.base_cost < threshold
+            ):
+                threshold = facility.base_cost
+        return threshold
+
+    def _check_upgrade_unlocks(self) -> None:
+        while self._pending_facilities:
+            facility_type = self._pending_facilities.pop()
+            facility = self.engine.facilities.get(facility_type)
+            if facility is None:
                 continue
-            if upgrade.unlock_condition(self.engine):
-                self.engine.available_upgrades.append(upgrade)
+            thresholds = self._thresholds[facility_type]
+            cursor = self._cursors[facility_type]
+            while cursor < len(thresholds) and thresholds[cursor][0] <= facility.amount:
+                self._unlock(thresholds[cursor][1])
+                cursor += 1
+            self._cursors[facility_type] = cursor
+
+        total = self.engine.stats.total_cookies_ascension
+        while (
+            self._cookie_cursor < len(self._cookie_thresholds)
+            and self._cookie_thresholds[self._cookie_cursor][0] <= total
+        ):
+            self._try_unlock(self._cookie_thresholds[self._cookie_cursor][1])
+            self._cookie_cursor += 1
+
+        while self._pending_dependencies:
+            dependency = self._pending_dependencies.pop()
+            for upgrade_type in self._dependents[dependency]:
+                self._try_unlock(upgrade_type)
+
+    def _try_unlock(self, upgrade_type: UpgradeTypes) -> None:
+        if upgrade_type in self._unlocked:
+            return
+        upgrade = self.engine.upgrades[upgrade_type]
+        if evaluate_condition(upgrade.unlock_condition, self.engine):
+            self._unlock(upgrade_type)
+
+    def _unlock(self, upgrade_type: UpgradeTypes) -> None:
+        if upgrade_type in self._unlocked:
+            return
+        self._unlocked.add(upgrade_type)
+        if not self.engine.is_purchased(upgrade_type):
+            self.engine.available_upgrades.append(self.engine.upgrades[upgrade_type])
+            self.engine.upgrade_version += 1
+
+
+# Effects and unlock conditions depend only on the upgrade config, so the
+# managers of every engine read them from here rather than each keeping a copy.
+_UPGRADE_PARTS: dict[
+    UpgradeTypes, tuple[tuple[Effect[EffectTarget], ...], UnlockCondition]
+] = {
+    upgrade_type: _upgrade_parts(config) for upgrade_type, config in upgrades().items()
+}
+_UNLOCK_INDEX: _UnlockIndex = _UnlockIndex()
+_UPGRADES: Mapping[UpgradeTypes, Upgrade] = MappingProxyType(
+    {
+        upgrade_type: Upgrade(
+            type=upgrade_type,
+            name=config.name,
+            description=config.description,
+            price=config.price,
+            effects=_UPGRADE_PARTS[upgrade_type][0],
+            unlock_condition=_UPGRADE_PARTS[upgrade_type][1],
+        )
+        for upgrade_type, config in upgrades().items()
+    }
+)
 
 
 class UpgradeManager:
@@ -88,7 +253,7 @@ class UpgradeManager:
             print(f"Upgrade {upgrade_type} not found.")
             return False
 
-        if upgrade.is_purchased:
+        if self.engine.is_purchased(upgrade_type):
             print(f"Upgrade '{upgrade.name}' is already purchased.")
             return False
 
@@ -96,20 +261,21 @@ class UpgradeManager:
             print(f"Upgrade '{upgrade.name}' is not yet available.")
             return False
 
-        if self.engine.cookies < upgrade.price:
+        if not self.engine.delta_cookie(-upgrade.price, CookieSource.UPGRADE_PURCHASE):
             print(
                 f"Not enough cookies. Need {upgrade.price}, have {int(self.engine.cookies)}."
             )
             return False
 
-        self.engine.delta_cookie(-upgrade.price, CookieSource.UPGRADE_PURCHASE)
-        upgrade.is_purchased = True
+        self.engine.mark_purchased(upgrade_type)
         self.engine.available_upgrades.remove(upgrade)
-        self._apply_effects(upgrade)
+        self.engine.upgrade_version += 1
+        self.apply_effects(upgrade)
+        self.engine.unlock_manager.on_upgrade_purchased(upgrade.type)
         print(f"Purchased upgrade: {upgrade.name}")
         return True
 
-    def _apply_effects(self, upgrade: Upgrade) -> None:
+    def apply_effects(self, upgrade: Upgrade) -> None:
         for effect in upgrade.effects:
             target = effect.target
             if isinstance(target, FacilityTypes):
@@ -132,3 +298,4 @@ class UpgradeManager:
                     self.engine.global_multipliers["cpt"] *= effect.value
                 elif effect.effect_type == EffectType.ADD:
                     pass
+        self.engine.invalidate_cps()
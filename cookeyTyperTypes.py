@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Literal, TypedDict, Union
+from typing import Literal, NamedTuple, Union
 
 
 type EffectTarget = "FacilityTypes | Literal['Global'] | Literal['Click']"
@@ -312,7 +312,7 @@ class EffectType(Enum):
     MULTIPLIER = auto()
 
 
-class FacilityConfig(TypedDict):
+class FacilityConfig(NamedTuple):
     name: str
     description: str
     base_cost: int
@@ -320,7 +320,45 @@ class FacilityConfig(TypedDict):
     init_visual: VisualState
 
 
-class UpgradeConfig(TypedDict):
+# ----------   Unlock Conditions   ----------
+
+
+@dataclass(frozen=True, slots=True)
+class UnlockFacilityCount:
+    facility: FacilityTypes
+    count: int
+
+
+@dataclass(frozen=True, slots=True)
+class UnlockTotalCookies:
+    amount: float
+
+
+@dataclass(frozen=True, slots=True)
+class UnlockUpgradeOwned:
+    upgrade: UpgradeTypes
+
+
+@dataclass(frozen=True, slots=True)
+class UnlockAll:
+    conditions: "tuple[UnlockCondition, ...]"
+
+
+@dataclass(frozen=True, slots=True)
+class UnlockAny:
+    conditions: "tuple[UnlockCondition, ...]"
+
+
+UnlockCondition = Union[
+    UnlockFacilityCount,
+    UnlockTotalCookies,
+    UnlockUpgradeOwned,
+    UnlockAll,
+    UnlockAny,
+]
+
+
+class UpgradeConfig(NamedTuple):
     name: str
     description: str
     price: int
@@ -329,6 +367,8 @@ class UpgradeConfig(TypedDict):
     value: float
     unlock_facility: FacilityTypes
     unlock_count: int
+    # Overrides the facility-count condition built from the two fields above.
+    unlock: UnlockCondition | None = None
 
 
 class Res(Enum):
@@ -336,9 +376,13 @@ class Res(Enum):
     ERR = 2
 
 
-class Parameters(TypedDict):
+class Parameters(NamedTuple):
     facility_cost_multiplier_by_amount: float
     tick_rate: int
+    max_catch_up_ticks: int
+    command_workers: int
+    autosave_interval: float
+    journal_compact_bytes: int
 
 
 # ----------   Commands   ----------
@@ -364,6 +408,7 @@ class CommandFacility:
     target: FacilityTypes | None = None
     type: Literal["facility"] = "facility"
     amount: int = 1
+    max_amount: bool = False
 
 
 @dataclass
@@ -393,6 +438,11 @@ class CommandInspectCookiePerType:
     type: Literal["cpt"] = "cpt"
 
 
+@dataclass
+class CommandInspectLatency:
+    type: Literal["lat"] = "lat"
+
+
 @dataclass
 class CommandUserInput:
     type: Literal["input"] = "input"
@@ -407,5 +457,6 @@ Command = Union[
     CommandInspectCookieCount,
     CommandInspectCookiePerSecond,
     CommandInspectCookiePerType,
+    CommandInspectLatency,
     CommandUserInput,
 ]
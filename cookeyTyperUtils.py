@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from cookeyTyperNumber import BigNumber, Number
+
 SUFFIXES = [
     "",
     "thousand",
@@ -26,31 +28,34 @@ SUFFIXES = [
 ]
 
 
-def format_cookies(value: float | int, show_unit: bool = True) -> str:
-    if value < 0:
-        return f"-{format_cookies(-value, show_unit)}"
+def _scale_by_thousands(value: Number) -> tuple[BigNumber, int]:
+    scaled = BigNumber(value)
+    suffix_index = 0
 
-    int_value = int(value)
+    while scaled >= 1000 and suffix_index < len(SUFFIXES) - 1:
+        scaled /= 1000
+        suffix_index += 1
+
+    return scaled, suffix_index
 
-    if int_value < 1_000_000:
-        result = str(int_value)
-    else:
-        suffix_index = 0
-        scaled = float(int_value)
 
-        while scaled >= 1000 and suffix_index < len(SUFFIXES) - 1:
-            scaled /= 1000
-            suffix_index += 1
+def format_cookies(value: Number, show_unit: bool = True) -> str:
+    if value < 0:
+        return f"-{format_cookies(-value, show_unit)}"
 
+    if value < 1_000_000:
+        result = str(int(value))
+    else:
+        scaled, suffix_index = _scale_by_thousands(BigNumber(value).floor())
         result = f"{scaled:.3f} {SUFFIXES[suffix_index]}"
 
     if show_unit:
-        cookie_word = "cookie" if int_value == 1 else "cookies"
+        cookie_word = "cookie" if 1 <= value < 2 else "cookies"
         return f"{result} {cookie_word}"
     return result
 
 
-def format_cps(value: float) -> str:
+def format_cps(value: Number) -> str:
     if value < 0:
         return f"-{format_cps(-value)}"
 
@@ -59,11 +64,5 @@ def format_cps(value: float) -> str:
             return f"{int(value)} cps"
         return f"{value:.1f} cps"
 
-    suffix_index = 0
-    scaled = value
-
-    while scaled >= 1000 and suffix_index < len(SUFFIXES) - 1:
-        scaled /= 1000
-        suffix_index += 1
-
+    scaled, suffix_index = _scale_by_thousands(value)
     return f"{scaled:.3f} {SUFFIXES[suffix_index]} cps"
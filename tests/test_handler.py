@@ -0,0 +1,36 @@
+import time
+
+import pytest
+
+import cookeyTyperHandler
+from cookeyTyperCore import CookeyTyper
+from cookeyTyperScore import typing_score
+from cookeyTyperTypes import FacilityTypes
+
+
+def _slow_score(target: str, user_input: str) -> tuple[int, int]:
+    time.sleep(0.05)
+    return typing_score(target, user_input)
+
+
+def _burst(engine: CookeyTyper) -> int:
+    # The typed credit is the only way to afford the keyboard.
+    engine.handler.submit(engine.handler.target)
+    engine.handler.submit("f buy keyboard 1")
+    engine.handler.update()
+    engine.settle()
+    return engine.facilities[FacilityTypes.KEYBOARD].amount
+
+
+def test_burst_runs_in_typed_order_with_a_pool(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    inline = _burst(CookeyTyper(seed=1))
+
+    monkeypatch.setattr(cookeyTyperHandler, "typing_score", _slow_score)
+    pooled = CookeyTyper(seed=1)
+    pooled.executor.start()
+    try:
+        assert _burst(pooled) == inline == 1
+    finally:
+        pooled.executor.shutdown()
@@ -0,0 +1,99 @@
+import random
+from pathlib import Path
+
+from cookeyTyperCore import CookeyTyper
+from cookeyTyperJournal import Journal, read_entries
+from cookeyTyperSave import Autosaver, load_bytes, load_file, save_bytes
+from result import is_ok
+
+_LINES = ("hello cookie", "f b cursor 1", "cc", "u ls", "typing away", "nonsense")
+
+
+def _write(path: Path, count: int) -> list[int]:
+    """Commit count entries and return the file size after each one."""
+    journal = Journal(str(path), 1 << 20)
+    sizes: list[int] = []
+    for index in range(count):
+        journal.append(index, index * 0.05, f"target {index}", _LINES[index % 6])
+        journal.commit()
+        sizes.append(journal.size)
+    journal.close()
+    return sizes
+
+
+def test_entries_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "game.journal"
+    _write(path, 12)
+    entries = read_entries(str(path))
+    assert [entry.seq for entry in entries] == list(range(1, 13))
+    assert entries[4].tick == 4
+    assert entries[4].target == "target 4"
+    assert entries[4].raw_input == _LINES[4]
+
+
+def test_torn_tail_is_cut_off(tmp_path: Path) -> None:
+    rng = random.Random(5)
+    path = tmp_path / "game.journal"
+    for _ in range(50):
+        sizes = _write(path, 8)
+        data = path.read_bytes()
+        cut = rng.randrange(sizes[-2] + 1, sizes[-1])
+        path.write_bytes(data[:cut])
+
+        journal = Journal(str(path), 1 << 20)
+        assert [entry.seq for entry in journal.entries] == list(range(1, 8))
+        assert path.stat().st_size == sizes[-2]
+        # New entries continue the sequence after the surviving ones.
+        assert journal.append(0, 0.0, "", "cc") == 8
+        journal.close()
+        path.unlink()
+
+
+def test_corrupt_record_stops_the_scan(tmp_path: Path) -> None:
+    path = tmp_path / "game.journal"
+    sizes = _write(path, 6)
+    data = bytearray(path.read_bytes())
+    data[sizes[2] + 30] ^= 0xFF
+    path.write_bytes(bytes(data))
+    assert [entry.seq for entry in read_entries(str(path))] == [1, 2, 3]
+
+
+def test_replay_resumes_after_the_saved_entry(tmp_path: Path) -> None:
+    path = tmp_path / "game.journal"
+    live = CookeyTyper(seed=9)
+    live.journal = Journal(str(path), 1 << 20)
+    saved = b""
+    for index in range(30):
+        live.advance_to(index * 0.5)
+        live.handler.submit(_LINES[index % 6])
+        live.handler.update()
+        if index == 14:
+            saved = save_bytes(live)
+    live.journal.close()
+
+    recovered = CookeyTyper(seed=9)
+    assert is_ok(load_bytes(recovered, saved))
+    journal = Journal(str(path), 1 << 20)
+    assert journal.replay(recovered) == 15
+    journal.close()
+    assert recovered.cookies == live.cookies
+    assert recovered.journal_seq == live.journal_seq
+
+
+def test_save_includes_typing_still_on_the_pool(tmp_path: Path) -> None:
+    # journal_seq moves on at dispatch; the save must also hold the credit.
+    path = str(tmp_path / "game.sav")
+    engine = CookeyTyper(seed=2)
+    engine.executor.start()
+    saver = Autosaver(path, 3600.0)
+    try:
+        for _ in range(20):
+            engine.handler.submit("hello there friend")
+        engine.handler.update()
+        saver.save_now(engine)
+        restored = CookeyTyper(seed=2)
+        assert is_ok(load_file(restored, path))
+        assert restored.cookies == engine.cookies > 0
+    finally:
+        engine.executor.shutdown()
+        saver.close(engine)
@@ -0,0 +1,112 @@
+import operator
+import random
+from math import isclose
+from typing import Callable
+
+import pytest
+
+from cookeyTyperNumber import BigNumber
+
+type FloatOp = Callable[[float, float], float]
+type BigOp = Callable[[BigNumber, BigNumber | float], BigNumber]
+type ReflectedOp = Callable[[float, BigNumber], BigNumber]
+
+# Each operation three ways: on floats, with a BigNumber on the left, and
+# with a float on the left (the reflected method).
+_OPS: tuple[tuple[FloatOp, BigOp, ReflectedOp], ...] = (
+    (lambda a, b: a + b, lambda a, b: a + b, lambda a, b: a + b),
+    (lambda a, b: a - b, lambda a, b: a - b, lambda a, b: a - b),
+    (lambda a, b: a * b, lambda a, b: a * b, lambda a, b: a * b),
+    (lambda a, b: a / b, lambda a, b: a / b, lambda a, b: a / b),
+)
+_COMPARISONS = (operator.lt, operator.le, operator.gt, operator.ge, operator.eq)
+
+
+def _operand(rng: random.Random) -> float:
+    return rng.choice(
+        (
+            rng.uniform(-1e6, 1e6),
+            rng.uniform(-1e90, 1e90),
+            float(rng.randrange(-1000, 1000)),
+            rng.uniform(0, 1),
+        )
+    )
+
+
+def test_matches_float_below_scale() -> None:
+    rng = random.Random(20240601)
+    for _ in range(20_000):
+        a, b = _operand(rng), _operand(rng)
+        if b == 0:
+            continue
+        float_op, big_op, reflected_op = rng.choice(_OPS)
+        expected = float_op(a, b)
+        if abs(expected) >= 1e100:
+            continue
+        results = (
+            big_op(BigNumber(a), b),
+            big_op(BigNumber(a), BigNumber(b)),
+            reflected_op(a, BigNumber(b)),
+        )
+        for result in results:
+            assert result.exponent == 0
+            assert result.mantissa == expected, (a, b)
+
+
+def test_comparisons_match_float() -> None:
+    rng = random.Random(7)
+    for _ in range(5_000):
+        a, b = _operand(rng), _operand(rng)
+        for compare in _COMPARISONS:
+            assert compare(BigNumber(a), b) == compare(a, b)
+            assert compare(BigNumber(a), BigNumber(b)) == compare(a, b)
+
+
+@pytest.mark.parametrize("value", [0.0, 1.0, 123.456, -9e99, 5e99])
+def test_float_and_format_round_trip(value: float) -> None:
+    number = BigNumber(value)
+    assert float(number) == value
+    assert f"{number:.3f}" == f"{value:.3f}"
+
+
+def test_large_values_keep_ordering_and_magnitude() -> None:
+    small = BigNumber(1e99)
+    huge = BigNumber.from_log10(350.0)
+    assert huge > small
+    assert huge > 1e300
+    assert -huge < small
+    assert isclose((huge * huge).log10(), 700.0)
+    assert isclose((huge / 1e50).log10(), 300.0)
+    assert isclose((huge + huge).log10(), 350.0 + 0.30103, abs_tol=1e-4)
+    # Adding something many orders of magnitude smaller leaves it unchanged.
+    assert huge + 1.0 == huge
+
+
+def test_pow_past_float_range_does_not_raise() -> None:
+    result = BigNumber(1.15) ** 10_000
+    assert isclose(result.log10(), 10_000 * 0.0606978403536117, rel_tol=1e-9)
+    assert float(result) == float("inf")
+
+
+def test_int_conversion_is_exact_above_scale() -> None:
+    number = BigNumber(3.0, 100)
+    assert int(number) == 3 * 10**100
+    assert BigNumber(3 * 10**310) == BigNumber(3.0, 310)
+    assert int(BigNumber(1.5, 100)) == 15 * 10**99
+    assert int(BigNumber(-1.5, 100)) == -15 * 10**99
+    assert int(BigNumber(1.5e100)) == 15 * 10**99
+
+
+@pytest.mark.parametrize(
+    ("number", "spec", "expected"),
+    [
+        (BigNumber(9.99999999e150), ".3f", "1.000e151"),
+        (BigNumber(-9.99999999e150), ".3f", "-1.000e151"),
+        (BigNumber(1.23456e150), ".3f", "1.235e150"),
+        (BigNumber(9.994e150), ".2f", "9.99e150"),
+    ],
+)
+def test_format_carries_rounding_into_the_exponent(
+    number: BigNumber, spec: str, expected: str
+) -> None:
+    assert format(number, spec) == expected
@@ -0,0 +1,101 @@
+import random
+from pathlib import Path
+
+from cookeyTyperCore import CookeyTyper
+from cookeyTyperNumber import BigNumber
+from cookeyTyperSave import SAVE_SIZE, load_bytes, load_file, save_bytes, save_file
+from cookeyTyperTypes import CookieSource, FacilityTypes, UpgradeTypes
+from result import is_err, is_ok
+
+
+def _played_engine(seed: int) -> CookeyTyper:
+    """An engine with random facilities, upgrades and counters."""
+    rng = random.Random(seed)
+    engine = CookeyTyper(seed=seed)
+    for facility_type in rng.sample(list(FacilityTypes), 6):
+        engine.facilities[facility_type].amount = rng.randrange(1, 300)
+    cookies = BigNumber.from_log10(rng.uniform(5, 400))
+    engine.delta_cookie(cookies, rng.choice(list(CookieSource)))
+    engine.advance_to(rng.uniform(1, 1000))
+    for upgrade in list(engine.available_upgrades)[: rng.randrange(0, 10)]:
+        engine.upgrade_manager.purchase_upgrade(upgrade.type)
+    engine.ticks = rng.randrange(10**6)
+    engine.journal_seq = rng.randrange(10**6)
+    engine.cpt = rng.uniform(1, 50)
+    engine.stats.total_types = rng.randrange(10**5)
+    return engine
+
+
+def test_round_trip_restores_every_saved_field() -> None:
+    for seed in range(20):
+        engine = _played_engine(seed)
+        data = save_bytes(engine)
+        assert len(data) == SAVE_SIZE
+
+        restored = CookeyTyper(seed=seed)
+        assert is_ok(load_bytes(restored, data))
+        assert save_bytes(restored) == data
+        assert restored.cookies == engine.cookies
+        assert restored.update_cps() == engine.update_cps()
+        assert restored.time == engine.time
+        assert restored.ticks == engine.ticks
+        assert restored.journal_seq == engine.journal_seq
+        for upgrade_type in UpgradeTypes:
+            assert restored.is_purchased(upgrade_type) == engine.is_purchased(
+                upgrade_type
+            )
+        for facility_type in FacilityTypes:
+            assert (
+                restored.facilities[facility_type].amount
+                == engine.facilities[facility_type].amount
+            )
+
+
+def test_rejects_truncated_and_foreign_data() -> None:
+    data = save_bytes(_played_engine(1))
+    assert is_err(load_bytes(CookeyTyper(), data[:-1]))
+    assert is_err(load_bytes(CookeyTyper(), b"XXXX" + data[4:]))
+    other_version = data[:4] + (99).to_bytes(2, "little") + data[6:]
+    assert is_err(load_bytes(CookeyTyper(), other_version))
+
+
+def test_rejects_negative_amounts() -> None:
+    engine = CookeyTyper()
+    engine.facilities[FacilityTypes.KEYBOARD].amount = 123456789
+    data = save_bytes(engine)
+    at = data.index((123456789).to_bytes(8, "little"))
+    negative = data[:at] + (-1).to_bytes(8, "little", signed=True) + data[at + 8 :]
+    restored = CookeyTyper()
+    assert is_err(load_bytes(restored, negative))
+    assert restored.facilities[FacilityTypes.KEYBOARD].amount == 0
+
+
+def test_amounts_load_by_facility_index() -> None:
+    engine = _played_engine(4)
+    restored = CookeyTyper()
+    # Row order comes from Facility.index, not from iteration order.
+    restored.facilities = dict(reversed(restored.facilities.items()))
+    assert is_ok(load_bytes(restored, save_bytes(engine)))
+    for facility_type, facility in engine.facilities.items():
+        assert restored.facilities[facility_type].amount == facility.amount
+
+
+def test_file_round_trip(tmp_path: Path) -> None:
+    path = str(tmp_path / "game.sav")
+    missing = load_file(CookeyTyper(), path)
+    assert is_err(missing) and missing.error == "No save file"
+
+    engine = _played_engine(3)
+    save_file(engine, path)
+    assert not (tmp_path / "game.sav.tmp").exists()
+    restored = CookeyTyper()
+    assert is_ok(load_file(restored, path))
+    assert save_bytes(restored) == save_bytes(engine)
+
+
+def test_engines_share_upgrade_records_not_purchases() -> None:
+    engine = _played_engine(5)
+    fresh = CookeyTyper()
+    assert fresh.upgrades is engine.upgrades
+    assert engine.purchased and not fresh.purchased
+    assert not any(fresh.is_purchased(upgrade_type) for upgrade_type in UpgradeTypes)
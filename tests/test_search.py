@@ -0,0 +1,78 @@
+import random
+
+from cookeyTyperData import upgrades
+from cookeyTyperModels import normalize_name, suggest_facility, suggest_upgrade
+from cookeyTyperSearch import FuzzyIndex, osa_distance
+from cookeyTyperTypes import FacilityTypes
+
+
+def _full_osa(a: str, b: str) -> int:
+    rows = [
+        [i + j if i * j == 0 else 0 for j in range(len(b) + 1)]
+        for i in range(len(a) + 1)
+    ]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            rows[i][j] = min(
+                rows[i - 1][j] + 1, rows[i][j - 1] + 1, rows[i - 1][j - 1] + cost
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                rows[i][j] = min(rows[i][j], rows[i - 2][j - 2] + 1)
+    return rows[-1][-1]
+
+
+def _typo(rng: random.Random, word: str) -> str:
+    chars = list(word)
+    for _ in range(rng.randrange(0, 4)):
+        i = rng.randrange(len(chars))
+        match rng.randrange(4):
+            case 0:
+                chars[i] = rng.choice("abcdefghij_")
+            case 1 if len(chars) > 1:
+                del chars[i]
+            case 2 if i + 1 < len(chars):
+                chars[i], chars[i + 1] = chars[i + 1], chars[i]
+            case _:
+                chars.insert(i, rng.choice("abcdefghij_"))
+    return "".join(chars)
+
+
+def test_osa_distance_matches_full_table() -> None:
+    rng = random.Random(3)
+    for _ in range(2_000):
+        size = rng.randrange(1, 9)
+        a = _typo(rng, "".join(rng.choice("abc_") for _ in range(size)))
+        b = _typo(rng, a)
+        exact = _full_osa(a, b)
+        for bound in (0, 1, 2, 3):
+            assert osa_distance(a, b, bound) == min(exact, bound + 1), (a, b, bound)
+
+
+def test_nearest_matches_brute_force() -> None:
+    rng = random.Random(11)
+    names = {normalize_name(config.name) for config in upgrades().values()}
+    fuzzy: FuzzyIndex[str] = FuzzyIndex()
+    for name in names:
+        fuzzy.insert(name, name)
+    for _ in range(150):
+        word = _typo(rng, rng.choice(sorted(names)))
+        distances = sorted(
+            (_full_osa(word, name), name)
+            for name in names
+            if abs(len(name) - len(word)) <= 2
+        )
+        for max_distance in (1, 2):
+            ranked = [pair for pair in distances if pair[0] <= max_distance]
+            match = fuzzy.nearest(word, max_distance)
+            if not ranked:
+                assert match is None, word
+            else:
+                assert match is not None and match[:2] == ranked[0], word
+
+
+def test_suggestions() -> None:
+    assert suggest_facility("grandmaa") == FacilityTypes.GRANDMA
+    assert suggest_facility("xyz") is None
+    name = next(iter(upgrades().values())).name
+    assert suggest_upgrade(name[:-1] + "q") == next(iter(upgrades()))
@@ -0,0 +1,44 @@
+import re
+
+from cookeyTyperServer import Session
+from cookeyTyperShard import ShardSupervisor
+
+
+def _target(output: str) -> str:
+    return output.split("Target:\n")[-1].splitlines()[0]
+
+
+def _typed_correctly(output: str) -> int:
+    match = re.search(r"You typed (\d+) characters correctly", output)
+    assert match is not None, output
+    return int(match.group(1))
+
+
+def test_moved_session_keeps_its_target_and_rng() -> None:
+    # The same session in process, hibernated and woken where it moves.
+    local = Session(7, 0.0)
+    expected = [_target(local.welcome())]
+    for _ in range(3):
+        local = Session.wake(local.hibernate())
+        expected.append(_target(local.handle(expected[-1], 1.0)))
+
+    supervisor = ShardSupervisor(2)
+    try:
+        shown = [_target(supervisor.open(7))]
+        for _ in range(3):
+            assert supervisor.move(7, 1 - supervisor.worker_of(7))
+            output = supervisor.send(7, shown[-1])
+            assert _typed_correctly(output) == len(shown[-1])
+            shown.append(_target(output))
+    finally:
+        supervisor.shutdown()
+    assert shown == expected
+
+
+def test_hibernate_and_wake_keep_last_input() -> None:
+    session = Session(3, 10.0)
+    session.handle(session.engine.handler.target, 25.0)
+    woken = Session.wake(session.hibernate())
+    assert woken.last_input == 25.0
+    assert woken.started == 10.0
+    assert woken.engine.handler.target == session.engine.handler.target